@@ -40,7 +40,8 @@ setup(
     include_package_data=True,
     python_requires=">=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*",
     install_requires=["requests[security,socks]", "six", "xmltodict"],
-    tests_require=[],
+    extras_require={"async": ["aiohttp"], "columnar": ["numpy"]},
+    tests_require=["pytest", "numpy", "aiohttp"],
     license=about["__license__"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
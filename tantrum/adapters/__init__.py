@@ -11,10 +11,13 @@ import six
 import warnings
 import xmltodict
 
+from xml.sax.saxutils import escape
+
 from . import exceptions
 from .. import api_models
 from .. import results
 from .. import utils
+from ..results import exceptions as results_exceptions
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -127,6 +130,48 @@ class Adapter(object):
         """
         raise NotImplementedError  # pragma: no cover
 
+    @abc.abstractmethod
+    def cmd_get_many(self, objs, **kwargs):
+        """Send API requests to get many objects, many objects per request.
+
+        Args:
+            objs (:obj:`list` of :obj:`tantrum.api_models.ApiItem`):
+                API Objects to use for requests.
+
+        Returns:
+            :obj:`list` of :obj:`ManyResult`
+
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    @abc.abstractmethod
+    def cmd_delete_many(self, objs, **kwargs):
+        """Send API requests to delete many objects, many objects per request.
+
+        Args:
+            objs (:obj:`list` of :obj:`tantrum.api_models.ApiItem`):
+                API Objects to use for requests.
+
+        Returns:
+            :obj:`list` of :obj:`ManyResult`
+
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    @abc.abstractmethod
+    def cmd_update_many(self, objs, **kwargs):
+        """Send API requests to update many objects, many objects per request.
+
+        Args:
+            objs (:obj:`list` of :obj:`tantrum.api_models.ApiItem`):
+                API Objects to use for requests.
+
+        Returns:
+            :obj:`list` of :obj:`ManyResult`
+
+        """
+        raise NotImplementedError  # pragma: no cover
+
     @abc.abstractmethod
     def cmd_get_audit_logs(self, type, target, **kwargs):
         """Send an API request to get audit logs for an object.
@@ -250,7 +295,9 @@ class Soap(Adapter):
     ]
     """:obj:`list` of :obj:`str`: Valid types for :meth:`api_get_audit_logs`."""
 
-    def __init__(self, api_client, api_objects, lvl="info"):
+    def __init__(
+        self, api_client, api_objects, lvl="info", serializer=None, result_retain="all"
+    ):
         """Constructor.
 
         Args:
@@ -262,11 +309,29 @@ class Soap(Adapter):
                 Logging level.
 
                 Defaults to: "info".
+            serializer (:obj:`TemplateSerializer`, optional):
+                Serializer to use for request bodies.
+                If None, requests are built with :meth:`build_request_dict` and
+                :func:`serialize_xml`.
+
+                Defaults to: None.
+            result_retain (:obj:`str`, optional):
+                What results keep once they have been deserialized into an
+                ApiModel, one of :attr:`tantrum.results.Soap.RETAIN`, see
+                :meth:`tantrum.results.Soap.release`.
+
+                Defaults to: "all".
 
         """
         self.log = utils.logs.get_obj_log(obj=self, lvl=lvl)
         """:obj:`logging.Logger`: Log."""
 
+        self.serializer = serializer
+        """:obj:`TemplateSerializer`: Serializer to use for request bodies."""
+
+        self.result_retain = result_retain
+        """:obj:`str`: What results keep once they have been deserialized."""
+
         self._api_objects = api_objects
         self._api_client = api_client
 
@@ -480,6 +545,140 @@ class Soap(Adapter):
         Returns:
             :obj:`tantrum.results.Result`
 
+        """
+        metrics = utils.metrics.REGISTRY
+        stage = "stage_seconds"
+        labels = {"command": cmd, "cause": cause}
+
+        with metrics.timer(name=stage, labels=dict(labels, stage="serialize")):
+            request_body, request_dict = self.serialize_request(
+                obj=obj,
+                cmd=cmd,
+                ser_only_attrs=ser_only_attrs,
+                ser_exclude_attrs=ser_exclude_attrs,
+                ser_empty=ser_empty,
+                ser_list_attrs=ser_list_attrs,
+                ser_wrap_name=ser_wrap_name,
+                ser_wrap_item_attr=ser_wrap_item_attr,
+                **kwargs
+            )
+
+        with metrics.timer(name=stage, labels=dict(labels, stage="network")):
+            r = self.api_client(
+                data=request_body,
+                verify=verify,
+                log_request=log_request,
+                log_response=log_response,
+                save_last=save_last,
+                save_history=save_history,
+                cause=cause,
+            )
+        return self.handle_response(
+            response=r,
+            body_re_limit=body_re_limit,
+            request_dict=request_dict,
+            command=cmd,
+        )
+
+    def build_request(self, obj, cmd, **kwargs):
+        """Serialize an object, command, and options into a SOAP request body.
+
+        Args:
+            obj (:obj:`tantrum.api_models.ApiModel`):
+                ApiModel to serialize and send as part of request.
+            cmd (:obj:`str`):
+                SOAP Command to use in request.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`serialize_request`.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.serialize_request(obj=obj, cmd=cmd, **kwargs)[0]
+
+    def serialize_request(self, obj, cmd, **kwargs):
+        """Serialize an object, command, and options with :attr:`serializer`.
+
+        Args:
+            obj (:obj:`tantrum.api_models.ApiModel`):
+                ApiModel to serialize and send as part of request.
+            cmd (:obj:`str`):
+                SOAP Command to use in request.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`build_request_dict` or :attr:`serializer`.
+
+        Returns:
+            :obj:`tuple` of (:obj:`str`, :obj:`dict`): The request body and the
+            SOAP envelope dict it was serialized from, which is None if
+            :attr:`serializer` is used.
+
+        """
+        if self.serializer is not None:
+            return self.serializer(adapter=self, obj=obj, cmd=cmd, **kwargs), None
+        request_dict = self.build_request_dict(obj=obj, cmd=cmd, **kwargs)
+        return serialize_xml(obj=request_dict), request_dict
+
+    def build_request_dict(
+        self,
+        obj,
+        cmd,
+        ser_only_attrs=None,
+        ser_exclude_attrs=None,
+        ser_empty=None,
+        ser_list_attrs=None,
+        ser_wrap_name=None,
+        ser_wrap_item_attr=None,
+        **kwargs
+    ):
+        """Serialize an object, command, and options into a SOAP envelope dict.
+
+        Args:
+            obj (:obj:`tantrum.api_models.ApiModel`):
+                ApiModel to serialize and send as part of request.
+            cmd (:obj:`str`):
+                SOAP Command to use in request.
+            ser_empty (:obj:`bool`):
+                Include attributes that have a value of None when serializing.
+                Uses False if None.
+
+                Defaults to: None.
+            ser_list_attrs (:obj:`bool`):
+                Include simple attributes of :obj:`tantrum.api_models.ApiList`
+                when serializing.
+                Uses False if None.
+
+                Defaults to: None.
+            ser_exclude_attrs (:obj:`list` of :obj:`str`):
+                Exclude these attributes when serializing.
+                Uses [] if None.
+
+                Defaults to: None.
+            ser_only_attrs (:obj:`list` of :obj:`str`):
+                Include only these attributes when serializing.
+                Uses [] if None.
+
+                Defaults to: None.
+            ser_wrap_name (:obj:`bool`):
+                Wrap the return in another dict whose key is set to the API name.
+                Uses True if None.
+
+                Defaults to: None.
+            ser_wrap_item_attr (:obj:`bool`):
+                Wrap list items in dict whose key is set to the API list
+                item attribute.
+                Uses True if None.
+
+                Defaults to: None.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`build_options_from_kwargs`.
+
+        Returns:
+            :obj:`dict`
+
         """
         ser_only_attrs = utils.tools.def_none(ser_only_attrs, [])
         ser_exclude_attrs = utils.tools.def_none(ser_exclude_attrs, [])
@@ -499,27 +698,50 @@ class Soap(Adapter):
             )
 
         opts = self.build_options_from_kwargs(**kwargs)
+        return soap_envelope(cmd=cmd, obj=obj, opts=opts)
 
-        request_dict = soap_envelope(cmd=cmd, obj=obj, opts=opts)
-        request_body = serialize_xml(obj=request_dict)
-
-        r = self.api_client(
-            data=request_body,
-            verify=verify,
-            log_request=log_request,
-            log_response=log_response,
-            save_last=save_last,
-            save_history=save_history,
-            cause=cause,
-        )
+    def handle_response(
+        self, response, body_re_limit=4000, request_dict=None, command=None
+    ):
+        """Update the auth token from a SOAP response and deserialize it.
+
+        Args:
+            response (:obj:`requests.Response`):
+                Response received from the SOAP API.
+            body_re_limit (:obj:`int`, optional):
+                Value to limit regex search of response body for <session> tag.
+
+                Defaults to: 4000.
+            request_dict (:obj:`dict`, optional):
+                SOAP envelope dict from :meth:`build_request_dict` that the request
+                body was serialized from. If supplied, the command and request
+                objects are passed to the result so it does not have to
+                deserialize the request body to get them.
+
+                Defaults to: None.
+            command (:obj:`str`, optional):
+                Command that was used in the request. If supplied and request_dict
+                is not, the command is passed to the result.
 
+                Defaults to: None.
+
+        Raises:
+            :obj:`exceptions.SessionNotFoundWarning`:
+                If the <session> tag can not be found in the response body.
+
+        Returns:
+            :obj:`tantrum.results.Result`
+
+        """
         try:
-            auth_token = re_soap_tag(text=r.text, tag="session", limit=body_re_limit)
+            auth_token = re_soap_tag(
+                text=response.content, tag="session", limit=body_re_limit
+            )
         except Exception:
             auth_token = ""
 
         if auth_token:
-            self.api_client.auth_method.token = auth_token
+            self.api_client.auth_method.in_band_refresh(token=auth_token)
         else:
             if body_re_limit:
                 limit = "the first {}".format(body_re_limit)
@@ -528,10 +750,40 @@ class Soap(Adapter):
             error = "XML tag 'session' not in {limit} characters of SOAP response body"
             error = error.format(limit=limit)
             warnings.warn(error, exceptions.SessionNotFoundWarning)
-        return self.result_cls.from_response(
-            api_objects=self.api_objects, response=r, lvl=self.log.level
+
+        result_args = {}
+        result_args["api_objects"] = self.api_objects
+        result_args["response"] = response
+        result_args["lvl"] = self.log.level
+        result_args["retain"] = self.result_retain
+
+        if request_dict is not None:
+            path = "soap:Envelope/soap:Body/t:tanium_soap_request"
+            request = utils.tools.get_dict_path(obj=request_dict, path=path)
+            result_args["command"] = request["command"]
+            result_args["request_object"] = request["object_list"]
+        elif command is not None:
+            result_args["command"] = command
+
+        metrics = utils.metrics.REGISTRY
+        labels = {
+            "command": result_args.get("command", ""),
+            "cause": getattr(response, "cause", ""),
+        }
+        metrics.incr(
+            name="requests_total", labels=dict(labels, status=response.status_code)
+        )
+        metrics.observe(
+            name="request_bytes",
+            value=len(response.request.body or b""),
+            labels=labels,
+        )
+        metrics.observe(
+            name="response_bytes", value=len(response.content or b""), labels=labels
         )
 
+        return self.result_cls.from_response(**result_args)
+
     def cmd_get(self, obj, **kwargs):
         """Send an API request to get an object.
 
@@ -609,6 +861,165 @@ class Soap(Adapter):
         kwargs["cmd"] = "UpdateObject"
         return self.send(obj=obj, **kwargs)
 
+    def cmd_get_many(self, objs, chunk_size=100, workers=0, **kwargs):
+        """Send API requests to get many objects, many objects per request.
+
+        Args:
+            objs (:obj:`list` of :obj:`tantrum.api_models.ApiItem`):
+                API Objects to use for requests.
+            chunk_size (:obj:`int`, optional):
+                Number of objects to send in each request.
+
+                Defaults to: 100.
+            workers (:obj:`int`, optional):
+                Send up to N requests at once.
+
+                Defaults to: 0.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`send`.
+
+        Notes:
+            See :meth:`send_objects`.
+
+        Returns:
+            :obj:`list` of :obj:`ManyResult`: In the same order as objs.
+
+        """
+        for obj in objs:
+            check_object_type(obj=obj, types=(self.api_objects.ApiItem,))
+            check_object_attrs(obj=obj, attrs=["id", "name"])
+        kwargs["cmd"] = "GetObject"
+        return self.send_objects(
+            objs=objs, chunk_size=chunk_size, workers=workers, **kwargs
+        )
+
+    def cmd_delete_many(self, objs, chunk_size=100, workers=0, **kwargs):
+        """Send API requests to delete many objects, many objects per request.
+
+        Args:
+            objs (:obj:`list` of :obj:`tantrum.api_models.ApiItem`):
+                API Objects to use for requests.
+            chunk_size (:obj:`int`, optional):
+                Number of objects to send in each request.
+
+                Defaults to: 100.
+            workers (:obj:`int`, optional):
+                Send up to N requests at once.
+
+                Defaults to: 0.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`send`.
+
+        Notes:
+            See :meth:`send_objects`.
+
+        Returns:
+            :obj:`list` of :obj:`ManyResult`: In the same order as objs.
+
+        """
+        for obj in objs:
+            check_object_type(obj=obj, types=(self.api_objects.ApiItem,))
+            check_object_attrs(obj=obj, attrs=["id", "name"])
+        kwargs["cmd"] = "DeleteObject"
+        return self.send_objects(
+            objs=objs, chunk_size=chunk_size, workers=workers, **kwargs
+        )
+
+    def cmd_update_many(self, objs, chunk_size=100, workers=0, **kwargs):
+        """Send API requests to update many objects, many objects per request.
+
+        Args:
+            objs (:obj:`list` of :obj:`tantrum.api_models.ApiItem`):
+                API Objects to use for requests.
+            chunk_size (:obj:`int`, optional):
+                Number of objects to send in each request.
+
+                Defaults to: 100.
+            workers (:obj:`int`, optional):
+                Send up to N requests at once.
+
+                Defaults to: 0.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`send`.
+
+        Notes:
+            See :meth:`send_objects`.
+
+        Returns:
+            :obj:`list` of :obj:`ManyResult`: In the same order as objs.
+
+        """
+        for obj in objs:
+            check_object_type(obj=obj, types=(self.api_objects.ApiItem,))
+            check_object_attrs(obj=obj, attrs=["id", "name"])
+        kwargs["cmd"] = "UpdateObject"
+        return self.send_objects(
+            objs=objs, chunk_size=chunk_size, workers=workers, **kwargs
+        )
+
+    def send_objects(self, objs, cmd, chunk_size=100, workers=0, **kwargs):
+        """Send many objects in requests that each carry a list of objects.
+
+        Args:
+            objs (:obj:`list` of :obj:`tantrum.api_models.ApiItem`):
+                API Objects to send.
+            cmd (:obj:`str`):
+                SOAP Command to use in requests.
+            chunk_size (:obj:`int`, optional):
+                Number of objects to send in each request.
+                If 0, send all objects of the same type in one request.
+
+                Defaults to: 100.
+            workers (:obj:`int`, optional):
+                Send up to N requests at once using
+                :func:`tantrum.utils.tools.iter_threaded`.
+                If 0, send one request at a time.
+
+                Defaults to: 0.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`send`.
+
+        Notes:
+            Objects are grouped by type and sent in the API list object of their
+            type, i.e. 100 Sensor objects are sent in one SensorList. The objects
+            in each response are matched back to the objects that were sent by
+            id, or by name if the object sent has no id.
+
+            If the server rejects a request because of one of the objects, i.e.
+            one of the objects does not exist, the objects in that request are
+            split in half and sent again until each rejected object has been sent
+            on its own, so that errors are only reported for the objects that
+            caused them. Any other error, i.e. insufficient privileges, is thrown
+            on the first request that gets it, see :data:`MANY_RETRY_ERRORS`.
+
+        Returns:
+            :obj:`list` of :obj:`ManyResult`: In the same order as objs.
+
+        """
+        items = [ManyResult(obj=obj, index=idx) for idx, obj in enumerate(objs)]
+        chunks = chunk_many(items=items, size=chunk_size)
+        requests = 0
+
+        while chunks:
+            calls = [dict(kwargs, obj=many_list(items=x), cmd=cmd) for x in chunks]
+            requests += len(calls)
+
+            if workers:
+                sends = utils.tools.iter_threaded(
+                    func=self.send, calls=calls, workers=workers
+                )
+            else:
+                sends = (self.send(**call) for call in calls)
+
+            chunks = map_many(chunks=chunks, rets=list(sends))
+
+        self.log.info(many_summary(items=items, cmd=cmd, requests=requests))
+        return items
+
     def cmd_get_audit_logs(self, type, target, **kwargs):
         """Send an API request to get audit logs for an object.
 
@@ -803,6 +1214,677 @@ class Soap(Adapter):
         return self.send(obj=objs, **kwargs)
 
 
+class TemplateSerializer(object):
+    """Serialize SOAP requests by writing XML from API objects into a string."""
+
+    MARKS = ["\ue000{}\ue000".format(x) for x in ["cmd", "obj", "opts"]]
+    """:obj:`list` of :obj:`str`: Placeholders used to split the envelope."""
+
+    NAME_RE = re.compile(r"^[^\s<>/&'\"=!?@#]+$")
+    """:obj:`re.Pattern`: Element names that can be written without validation."""
+
+    def __init__(self, options_cache_size=256):
+        """Constructor.
+
+        Args:
+            options_cache_size (:obj:`int`, optional):
+                Cache the serialized options of up to N different option sets.
+
+                Defaults to: 256.
+
+        Notes:
+            The output is the same as :func:`serialize_xml` with pretty=False, i.e.
+            without the indentation whitespace.
+
+        """
+        self.options_cache_size = options_cache_size
+        """:obj:`int`: Maximum number of option sets in :attr:`options_cache`."""
+        self.options_cache = {}
+        """:obj:`dict`: Map of option sets to their serialized XML."""
+        self.fallbacks = 0
+        """:obj:`int`: Number of requests sent to :func:`serialize_xml` instead."""
+        self._envelope = None
+        self._classes = {}
+        self._tags = {}
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = [
+            "options_cached={!r}".format(len(self.options_cache)),
+            "classes_cached={!r}".format(len(self._classes)),
+            "fallbacks={!r}".format(self.fallbacks),
+        ]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    def __call__(
+        self,
+        adapter,
+        obj,
+        cmd,
+        ser_only_attrs=None,
+        ser_exclude_attrs=None,
+        ser_empty=None,
+        ser_list_attrs=None,
+        ser_wrap_name=None,
+        ser_wrap_item_attr=None,
+        **kwargs
+    ):
+        """Serialize an object, command, and options into a SOAP request body.
+
+        Args:
+            adapter (:obj:`Soap`):
+                Adapter to build options with, see
+                :meth:`Soap.build_options_from_kwargs`.
+            obj (:obj:`tantrum.api_models.ApiModel`):
+                ApiModel to serialize and send as part of request.
+            cmd (:obj:`str`):
+                SOAP Command to use in request.
+            ser_*:
+                See :meth:`Soap.build_request_dict`.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`Soap.build_options_from_kwargs`.
+
+        Notes:
+            Objects that can not be written directly, i.e. dicts with XML
+            attributes, are serialized with :meth:`Soap.build_request_dict` and
+            :func:`serialize_xml` instead.
+
+        Returns:
+            :obj:`str`
+
+        """
+        coerce_list = api_models.ApiModel.api_coerce_list
+        sargs = {
+            "only_attrs": coerce_list(value=ser_only_attrs),
+            "exclude_attrs": coerce_list(value=ser_exclude_attrs),
+            "empty": utils.tools.def_none(ser_empty, False),
+            "list_attrs": utils.tools.def_none(ser_list_attrs, False),
+            "wrap_item_attr": utils.tools.def_none(ser_wrap_item_attr, True),
+        }
+        wrap_name = utils.tools.def_none(ser_wrap_name, True)
+        head, after_cmd, after_obj, tail = self.envelope
+
+        out = [head, escape(cmd), after_cmd]
+        try:
+            self.write_object(obj=obj, out=out, wrap_name=wrap_name, sargs=sargs)
+        except exceptions.SerializerFallback:
+            self.fallbacks += 1
+            request_dict = adapter.build_request_dict(
+                obj=obj,
+                cmd=cmd,
+                ser_only_attrs=ser_only_attrs,
+                ser_exclude_attrs=ser_exclude_attrs,
+                ser_empty=ser_empty,
+                ser_list_attrs=ser_list_attrs,
+                ser_wrap_name=ser_wrap_name,
+                ser_wrap_item_attr=ser_wrap_item_attr,
+                **kwargs
+            )
+            return serialize_xml(obj=request_dict, pretty=False)
+        out += [after_obj, self.get_options(adapter=adapter, kwargs=kwargs), tail]
+        return "".join(out)
+
+    @property
+    def envelope(self):
+        """Get the SOAP envelope split around the command, object, and options.
+
+        Returns:
+            :obj:`tuple` of :obj:`str`
+
+        """
+        if self._envelope is None:
+            cmd, obj, opts = self.MARKS
+            env = soap_envelope(cmd=cmd, obj=obj, opts=opts)
+            text = serialize_xml(obj=env, pretty=False)
+            head, text = text.split(cmd)
+            after_cmd, text = text.split(obj)
+            after_obj, tail = text.split(opts)
+            self._envelope = (head, after_cmd, after_obj, tail)
+        return self._envelope
+
+    def get_options(self, adapter, kwargs):
+        """Get the serialized options for kwargs from :attr:`options_cache`.
+
+        Args:
+            adapter (:obj:`Soap`):
+                Adapter to build options with.
+            kwargs (:obj:`dict`):
+                Passed to :meth:`Soap.build_options_from_kwargs`.
+
+        Returns:
+            :obj:`str`
+
+        """
+        try:
+            defaults = getattr(adapter, "DEFAULT_OPTIONS", {}) or {}
+            key = (
+                adapter.api_objects.Options,
+                tuple(sorted(defaults.items())),
+                tuple(sorted(kwargs.items())),
+            )
+            hash(key)
+        except TypeError:
+            key = None
+
+        if key is not None and key in self.options_cache:
+            return self.options_cache[key]
+
+        opts = adapter.build_options_from_kwargs(**dict(kwargs))
+        out = []
+        self.write_children(value=opts, out=out)
+        text = "".join(out)
+
+        if key is not None and "options_obj" not in kwargs:
+            if len(self.options_cache) >= self.options_cache_size:
+                self.options_cache.clear()
+            self.options_cache[key] = text
+        return text
+
+    def get_tags(self, name):
+        """Get the open and close tags of an element.
+
+        Args:
+            name (:obj:`str`):
+                Name of element.
+
+        Raises:
+            :exc:`exceptions.SerializerFallback`:
+                If name is not a plain element name.
+
+        Returns:
+            :obj:`tuple` of (:obj:`str`, :obj:`str`)
+
+        """
+        tags = self._tags.get(name)
+        if tags is None:
+            if not isinstance(name, six.string_types) or not self.NAME_RE.match(name):
+                raise exceptions.SerializerFallback(name)
+            tags = ("<{}>".format(name), "</{}>".format(name))
+            self._tags[name] = tags
+        return tags
+
+    def get_class_tags(self, cls):
+        """Get the attributes and their tags of an API model class.
+
+        Args:
+            cls (:class:`tantrum.api_models.ApiModel`):
+                Class to get attributes of.
+
+        Returns:
+            :obj:`tuple` of (:obj:`str`, :obj:`str`, :obj:`str`)
+
+        """
+        meta = cls.api_meta()
+        cached = self._classes.get(cls)
+        if cached is None or cached[0] is not meta:
+            attrs = tuple((a,) + self.get_tags(name=a) for a in meta.attrs)
+            cached = (meta, attrs)
+            self._classes[cls] = cached
+        return cached[1]
+
+    def write_object(self, obj, out, wrap_name, sargs):
+        """Write the contents of the "object_list" element of a request.
+
+        Args:
+            obj (:obj:`object`):
+                Object to write.
+            out (:obj:`list` of :obj:`str`):
+                String builder to write to.
+            wrap_name (:obj:`bool`):
+                Wrap obj in an element named :attr:`ApiModel.API_NAME`.
+            sargs (:obj:`dict`):
+                Serialize arguments, see :meth:`ApiModel.serialize`.
+
+        """
+        if isinstance(obj, api_models.ApiItem):
+            if wrap_name:
+                self.write_model(value=obj, name=obj.API_NAME, out=out, sargs=sargs)
+            else:
+                self.write_item_children(value=obj, out=out, sargs=sargs)
+        elif isinstance(obj, api_models.ApiList) and sargs["wrap_item_attr"]:
+            if wrap_name:
+                self.write_list_simples(value=obj, out=out, sargs=sargs)
+                open_tag, close_tag = self.get_tags(name=obj.API_NAME)
+                out.append(open_tag)
+                self.write_list_items(value=obj, out=out, sargs=sargs)
+                out.append(close_tag)
+            else:
+                self.write_list_children(value=obj, out=out, sargs=sargs)
+        elif isinstance(obj, api_models.ApiModel):
+            raise exceptions.SerializerFallback(obj)
+        elif isinstance(obj, dict):
+            self.write_children(value=obj, out=out)
+        elif obj is not None:
+            if isinstance(obj, (list, tuple)):
+                raise exceptions.SerializerFallback(obj)
+            out.append(escape(to_text(obj)))
+
+    def write_model(self, value, name, out, sargs):
+        """Write an API object the same way as the output of its serialize method.
+
+        Args:
+            value (:obj:`tantrum.api_models.ApiModel`):
+                Object to write.
+            name (:obj:`str`):
+                Name of element to write value in.
+            out (:obj:`list` of :obj:`str`):
+                String builder to write to.
+            sargs (:obj:`dict`):
+                Serialize arguments, see :meth:`ApiModel.serialize`.
+
+        """
+        open_tag, close_tag = self.get_tags(name=name)
+        if isinstance(value, api_models.ApiItem):
+            out.append(open_tag)
+            self.write_item_children(value=value, out=out, sargs=sargs)
+            out.append(close_tag)
+        elif sargs["wrap_item_attr"]:
+            out.append(open_tag)
+            self.write_list_children(value=value, out=out, sargs=sargs)
+            out.append(close_tag)
+        else:
+            for item in value:
+                if isinstance(item, api_models.ApiList):
+                    raise exceptions.SerializerFallback(item)
+                self.write_one(name=name, value=item, out=out, sargs=sargs)
+
+    def write_item_children(self, value, out, sargs):
+        """Write the attributes of an :obj:`tantrum.api_models.ApiItem`.
+
+        Args:
+            value (:obj:`tantrum.api_models.ApiItem`):
+                Object to write the attributes of.
+            out (:obj:`list` of :obj:`str`):
+                String builder to write to.
+            sargs (:obj:`dict`):
+                Serialize arguments, see :meth:`ApiModel.serialize`.
+
+        """
+        exclude_attrs = sargs["exclude_attrs"]
+        only_attrs = sargs["only_attrs"]
+        for attr, open_tag, close_tag in self.get_class_tags(cls=type(value)):
+            if attr in exclude_attrs or (only_attrs and attr not in only_attrs):
+                continue
+            attr_value = getattr(value, attr, None)
+            if attr_value is None:
+                if sargs["empty"]:
+                    out += [open_tag, close_tag]
+            elif isinstance(attr_value, api_models.ApiModel):
+                self.write_model(value=attr_value, name=attr, out=out, sargs=sargs)
+            elif isinstance(attr_value, (six.string_types, bool) + six.integer_types):
+                out += [open_tag, escape(to_text(attr_value)), close_tag]
+            else:
+                self.write_value(name=attr, value=attr_value, out=out, sargs=sargs)
+
+    def write_list_simples(self, value, out, sargs):
+        """Write the simple attributes of an :obj:`tantrum.api_models.ApiList`.
+
+        Args:
+            value (:obj:`tantrum.api_models.ApiList`):
+                Object to write the attributes of.
+            out (:obj:`list` of :obj:`str`):
+                String builder to write to.
+            sargs (:obj:`dict`):
+                Serialize arguments, see :meth:`ApiModel.serialize`.
+
+        Notes:
+            Only written if list_attrs is True in sargs.
+
+        """
+        if sargs["list_attrs"]:
+            self.write_item_children(value=value, out=out, sargs=sargs)
+
+    def write_list_children(self, value, out, sargs):
+        """Write the simple attributes and items of an ApiList with item elements.
+
+        Args:
+            value (:obj:`tantrum.api_models.ApiList`):
+                Object to write.
+            out (:obj:`list` of :obj:`str`):
+                String builder to write to.
+            sargs (:obj:`dict`):
+                Serialize arguments, see :meth:`ApiModel.serialize`.
+
+        """
+        self.write_list_simples(value=value, out=out, sargs=sargs)
+        self.write_list_items(value=value, out=out, sargs=sargs)
+
+    def write_list_items(self, value, out, sargs):
+        """Write the items of an ApiList in elements named API_ITEM_ATTR.
+
+        Args:
+            value (:obj:`tantrum.api_models.ApiList`):
+                Object to write the items of.
+            out (:obj:`list` of :obj:`str`):
+                String builder to write to.
+            sargs (:obj:`dict`):
+                Serialize arguments, see :meth:`ApiModel.serialize`.
+
+        """
+        for item in value:
+            self.write_one(name=value.API_ITEM_ATTR, value=item, out=out, sargs=sargs)
+
+    def write_value(self, name, value, out, sargs=None):
+        """Write a value the same way as xmltodict.unparse.
+
+        Args:
+            name (:obj:`str`):
+                Name of element to write value in.
+            value (:obj:`object`):
+                Value to write. Iterables other than str and dict are written as
+                one element for each item.
+            out (:obj:`list` of :obj:`str`):
+                String builder to write to.
+            sargs (:obj:`dict`, optional):
+                Serialize arguments for API objects in value.
+
+                Defaults to: None.
+
+        """
+        is_iter = hasattr(value, "__iter__") and not isinstance(
+            value, (six.string_types, six.binary_type, dict, api_models.ApiModel)
+        )
+        if is_iter:
+            for item in value:
+                self.write_one(name=name, value=item, out=out, sargs=sargs)
+        else:
+            self.write_one(name=name, value=value, out=out, sargs=sargs)
+
+    def write_one(self, name, value, out, sargs=None):
+        """Write a single value in an element.
+
+        Args:
+            name (:obj:`str`):
+                Name of element to write value in.
+            value (:obj:`object`):
+                Value to write.
+            out (:obj:`list` of :obj:`str`):
+                String builder to write to.
+            sargs (:obj:`dict`, optional):
+                Serialize arguments for API objects in value.
+
+                Defaults to: None.
+
+        """
+        if isinstance(value, api_models.ApiModel):
+            if sargs is None:
+                raise exceptions.SerializerFallback(value)
+            self.write_model(value=value, name=name, out=out, sargs=sargs)
+            return
+
+        open_tag, close_tag = self.get_tags(name=name)
+        out.append(open_tag)
+        if isinstance(value, dict):
+            self.write_children(value=value, out=out)
+        elif value is not None:
+            out.append(escape(to_text(value)))
+        out.append(close_tag)
+
+    def write_children(self, value, out):
+        """Write the keys of a dict as child elements.
+
+        Args:
+            value (:obj:`dict`):
+                Dict to write.
+            out (:obj:`list` of :obj:`str`):
+                String builder to write to.
+
+        Raises:
+            :exc:`exceptions.SerializerFallback`:
+                If a key is an XML attribute or text key.
+
+        """
+        for key, item in value.items():
+            if isinstance(item, list) and not item:
+                continue
+            self.write_value(name=key, value=item, out=out)
+
+
+def to_text(value):
+    """Convert a simple value to text the same way as xmltodict.unparse.
+
+    Args:
+        value (:obj:`object`):
+            Value to convert.
+
+    Returns:
+        :obj:`str`
+
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, six.binary_type):
+        return value.decode("utf-8", "replace")
+    return six.text_type(value)
+
+
+class ManyResult(object):
+    """Result of one of the objects sent by :meth:`Soap.send_objects`."""
+
+    def __init__(self, obj, index):
+        """Constructor.
+
+        Args:
+            obj (:obj:`tantrum.api_models.ApiItem`):
+                API Object that was sent.
+            index (:obj:`int`):
+                Index of obj in the objects that were sent.
+
+        """
+        self.obj = obj
+        """:obj:`tantrum.api_models.ApiItem`: API Object that was sent."""
+        self.index = index
+        """:obj:`int`: Index of :attr:`obj` in the objects that were sent."""
+        self.result = None
+        """:obj:`tantrum.results.Result`: Last result that :attr:`obj` was sent in."""
+        self.value = None
+        """:obj:`tantrum.api_models.ApiItem`: Object from :attr:`result` matched to
+        :attr:`obj`."""
+        self.error = None
+        """:exc:`tantrum.results.exceptions.ResponseError`: Error if the server
+        rejected :attr:`obj`."""
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = [
+            "index={!r}".format(self.index),
+            "obj={!r}".format(self.obj),
+            "ok={!r}".format(self.ok),
+        ]
+        if self.error is not None:
+            bits.append("error={!r}".format(self.error.error))
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    @property
+    def ok(self):
+        """Get if :attr:`obj` was not rejected and was matched in :attr:`result`.
+
+        Returns:
+            :obj:`bool`
+
+        """
+        return self.error is None and self.value is not None
+
+    @property
+    def key(self):
+        """Get the attribute and value used to match :attr:`obj` to :attr:`value`.
+
+        Returns:
+            :obj:`tuple` of (:obj:`str`, :obj:`object`): id if set, otherwise name.
+
+        """
+        if getattr(self.obj, "id", None) is not None:
+            return "id", self.obj.id
+        return "name", getattr(self.obj, "name", None)
+
+
+def chunk_many(items, size):
+    """Split ManyResult objects into chunks of objects of the same type.
+
+    Args:
+        items (:obj:`list` of :obj:`ManyResult`):
+            Items to split.
+        size (:obj:`int`):
+            Maximum number of items in each chunk.
+            If 0, put all items of the same type in one chunk.
+
+    Returns:
+        :obj:`list` of :obj:`list` of :obj:`ManyResult`
+
+    """
+    by_type = {}
+    types = []
+    for item in items:
+        obj_type = type(item.obj)
+        if obj_type not in by_type:
+            by_type[obj_type] = []
+            types.append(obj_type)
+        by_type[obj_type].append(item)
+
+    chunks = []
+    for obj_type in types:
+        chunks += utils.tools.chunk_list(items=by_type[obj_type], size=size)
+    return chunks
+
+
+def many_list(items):
+    """Put the objects of a chunk of ManyResult objects into an API list object.
+
+    Args:
+        items (:obj:`list` of :obj:`ManyResult`):
+            Items with objects of the same type.
+
+    Returns:
+        :obj:`tantrum.api_models.ApiList`
+
+    """
+    return items[0].obj.API_LIST_CLS(*[x.obj for x in items])
+
+
+MANY_RETRY_ERRORS = (
+    results_exceptions.ObjectNotFoundError,
+    results_exceptions.ObjectExistsError,
+)
+""":obj:`tuple` of :exc:`tantrum.results.exceptions.ResponseError`: Errors caused
+by one of the objects sent by :meth:`Soap.send_objects`, requests rejected with
+these are split and sent again."""
+
+
+def map_many(chunks, rets):
+    """Match the objects returned in rets to the ManyResult objects sent.
+
+    Args:
+        chunks (:obj:`list` of :obj:`list` of :obj:`ManyResult`):
+            Items sent in each request.
+        rets (:obj:`list` of :obj:`tantrum.results.Result`):
+            Result of the request of each chunk.
+
+    Notes:
+        Chunks whose request was rejected by the server with one of
+        :data:`MANY_RETRY_ERRORS` are split in half and returned so they can be
+        sent again. Items that were rejected when sent on their own get the error.
+
+    Raises:
+        :exc:`tantrum.results.exceptions.ResponseError`:
+            If a request was rejected with an error that is not about one of the
+            objects sent, i.e. insufficient privileges.
+
+    Returns:
+        :obj:`list` of :obj:`list` of :obj:`ManyResult`: Chunks to send again.
+
+    """
+    retry = []
+    for chunk, result in zip(chunks, rets):
+        for item in chunk:
+            item.result = result
+
+        try:
+            values = result()
+        except MANY_RETRY_ERRORS as exc:
+            if len(chunk) == 1:
+                chunk[0].error = exc
+            else:
+                half = (len(chunk) + 1) // 2
+                retry += [chunk[:half], chunk[half:]]
+            continue
+
+        if not isinstance(values, api_models.ApiList):
+            values = [values]
+
+        matches = {}
+        for value in values:
+            for attr in ["id", "name"]:
+                matches.setdefault((attr, getattr(value, attr, None)), value)
+
+        for item in chunk:
+            item.value = matches.get(item.key, None)
+    return retry
+
+
+def many_summary(items, cmd, requests):
+    """Summarize the ManyResult objects from :meth:`Soap.send_objects`.
+
+    Args:
+        items (:obj:`list` of :obj:`ManyResult`):
+            Items that were sent.
+        cmd (:obj:`str`):
+            SOAP Command that was used in requests.
+        requests (:obj:`int`):
+            Number of requests that were sent.
+
+    Returns:
+        :obj:`str`
+
+    """
+    m = [
+        "Sent {c} objects with command {cmd!r} in {r} requests",
+        "rejected: {e}",
+        "not matched: {n}",
+    ]
+    m = ", ".join(m)
+    m = m.format(
+        c=len(items),
+        cmd=cmd,
+        r=requests,
+        e=len([x for x in items if x.error is not None]),
+        n=len([x for x in items if x.error is None and x.value is None]),
+    )
+    return m
+
+
 def soap_envelope(cmd, obj, opts=None):
     """Construct a SOAP envelope with the request command, obj, and options.
 
@@ -841,8 +1923,9 @@ def re_soap_tag(text, tag, limit=4000, pattern=r"<{t}>(.*?)</{t}>"):
     """Search for tag in text[:limit] using pattern.
 
     Args:
-        text (:obj:`str`):
-            Text to search for pattern.
+        text (:obj:`str` or :obj:`bytes`):
+            Text to search for pattern. If bytes, the pattern is encoded and the
+            match is decoded as UTF-8, so the whole text never has to be decoded.
         tag (:obj:`str`):
             Tag name to use in pattern as 't'.
         limit (:obj:`int`, optional):
@@ -866,10 +1949,15 @@ def re_soap_tag(text, tag, limit=4000, pattern=r"<{t}>(.*?)</{t}>"):
 
     """
     pattern_txt = pattern.format(t=tag)
+    is_bytes = isinstance(text, six.binary_type)
+    if is_bytes:
+        pattern_txt = pattern_txt.encode("utf-8")
     pattern_re = re.compile(pattern_txt, re.IGNORECASE | re.DOTALL)
     text_limit = text[:limit]
     match = pattern_re.search(text_limit)
-    return match.group(1) if match else ""
+    if not match:
+        return ""
+    return match.group(1).decode("utf-8") if is_bytes else match.group(1)
 
 
 def check_object_type(obj, types):
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""Adapter objects that serialize requests to the Tanium API with asyncio."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from . import Soap
+from . import ManyResult
+from . import chunk_many
+from . import many_list
+from . import many_summary
+from . import map_many
+from .. import utils
+from ..http_client.aio import gather_limited
+
+
+class AsyncSoap(Soap):
+    """Adapter for the Tanium SOAP API with asyncio.
+
+    Notes:
+        :attr:`AsyncSoap.api_client` must be a
+        :obj:`tantrum.api_clients.aio.AsyncSoap`.
+        :meth:`AsyncSoap.send` is a coroutine, so all of the cmd_* methods
+        return an awaitable that returns a :obj:`tantrum.results.Result`, or a
+        :obj:`list` of :obj:`tantrum.adapters.ManyResult` for the cmd_*_many
+        methods.
+
+    """
+
+    async def send(
+        self,
+        obj,
+        cmd,
+        body_re_limit=4000,
+        ser_only_attrs=None,
+        ser_exclude_attrs=None,
+        ser_empty=None,
+        ser_list_attrs=None,
+        ser_wrap_name=None,
+        ser_wrap_item_attr=None,
+        verify=None,
+        save_last=None,
+        save_history=None,
+        log_request=None,
+        log_response=None,
+        cause="",
+        **kwargs
+    ):
+        """Build and send a SOAP API request.
+
+        Args:
+            obj (:obj:`tantrum.api_models.ApiModel`):
+                ApiModel to serialize and send as part of request.
+            cmd (:obj:`str`):
+                SOAP Command to use in request.
+            body_re_limit (:obj:`int`):
+                Value to limit regex search of response body for <session> tag.
+
+                Defaults to: 4000.
+            verify (:obj:`bool` or :obj:`str`, optional):
+                Enable SSL certification validation.
+                If None uses
+                :attr:`tantrum.http_client.aio.AsyncHttpClient.verify`.
+
+                Defaults to: None.
+            save_last (:obj:`bool`, optional):
+                Save last request and response to the http client.
+                If None uses
+                :attr:`tantrum.http_client.aio.AsyncHttpClient.save_last`.
+
+                Defaults to: None.
+            save_history (:obj:`bool`, optional):
+                Append last response to the history of the http client.
+                If None uses
+                :attr:`tantrum.http_client.aio.AsyncHttpClient.save_history`.
+
+                Defaults to: None.
+            log_request (:obj:`bool`, optional):
+                Log request details to debug level.
+                If None uses
+                :attr:`tantrum.http_client.aio.AsyncHttpClient.log_request`.
+
+                Defaults to: None.
+            log_response (:obj:`bool`, optional):
+                Log response details to debug level.
+                If None uses
+                :attr:`tantrum.http_client.aio.AsyncHttpClient.log_response`.
+
+                Defaults to: None.
+            cause (:obj:`str`, optional):
+                String to explain purpose of request.
+
+                Defaults to: "".
+            **kwargs:
+                ser_*:
+                    Passed to :meth:`build_request_dict`.
+                rest of kwargs:
+                    Passed to :meth:`build_options_from_kwargs`.
+
+        Raises:
+            :obj:`exceptions.SessionNotFoundWarning`:
+                If the <session> tag can not be found in the response body.
+
+        Returns:
+            :obj:`tantrum.results.Result`
+
+        """
+        metrics = utils.metrics.REGISTRY
+        stage = "stage_seconds"
+        labels = {"command": cmd, "cause": cause}
+
+        with metrics.timer(name=stage, labels=dict(labels, stage="serialize")):
+            request_body, request_dict = self.serialize_request(
+                obj=obj,
+                cmd=cmd,
+                ser_only_attrs=ser_only_attrs,
+                ser_exclude_attrs=ser_exclude_attrs,
+                ser_empty=ser_empty,
+                ser_list_attrs=ser_list_attrs,
+                ser_wrap_name=ser_wrap_name,
+                ser_wrap_item_attr=ser_wrap_item_attr,
+                **kwargs
+            )
+
+        with metrics.timer(name=stage, labels=dict(labels, stage="network")):
+            r = await self.api_client(
+                data=request_body,
+                verify=verify,
+                log_request=log_request,
+                log_response=log_response,
+                save_last=save_last,
+                save_history=save_history,
+                cause=cause,
+            )
+        return self.handle_response(
+            response=r,
+            body_re_limit=body_re_limit,
+            request_dict=request_dict,
+            command=cmd,
+        )
+
+    async def send_many(self, sends, limit=None):
+        """Send many SOAP API requests concurrently.
+
+        Args:
+            sends (:obj:`list` of :obj:`dict`):
+                Kwargs for each call to :meth:`send`.
+            limit (:obj:`int`, optional):
+                Maximum number of requests in flight at once.
+                Uses :attr:`tantrum.http_client.aio.AsyncHttpClient.pool_maxsize`
+                if None.
+
+                Defaults to: None.
+
+        Returns:
+            :obj:`list` of :obj:`tantrum.results.Result`: In the same order as
+            sends.
+
+        """
+        limit = utils.tools.def_none(limit, self.http_client.pool_maxsize) or 100
+        coros = [self.send(**send) for send in sends]
+        return await gather_limited(coros=coros, limit=limit)
+
+    async def send_objects(self, objs, cmd, chunk_size=100, workers=0, **kwargs):
+        """Send many objects in requests that each carry a list of objects.
+
+        Args:
+            objs (:obj:`list` of :obj:`tantrum.api_models.ApiItem`):
+                API Objects to send.
+            cmd (:obj:`str`):
+                SOAP Command to use in requests.
+            chunk_size (:obj:`int`, optional):
+                Number of objects to send in each request.
+                If 0, send all objects of the same type in one request.
+
+                Defaults to: 100.
+            workers (:obj:`int`, optional):
+                Maximum number of requests in flight at once, see
+                :meth:`send_many`.
+                If 0, uses the default of :meth:`send_many`.
+
+                Defaults to: 0.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`send`.
+
+        Notes:
+            See :meth:`tantrum.adapters.Soap.send_objects`.
+
+        Returns:
+            :obj:`list` of :obj:`tantrum.adapters.ManyResult`: In the same order as
+            objs.
+
+        """
+        items = [ManyResult(obj=obj, index=idx) for idx, obj in enumerate(objs)]
+        chunks = chunk_many(items=items, size=chunk_size)
+        requests = 0
+
+        while chunks:
+            sends = [dict(kwargs, obj=many_list(items=x), cmd=cmd) for x in chunks]
+            requests += len(sends)
+            rets = await self.send_many(sends=sends, limit=workers or None)
+            chunks = map_many(chunks=chunks, rets=rets)
+
+        self.log.info(many_summary(items=items, cmd=cmd, requests=requests))
+        return items
+
+    async def close(self):
+        """Close the session of :attr:`AsyncSoap.http_client`."""
+        await self.http_client.close()
@@ -64,6 +64,18 @@ class TypeMismatchError(ModuleError):
     pass
 
 
+class SerializerFallback(ModuleError):
+    """Thrown when an object can not be written directly by a serializer.
+
+    Thrown by:
+      * :meth:`tantrum.adapters.TemplateSerializer.get_tags`
+      * :meth:`tantrum.adapters.TemplateSerializer.write_object`
+
+    """
+
+    pass
+
+
 class SessionNotFoundWarning(ModuleWarning):
     """Thrown when a session XML tag can not be found in a response body.
 
@@ -140,6 +140,7 @@ class Soap(ApiClient):
         log_request=None,
         log_response=None,
         cause="",
+        stream=False,
     ):
         """Get response of POST of data to /soap and return a response object.
 
@@ -184,7 +185,10 @@ class Soap(ApiClient):
                 String to explain purpose of request.
 
                 Defaults to: "".
+            stream (:obj:`bool`, optional):
+                Do not read the response body until it is accessed.
 
+                Defaults to: False.
 
         Returns:
             :obj:`requests.Response`
@@ -205,6 +209,7 @@ class Soap(ApiClient):
             log_request=log_request,
             log_response=log_response,
             cause=cause,
+            stream=stream,
         )
         return r
 
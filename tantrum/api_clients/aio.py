@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Clients for making API requests to Tanium with asyncio."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+
+from . import Soap
+
+
+class AsyncSoap(Soap):
+    """Client for making SOAP API requests to Tanium with asyncio.
+
+    Notes:
+        :attr:`AsyncSoap.http_client` must be a
+        :obj:`tantrum.http_client.aio.AsyncHttpClient`.
+        Since :attr:`AsyncSoap.auth_method` is synchronous, getting the token
+        headers is run in the default executor of the event loop so that a
+        login or token validation does not block the loop.
+
+    """
+
+    async def __call__(
+        self,
+        data,
+        path="/soap",
+        method="post",
+        timeout=30,
+        headers=None,
+        verify=None,
+        save_last=None,
+        save_history=None,
+        log_request=None,
+        log_response=None,
+        cause="",
+    ):
+        """Get response of POST of data to /soap and return a response object.
+
+        Args:
+            data (:obj:`str`):
+                Body to send in request.
+            timeout (:obj:`int`, optional):
+                Response timeout.
+
+                Defaults to: 30.
+            headers (:obj:`dict`):
+                Headers to send in request.
+
+                Defaults to: None.
+            verify (:obj:`bool` or :obj:`str`, optional):
+                Enable SSL certification validation.
+                If None uses
+                :attr:`tantrum.http_client.aio.AsyncHttpClient.verify`.
+
+                Defaults to: None.
+            save_last (:obj:`bool`, optional):
+                Save last request and response to the http client.
+                If None uses
+                :attr:`tantrum.http_client.aio.AsyncHttpClient.save_last`.
+
+                Defaults to: None.
+            save_history (:obj:`bool`, optional):
+                Append last response to the history of the http client.
+                If None uses
+                :attr:`tantrum.http_client.aio.AsyncHttpClient.save_history`.
+
+                Defaults to: None.
+            log_request (:obj:`bool`, optional):
+                Log request details to debug level.
+                If None uses
+                :attr:`tantrum.http_client.aio.AsyncHttpClient.log_request`.
+
+                Defaults to: None.
+            log_response (:obj:`bool`, optional):
+                Log response details to debug level.
+                If None uses
+                :attr:`tantrum.http_client.aio.AsyncHttpClient.log_response`.
+
+                Defaults to: None.
+            cause (:obj:`str`, optional):
+                String to explain purpose of request.
+
+                Defaults to: "".
+
+        Returns:
+            :obj:`tantrum.http_client.aio.Response`
+
+        """
+        headers = headers or {}
+        headers = {k: v for k, v in headers.items()}
+        headers.update(await self.token_headers())
+        r = await self.http_client(
+            method=method,
+            path=path,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            verify=verify,
+            save_last=save_last,
+            save_history=save_history,
+            log_request=log_request,
+            log_response=log_response,
+            cause=cause,
+        )
+        return r
+
+    async def token_headers(self):
+        """Get the token headers from :attr:`AsyncSoap.auth_method`.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: self.auth_method.token_headers)
+
+    async def close(self):
+        """Close the session of :attr:`AsyncSoap.http_client`."""
+        await self.http_client.close()
@@ -6,6 +6,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import copy
+import functools
 import json
 import operator
 import re
@@ -27,9 +28,166 @@ simple_types = tuple(list(integer_types) + list(string_types) + list(float_types
 """:obj:`tuple` of :obj:`type`: All types that should be considered simple types."""
 
 
-class ApiModel(object):
+class ApiMeta(object):
+    """Attribute metadata compiled once per :obj:`ApiModel` class."""
+
+    def __init__(self, cls):
+        """Constructor.
+
+        Args:
+            cls (:class:`ApiModel`):
+                Class to compile attribute metadata for.
+
+        """
+        self.api_simple = cls.API_SIMPLE
+        """:obj:`dict`: :attr:`ApiModel.API_SIMPLE` this was compiled from."""
+        self.api_complex = cls.API_COMPLEX
+        """:obj:`dict`: :attr:`ApiModel.API_COMPLEX` this was compiled from."""
+
+        simple = self.api_simple or {}
+        complex = self.api_complex or {}
+        self.api_item_cls = getattr(cls, "API_ITEM_CLS", None)
+        """:class:`ApiItem`: :attr:`ApiList.API_ITEM_CLS` this was compiled from."""
+        self.types = dict(list(simple.items()) + list(complex.items()))
+        """:obj:`dict`: Map of all attributes to their types."""
+        self.attrs = tuple(self.types)
+        """:obj:`tuple` of :obj:`str`: All attributes in definition order."""
+        self.simple = frozenset(simple)
+        """:obj:`frozenset` of :obj:`str`: Simple attributes."""
+        self.complex = frozenset(complex)
+        """:obj:`frozenset` of :obj:`str`: Complex attributes."""
+        self.coercers = {}
+        """:obj:`dict`: Map of attributes to a function that coerces a value."""
+        self.trusted = {}
+        """:obj:`dict`: Map of attributes to a function used by from_server."""
+        self.raw_types = {k: v for k, v in complex.items() if k not in simple}
+        """:obj:`dict`: Complex attributes that from_server leaves as raw data."""
+
+        for attr, be_type in self.types.items():
+            funcs = []
+            if attr in simple:
+                funcs.append(
+                    functools.partial(cls.api_coerce_simple, be_type=simple[attr])
+                )
+            if attr in complex:
+                funcs.append(
+                    functools.partial(cls.api_coerce_complex, be_type=complex[attr])
+                )
+            self.coercers[attr] = self.build_coercer(funcs=funcs, be_type=be_type)
+            self.trusted[attr] = self.build_trusted(be_type=be_type)
+
+        item_classes = cls.api_coerce_list(self.api_item_cls)
+        self.item_is_complex = any(
+            isinstance(x, type) and issubclass(x, (ApiItem, ApiList))
+            for x in item_classes
+        )
+        """:obj:`bool`: :attr:`ApiList.API_ITEM_CLS` is an ApiModel sub class."""
+
+        self.str_attrs = None
+        """:obj:`list` of :obj:`str`: Cache for :meth:`ApiModel.api_attrs_str`."""
+        self.repr_attrs = None
+        """:obj:`list` of :obj:`str`: Cache for :meth:`ApiModel.api_attrs_repr`."""
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = ["simple={}".format(len(self.simple))]
+        bits += ["complex={}".format(len(self.complex))]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    @staticmethod
+    def build_coercer(funcs, be_type):
+        """Build a function that runs value through funcs.
+
+        Args:
+            funcs (:obj:`list` of :obj:`callable`):
+                Coercion functions that take a value kwarg.
+            be_type (:class:`object`):
+                Type that value should be coerced to.
+
+        Returns:
+            :obj:`callable`: That returns the coerced value and if the coerced value
+            is of be_type.
+
+        """
+
+        exact = be_type if isinstance(be_type, tuple) else (be_type,)
+        if len(funcs) > 1:
+            exact = ()
+
+        def coercer(value):
+            if type(value) in exact:
+                return value, True
+            for func in funcs:
+                value = func(value=value)
+            return value, isinstance(value, be_type)
+
+        return coercer
+
+    @staticmethod
+    def build_trusted(be_type):
+        """Build a function that checks if a value from the API can be set as is.
+
+        Args:
+            be_type (:class:`object`):
+                Type that value should be.
+
+        Returns:
+            :obj:`callable`: That returns True if the type of value is exactly
+            be_type or one of be_type. If not, the value should be set with type
+            checking.
+
+        """
+        exact = be_type if isinstance(be_type, tuple) else (be_type,)
+
+        def trusted(value):
+            return type(value) in exact
+
+        return trusted
+
+
+class ApiModelType(type):
+    """Metaclass for :obj:`ApiModel` that keeps :meth:`ApiModel.api_meta` current."""
+
+    META_ATTRS = ("API_SIMPLE", "API_COMPLEX", "API_ITEM_CLS")
+    """:obj:`tuple` of :obj:`str`: Class attributes that :obj:`ApiMeta` is compiled
+    from."""
+
+    def __setattr__(cls, attr, value):
+        """Throw away the attribute metadata of cls when it is out of date.
+
+        Notes:
+            Calls :meth:`ApiModel.api_meta_reset` if attr is one of
+            :attr:`META_ATTRS`, so :meth:`ApiModel.api_meta` does not need to check
+            if the metadata is out of date every time it is called.
+
+        """
+        super(ApiModelType, cls).__setattr__(attr, value)
+        if attr in ApiModelType.META_ATTRS:
+            cls.api_meta_reset()
+
+
+class ApiModel(six.with_metaclass(ApiModelType, object)):
     """Base class for all models in the API."""
 
+    __slots__ = ()
+    """:obj:`tuple`: Empty so that sub classes can be made without a __dict__."""
+
     API_NAME = None
     """:obj:`str`: Name of object used in API calls."""
 
@@ -93,7 +251,10 @@ class ApiModel(object):
             :obj:`ApiItem`
 
         """
-        return self.__class__(**self.__dict__)
+        attrs = {k: getattr(self, k, None) for k in self.api_meta().attrs}
+        attrs.update(getattr(self, "__dict__", {}))
+        attrs = {k: v for k, v in attrs.items() if not k.startswith("_api_")}
+        return self.__class__(**attrs)
 
     def __deepcopy__(self, memo):
         """Support deep copy for self.
@@ -152,15 +313,83 @@ class ApiModel(object):
         """
         return not self == value
 
+    def __getattr__(self, attr):
+        """Create complex attributes left as raw data by :meth:`api_set_trusted`.
+
+        Args:
+            attr (:obj:`str`):
+                Attribute that was not found on this object.
+
+        Notes:
+            Only called for attributes that do not exist. If attr is in the raw
+            data, it is turned into its :attr:`API_COMPLEX` class using
+            from_server and set on this object, so this only happens once.
+
+        Raises:
+            :exc:`AttributeError`:
+                If attr is not in the raw data.
+
+        Returns:
+            :obj:`ApiItem` or :obj:`ApiList`
+
+        """
+        raw = None if attr == "_api_raw" else getattr(self, "_api_raw", None)
+        if not raw or attr not in raw:
+            error = "{c!r} object has no attribute {a!r}"
+            error = error.format(c=self.__class__.__name__, a=attr)
+            raise AttributeError(error)
+        value = self.api_meta().raw_types[attr].from_server(raw.pop(attr))
+        object.__setattr__(self, attr, value)
+        return value
+
+    @classmethod
+    def api_meta(cls):
+        """Get the attribute metadata for this class, compiling it if needed.
+
+        Notes:
+            The metadata is compiled the first time it is needed and again after
+            :attr:`API_SIMPLE`, :attr:`API_COMPLEX`, or :attr:`ApiList.API_ITEM_CLS`
+            are replaced with a different object, see :obj:`ApiModelType`.
+            Changing them in place requires :meth:`api_meta_reset`.
+
+        Returns:
+            :obj:`ApiMeta`
+
+        """
+        meta = cls.__dict__.get("_api_meta")
+        if meta is None:
+            meta = ApiMeta(cls)
+            cls._api_meta = meta
+        return meta
+
+    @classmethod
+    def api_meta_reset(cls):
+        """Throw away the attribute metadata for this class.
+
+        Notes:
+            Must be called after adding, removing, or changing the type of an
+            attribute in :attr:`API_SIMPLE` or :attr:`API_COMPLEX` in place.
+
+            The metadata of sub classes is thrown away as well, since they may use
+            the attributes of this class.
+
+        """
+        cls._api_meta = None
+        for sub_cls in cls.__subclasses__():
+            sub_cls.api_meta_reset()
+
     @classmethod
     def api_attrs(cls):
         """Get simple and complex attributes combined.
 
+        Notes:
+            Returns the dict cached in :meth:`api_meta`, do not modify it.
+
         Returns:
             :obj:`dict`
 
         """
-        return dict(list(cls.API_SIMPLE.items()) + list(cls.API_COMPLEX.items()))
+        return cls.api_meta().types
 
     @classmethod
     def api_attrs_repr(cls):
@@ -175,13 +404,16 @@ class ApiModel(object):
             :obj:`list` of :obj:`str`
 
         """
-        api_attrs = cls.api_attrs()
-        show_attrs = cls.API_STR + cls.API_STR_ADD + list(api_attrs)
-        attrs = []
-        for attr in show_attrs:
-            if attr not in attrs and (attr in api_attrs or hasattr(cls, attr)):
-                attrs.append(attr)
-        return attrs or list(api_attrs)
+        meta = cls.api_meta()
+        if meta.repr_attrs is None:
+            api_attrs = meta.types
+            show_attrs = cls.API_STR + cls.API_STR_ADD + list(api_attrs)
+            attrs = []
+            for attr in show_attrs:
+                if attr not in attrs and (attr in api_attrs or hasattr(cls, attr)):
+                    attrs.append(attr)
+            meta.repr_attrs = attrs or list(api_attrs)
+        return list(meta.repr_attrs)
 
     @classmethod
     def api_attrs_str(cls):
@@ -198,13 +430,16 @@ class ApiModel(object):
             :obj:`list` of :obj:`str`
 
         """
-        api_attrs = cls.api_attrs()
-        show_attrs = cls.API_STR + cls.API_STR_ADD
-        attrs = []
-        for attr in show_attrs:
-            if attr not in attrs and (attr in api_attrs or hasattr(cls, attr)):
-                attrs.append(attr)
-        return attrs or list(api_attrs)
+        meta = cls.api_meta()
+        if meta.str_attrs is None:
+            api_attrs = meta.types
+            show_attrs = cls.API_STR + cls.API_STR_ADD
+            attrs = []
+            for attr in show_attrs:
+                if attr not in attrs and (attr in api_attrs or hasattr(cls, attr)):
+                    attrs.append(attr)
+            meta.str_attrs = attrs or list(api_attrs)
+        return list(meta.str_attrs)
 
     @classmethod
     def api_attrs_desc(cls):
@@ -320,6 +555,12 @@ class ApiModel(object):
         """
         if not isinstance(value, be_type):
             if isinstance(value, dict):
+                # a list with one item, i.e. a row with one column, deserializes
+                # as the item itself instead of a list of one item
+                if issubclass(be_type, ApiList) and value:
+                    keys = (be_type.API_ITEM_ATTR,) + be_type.api_meta().attrs
+                    if not any(k in keys for k in value):
+                        return be_type(value)
                 return be_type(**value)
             elif isinstance(value, (list, tuple)):
                 return be_type(*value)
@@ -356,10 +597,14 @@ class ApiModel(object):
             :obj:`object`
 
         """
-        if value is None or attr.startswith("_") or attr.isupper():
+        if value is None:
             return value
 
-        if attr not in self.api_attrs():
+        coercer = self.api_meta().coercers.get(attr, None)
+
+        if coercer is None:
+            if attr.startswith("_") or attr.isupper():
+                return value
             if isinstance(value, bool) or isinstance(value, integer_types):
                 self.API_SIMPLE[attr] = integer_types
             elif isinstance(value, float_types):
@@ -368,23 +613,64 @@ class ApiModel(object):
                 self.API_SIMPLE[attr] = string_types
             else:
                 raise exceptions.AttrUndefinedError(obj=self, attr=attr, value=value)
+            self.api_meta_reset()
             warnings.warn(
                 exceptions.AttrUndefinedWarning(obj=self, attr=attr, value=value)
             )
+            coercer = self.api_meta().coercers[attr]
 
-        be_type = self.api_attrs()[attr]
+        value, valid = coercer(value)
 
-        if attr in self.API_SIMPLE:
-            value = self.api_coerce_simple(value=value, be_type=be_type)
-        if attr in self.API_COMPLEX:
-            value = self.api_coerce_complex(value=value, be_type=be_type)
-
-        if isinstance(value, be_type) or value is None:
+        if valid or value is None:
             return value
         raise exceptions.AttrTypeError(
-            obj=self, value=value, attr=attr, be_type=be_type
+            obj=self, value=value, attr=attr, be_type=self.api_attrs()[attr]
         )
 
+    def api_init_hook(self):
+        """Construction hook that allows subclasses to modify a new object.
+
+        Notes:
+            Called at the end of construction from both __init__ and
+            from_server. By default, this does nothing.
+
+        """
+        pass
+
+    def api_set_trusted(self, obj):
+        """Set attributes from an object deserialized from an API response.
+
+        Args:
+            obj (:obj:`dict`):
+                Attributes and values to set on this object.
+
+        Notes:
+            Values that are already of the type from :meth:`api_attrs` are set
+            directly. Dicts or lists for complex attributes are not set at all,
+            they are kept as is until the attribute is first accessed, see
+            :meth:`__getattr__`. Anything else, including attributes not in
+            :meth:`api_attrs`, is set with type checking using
+            :meth:`api_coerce_value`.
+
+        """
+        meta = self.api_meta()
+        raw_types = meta.raw_types
+        raw = {}
+        for attr, trusted in meta.trusted.items():
+            value = obj.get(attr)
+            if value is not None and not trusted(value):
+                if attr in raw_types and isinstance(value, (dict, list, tuple)):
+                    raw[attr] = value
+                else:
+                    setattr(self, attr, value)
+                continue
+            object.__setattr__(self, attr, value)
+        for attr, value in obj.items():
+            if attr not in meta.trusted:
+                setattr(self, attr, value)
+        if raw:
+            object.__setattr__(self, "_api_raw", raw)
+
     def serialize_json(self):
         ser = self.serialize()
         return json.dumps(ser, indent=2)
@@ -393,6 +679,9 @@ class ApiModel(object):
 class ApiItem(ApiModel):
     """Model for a complex item in the API."""
 
+    __slots__ = ()
+    """:obj:`tuple`: Empty so that sub classes can be made without a __dict__."""
+
     API_LIST_API_NAME = None
     """:obj:`str`: Name of :attr:`API_LIST_CLS` used in API calls."""
 
@@ -407,10 +696,39 @@ class ApiItem(ApiModel):
                 Set and checked using :meth:`ApiModel.api_attrs`.
 
         """
-        for attr in self.api_attrs():
+        for attr in self.api_meta().attrs:
             setattr(self, attr, kwargs.pop(attr, None))
         for attr, value in kwargs.items():
             setattr(self, attr, value)
+        self.api_init_hook()
+
+    @classmethod
+    def from_server(cls, obj):
+        """Create an object from a dict deserialized from an API response.
+
+        Args:
+            obj (:obj:`dict`):
+                Attributes and values for the new object.
+
+        Notes:
+            Skips the type checking done by :meth:`__init__` for any values that
+            are already the right type, see :meth:`ApiModel.api_set_trusted`.
+            Only meant for data that came from the API, objects created by users
+            should use :meth:`__init__`.
+
+            If obj is not a dict it is passed to
+            :meth:`ApiModel.api_coerce_complex`.
+
+        Returns:
+            :obj:`ApiItem`
+
+        """
+        if not isinstance(obj, dict):
+            return cls.api_coerce_complex(value=obj, be_type=cls)
+        new = cls.__new__(cls)
+        new.api_set_trusted(obj=obj)
+        new.api_init_hook()
+        return new
 
     def __len__(self):
         """Return number of :meth:`ApiModel.api_attrs` that are not None.
@@ -419,7 +737,7 @@ class ApiItem(ApiModel):
             :obj:`int`
 
         """
-        api_attrs = self.api_attrs()
+        api_attrs = self.api_meta().attrs
         set_attrs = [k for k in api_attrs if getattr(self, k, None) is not None]
         return len(set_attrs)
 
@@ -520,7 +838,7 @@ class ApiItem(ApiModel):
             "wrap_name": False,
             "wrap_item_attr": wrap_item_attr,
         }
-        for attr in self.api_attrs():
+        for attr in self.api_meta().attrs:
             if attr in exclude_attrs or (only_attrs and attr not in only_attrs):
                 continue
             value = getattr(self, attr, None)
@@ -536,6 +854,9 @@ class ApiItem(ApiModel):
 class ApiList(ApiModel):
     """Model for an array in the API."""
 
+    __slots__ = ()
+    """:obj:`tuple`: Empty so that sub classes can be made without a __dict__."""
+
     API_ITEM_ATTR = None
     """:obj:`str`: Name of :attr:`API_ITEM_CLS` used in API calls."""
 
@@ -545,6 +866,9 @@ class ApiList(ApiModel):
     LIST = None
     """:obj:`list` of :attr:`API_ITEM_CLS`: List container for this class."""
 
+    _api_indexes = None
+    """:obj:`dict`: Map of attributes to hash indexes, see :meth:`add_index`."""
+
     T_CLS_STR = "{obj.__class__.__name__}({attrs}) with {count} {item_cls} objects"
     """:obj:`str`: Template for class name and attrs in str."""
 
@@ -584,10 +908,96 @@ class ApiList(ApiModel):
 
         self.LIST = items
 
-        for attr in self.api_attrs():
+        for attr in self.api_meta().attrs:
             setattr(self, attr, kwargs.pop(attr, None))
         for attr, value in kwargs.items():
             setattr(self, attr, value)
+        self.api_init_hook()
+
+    @classmethod
+    def from_server(cls, obj):
+        """Create an object from a dict or list deserialized from an API response.
+
+        Args:
+            obj (:obj:`dict` or :obj:`list` or :obj:`tuple`):
+                If dict, the items from the :attr:`API_ITEM_ATTR` key and attributes
+                and values for the new object. If list or tuple, the items for the
+                new object.
+
+        Notes:
+            Items that are dicts or lists are turned into :attr:`API_ITEM_CLS`
+            using its from_server, any other items go through
+            :meth:`api_coerce_item`. Attributes are set using
+            :meth:`ApiModel.api_set_trusted`. Only meant for data that came from
+            the API, objects created by users should use :meth:`__init__`.
+
+            If obj is not a dict, list, or tuple it is passed to
+            :meth:`ApiModel.api_coerce_complex`.
+
+        Returns:
+            :obj:`ApiList`
+
+        """
+        if isinstance(obj, (list, tuple)):
+            obj, items = {}, list(obj)
+        elif isinstance(obj, dict):
+            obj = dict(obj)
+            items = obj.pop(cls.API_ITEM_ATTR, None)
+            items = [] if items is None else items
+            items = list(items) if isinstance(items, (list, tuple)) else [items]
+        else:
+            return cls.api_coerce_complex(value=obj, be_type=cls)
+
+        new = cls.__new__(cls)
+        object.__setattr__(new, "LIST", [])
+
+        meta = cls.api_meta()
+        item_cls = meta.api_item_cls
+        attr = cls.API_ITEM_ATTR
+        from_server = meta.item_is_complex and isinstance(item_cls, type)
+        items = new.api_coerce_items_hook(attr=attr, value=items, op="=")
+        new_items = []
+        for item in items:
+            if from_server and isinstance(item, (dict, list, tuple)):
+                item = item_cls.from_server(item)
+            else:
+                item = new.api_coerce_item(item=item, items=items, attr=attr, op="=")
+            new_items.append(item)
+        object.__setattr__(new, "LIST", new_items)
+
+        new.api_set_trusted(obj=obj)
+        new.api_init_hook()
+        return new
+
+    def __copy__(self):
+        """Support shallow copy for self.
+
+        Notes:
+            Indexes from :meth:`add_index` are added to the copy.
+
+        Returns:
+            :obj:`ApiList`
+
+        """
+        ret = super(ApiList, self).__copy__()
+        for attr in self.indexes:
+            ret.add_index(attr=attr)
+        return ret
+
+    def __deepcopy__(self, memo):
+        """Support deep copy for self.
+
+        Notes:
+            Indexes from :meth:`add_index` are added to the copy.
+
+        Returns:
+            :obj:`ApiList`
+
+        """
+        ret = super(ApiList, self).__deepcopy__(memo)
+        for attr in self.indexes:
+            ret.add_index(attr=attr)
+        return ret
 
     def __str__(self):
         """Show object info using :meth:`ApiModel.api_attrs_str`.
@@ -647,6 +1057,9 @@ class ApiList(ApiModel):
             :attr:`API_ITEM_CLS`, but will return False if value is of wrong type
             and can not be coerced.
 
+            If there are any indexes from :meth:`add_index`, only the items with
+            the same indexed attribute value as value are checked.
+
         Returns:
             :obj:`bool`:
 
@@ -655,6 +1068,11 @@ class ApiList(ApiModel):
             value = self.api_coerce_item(item=value, items=None, attr=None, op="in")
         except Exception:
             return False
+        for attr, index in (self._api_indexes or {}).items():
+            try:
+                return value in index.get(getattr(value, attr, None), [])
+            except TypeError:
+                break
         return value in self.LIST
 
     def __add__(self, value):
@@ -675,12 +1093,15 @@ class ApiList(ApiModel):
                 list items from value.
 
         """
-        api_attrs = self.api_attrs()
+        api_attrs = self.api_meta().attrs
 
         val_items = self.api_coerce_items(attr=None, value=value, op="+=")
         mod_items = val_items + self.LIST
-        attrs = {k: getattr(self, k, None) for k, v in api_attrs.items()}
-        return self.__class__(*mod_items, **attrs)
+        attrs = {k: getattr(self, k, None) for k in api_attrs}
+        ret = self.__class__(*mod_items, **attrs)
+        for attr in self.indexes:
+            ret.add_index(attr=attr)
+        return ret
 
     def __iadd__(self, value):
         """Support += operand.
@@ -700,7 +1121,8 @@ class ApiList(ApiModel):
 
         """
         mod_items = self.api_coerce_items(attr=None, value=value, op="+=")
-        self.LIST += mod_items
+        self.LIST.extend(mod_items)
+        self.api_index_add(items=mod_items)
         return self
 
     def __getitem__(self, value):
@@ -732,7 +1154,8 @@ class ApiList(ApiModel):
             :meth:`api_coerce_items` to perform type checking on each item in value.
 
             If attr is same as :attr:`API_ITEM_ATTR`, the attr will
-            be changed to "LIST".
+            be changed to "LIST", and any indexes from :meth:`add_index` are
+            rebuilt.
 
         """
         if attr in [self.API_ITEM_ATTR, "LIST"]:
@@ -741,6 +1164,8 @@ class ApiList(ApiModel):
         else:
             value = self.api_coerce_value(attr=attr, value=value)
         super(ApiList, self).__setattr__(attr, value)
+        if attr == "LIST" and self._api_indexes:
+            self.reindex()
 
     def api_coerce_items(self, attr, value, op):
         """Check that value is a list type and that all items value are the proper type.
@@ -774,14 +1199,17 @@ class ApiList(ApiModel):
         """
         if value is None:
             return []
-        is_list = isinstance(value, (list, tuple))
-        is_same = isinstance(value, self.__class__)
-        if not any([is_list, is_same]):
+        if not isinstance(value, (list, tuple, self.__class__)):
             raise exceptions.ListTypeError(obj=self, attr=attr, value=value, op=op)
         value = self.api_coerce_items_hook(attr=attr, value=value, op=op)
-        return [
-            self.api_coerce_item(item=i, items=value, attr=attr, op=op) for i in value
-        ]
+        if not value:
+            return []
+        coerce = functools.partial(self.api_coerce_item, items=value, attr=attr, op=op)
+        if self.api_item_cls_is_complex():
+            # dicts are the common case, create them without api_coerce_item
+            be_type = self.API_ITEM_CLS
+            return [be_type(**i) if type(i) is dict else coerce(item=i) for i in value]
+        return [coerce(item=i) for i in value]
 
     def api_coerce_items_hook(self, attr, value, op):
         """Check hook that allows subclasses to modify list items.
@@ -892,8 +1320,7 @@ class ApiList(ApiModel):
             :obj:`bool`
 
         """
-        check = cls.api_coerce_list(cls.API_ITEM_CLS)
-        return any(issubclass(x, (ApiItem, ApiList)) for x in check)
+        return cls.api_meta().item_is_complex
 
     def append(self, value):
         """Support appending an item to list container.
@@ -909,6 +1336,7 @@ class ApiList(ApiModel):
         """
         value = self.api_coerce_item(item=value, items=None, attr=None, op="append()")
         self.LIST.append(value)
+        self.api_index_add(items=[value])
 
     def remove(self, value):
         """Support removing an item from list container.
@@ -919,7 +1347,7 @@ class ApiList(ApiModel):
 
         """
         value = self.api_coerce_item(item=value, items=None, attr=None, op="remove()")
-        return self.LIST.remove(value)
+        self.pop(self.LIST.index(value))
 
     def pop(self, value=-1):
         """Support pop of an item from list container.
@@ -931,11 +1359,115 @@ class ApiList(ApiModel):
                 Defaults to: -1.
 
         """
-        return self.LIST.pop(value)
+        item = self.LIST.pop(value)
+        self.api_index_remove(items=[item])
+        return item
 
     def reverse(self):
         """Support reverse on list container."""
         self.LIST.reverse()
+        if self._api_indexes:
+            self.reindex()
+
+    @property
+    def indexes(self):
+        """Get the attributes that have an index from :meth:`add_index`.
+
+        Returns:
+            :obj:`list` of :obj:`str`
+
+        """
+        return list(self._api_indexes or {})
+
+    def add_index(self, attr):
+        """Add a hash index on an attribute of the items in list container.
+
+        Args:
+            attr (:obj:`str`):
+                Attribute of items in :attr:`LIST` to index.
+
+        Notes:
+            Maps the value of attr of each item to the items with that value, so
+            that :meth:`get_item_by_attr`, :meth:`get_items_by_attr`,
+            :meth:`pop_item_by_attr`, :meth:`pop_items_by_attr` for attr, and
+            ``in`` do not have to check every item in :attr:`LIST`.
+
+            Indexes are kept up to date by :meth:`append`, :meth:`remove`,
+            :meth:`pop`, ``+=``, :meth:`sort`, :meth:`reverse`, and setting
+            :attr:`LIST`. Changing :attr:`LIST` directly or changing attr on an
+            item that is already in :attr:`LIST` requires calling :meth:`reindex`.
+
+        Raises:
+            :exc:`tantrum.api_models.exceptions.ModuleError`:
+                If the value of attr of any item can not be hashed.
+
+        """
+        if self._api_indexes is None:
+            object.__setattr__(self, "_api_indexes", {})
+        self._api_indexes[attr] = {}
+        try:
+            self.api_index_add(items=self.LIST, attrs=[attr])
+        except TypeError as exc:
+            del self._api_indexes[attr]
+            error = "Unable to index attribute {a!r} of items in {c}: {e}"
+            error = error.format(a=attr, c=self.__class__.__name__, e=exc)
+            raise exceptions.ModuleError(error)
+
+    def remove_index(self, attr):
+        """Remove an index added by :meth:`add_index`.
+
+        Args:
+            attr (:obj:`str`):
+                Attribute to remove the index of.
+
+        """
+        (self._api_indexes or {}).pop(attr, None)
+
+    def reindex(self):
+        """Rebuild all indexes added by :meth:`add_index` from :attr:`LIST`."""
+        for attr in self.indexes:
+            self.add_index(attr=attr)
+
+    def api_index_add(self, items, attrs=None):
+        """Add items to the indexes added by :meth:`add_index`.
+
+        Args:
+            items (:obj:`list`):
+                Items that were added to the end of :attr:`LIST`.
+            attrs (:obj:`list` of :obj:`str`, optional):
+                Only add items to the indexes of these attributes.
+                Uses :attr:`indexes` if None.
+
+                Defaults to: None.
+
+        """
+        if not self._api_indexes:
+            return
+        for attr in self.indexes if attrs is None else attrs:
+            index = self._api_indexes[attr]
+            for item in items:
+                index.setdefault(getattr(item, attr, None), []).append(item)
+
+    def api_index_remove(self, items):
+        """Remove items from the indexes added by :meth:`add_index`.
+
+        Args:
+            items (:obj:`list`):
+                Items that were removed from :attr:`LIST`.
+
+        """
+        if not self._api_indexes:
+            return
+        for attr, index in self._api_indexes.items():
+            for item in items:
+                key = getattr(item, attr, None)
+                bucket = index.get(key, [])
+                for idx, other in enumerate(bucket):
+                    if other is item:
+                        del bucket[idx]
+                        break
+                if not bucket:
+                    index.pop(key, None)
 
     def get_item_by_attr(self, value, attr="name", regex_value=False):
         """Support getting an item from list container by attr value.
@@ -963,13 +1495,7 @@ class ApiList(ApiModel):
                 The object from :attr:`LIST` whose attr value matches value.
 
         """
-        items = []
-        for i in self.LIST:
-            ival = getattr(i, attr, None)
-            if regex_value and re.search(format(value), format(ival)):
-                items.append(i)
-            elif ival == value:
-                items.append(i)
+        items = self.get_items_by_attr(value=value, attr=attr, regex_value=regex_value)
         if len(items) == 1:
             return items[0]
         raise exceptions.GetSingleItemError(
@@ -997,18 +1523,34 @@ class ApiList(ApiModel):
 
                 Defaults to: False.
 
+        Notes:
+            If attr has an index from :meth:`add_index` and regex_value is False,
+            the index is used instead of checking every item.
+
+            If regex_value is True, value is compiled once and checked against
+            the attr value of every item, use "^" to match a prefix.
+
         Returns:
             :obj:`list` of :obj:`object`:
                 All objects from :attr:`LIST` whose attr value matches value.
 
         """
-        items = []
-        for i in self.LIST:
-            ival = getattr(i, attr, None)
-            if regex_value and re.search(format(value), format(ival)):
-                items.append(i)
-            elif ival == value:
-                items.append(i)
+        index = (self._api_indexes or {}).get(attr)
+        if regex_value:
+            pattern = re.compile(format(value))
+            items = [
+                i
+                for i in self.LIST
+                if pattern.search(format(getattr(i, attr, None)))
+                or getattr(i, attr, None) == value
+            ]
+        elif index is not None:
+            try:
+                items = list(index.get(value, []))
+            except TypeError:
+                items = []
+        else:
+            items = [i for i in self.LIST if getattr(i, attr, None) == value]
         return self.__class__(*items) if new_list else items
 
     def pop_item_by_attr(self, value, attr="name", regex_value=False):
@@ -1038,7 +1580,7 @@ class ApiList(ApiModel):
 
         """
         item = self.get_item_by_attr(value, attr, regex_value)
-        return self.LIST.pop(self.LIST.index(item))
+        return self.pop(self.api_index_of(item=item))
 
     def pop_items_by_attr(self, value, attr="name", regex_value=False, new_list=False):
         """Support popping items from list container by attr value.
@@ -1067,8 +1609,9 @@ class ApiList(ApiModel):
 
         """
         items = self.get_items_by_attr(value, attr, regex_value, new_list)
-        for i in items:
-            self.LIST.remove(i)
+        ids = set(id(i) for i in items)
+        self.LIST[:] = [i for i in self.LIST if id(i) not in ids]
+        self.api_index_remove(items=items)
         return items
 
     def sort(self, key=operator.attrgetter("id"), reverse=False):
@@ -1086,6 +1629,34 @@ class ApiList(ApiModel):
 
         """
         self.LIST.sort(key=key, reverse=reverse)
+        if self._api_indexes:
+            self.reindex()
+
+    def api_index_of(self, item):
+        """Get the index of an item in list container by identity.
+
+        Args:
+            item (:obj:`object`):
+                Item in :attr:`LIST` to find.
+
+        Notes:
+            Unlike ``LIST.index``, this does not compare items using ==, which
+            serializes both items for :obj:`ApiModel` items.
+
+        Raises:
+            :exc:`ValueError`:
+                If item is not in :attr:`LIST`.
+
+        Returns:
+            :obj:`int`
+
+        """
+        for idx, other in enumerate(self.LIST):
+            if other is item:
+                return idx
+        error = "{i!r} is not in {c}"
+        error = error.format(i=item, c=self.__class__.__name__)
+        raise ValueError(error)
 
     def serialize(
         self,
@@ -1151,7 +1722,7 @@ class ApiList(ApiModel):
         }
         simples = {}
         if list_attrs:
-            for attr in self.api_attrs():
+            for attr in self.api_meta().attrs:
                 if attr in exclude_attrs or (only_attrs and attr not in only_attrs):
                     continue
                 value = getattr(self, attr, None)
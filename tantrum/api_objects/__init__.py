@@ -8,6 +8,7 @@ from __future__ import unicode_literals
 import datetime
 import importlib
 import six
+import sys
 import warnings
 
 from . import exceptions
@@ -15,8 +16,10 @@ from .. import api_models
 from .. import utils
 
 if six.PY2:
+    import imp  # pragma: no cover
     import pathlib2 as pathlib  # pragma: no cover
 else:
+    import importlib.util
     import pathlib
 
 API_TYPES = ["soap"]
@@ -28,11 +31,14 @@ PATTERN = "{api_type}_*.py"
 DEFAULT_TYPE = "soap"
 """:obj:`str`: Default :data:`API_TYPES` type to load in :func:`load`."""
 
+COMPACT_SUFFIX = "_compact"
+""":obj:`str`: Suffix added to module name for :func:`import_compact`."""
+
 
 class ApiObjects(object):
     """Encapsulation object for an API Object module."""
 
-    def __init__(self, module_file, adhoc_warn=True):
+    def __init__(self, module_file, adhoc_warn=True, compact=False):
         """Constructor.
 
         Args:
@@ -42,12 +48,24 @@ class ApiObjects(object):
                 Enable warnings about adhoc added simple attributes to API Objects.
 
                 Defaults to: True.
+            compact (:obj:`bool`, optional):
+                Use a copy of the API Object module from :func:`import_compact`,
+                where ApiItem classes store their attributes in __slots__
+                instead of a per instance __dict__.
+
+                Defaults to: False.
 
         """
-        module_path = "{p}.{f}".format(p=__name__, f=module_file)
-        self._module = importlib.import_module(module_path)
+        if compact:
+            self._module = import_compact(module_file=module_file)
+        else:
+            module_path = "{p}.{f}".format(p=__name__, f=module_file)
+            self._module = importlib.import_module(module_path)
         """:mod:`tantrum.api_objects`: Imported API Objects module."""
 
+        self._compact = compact
+        """:obj:`bool`: API Objects module is a compact copy."""
+
         self._models = api_models
         """:mod:`tantrum.api_models`: API Models module."""
 
@@ -67,6 +85,7 @@ class ApiObjects(object):
         bits = [
             "type={!r}".format(self.module_type),
             "version={!r}".format(self.module_version),
+            "compact={!r}".format(self.compact),
         ]
         bits = "({})".format(", ".join(bits))
         cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
@@ -134,6 +153,16 @@ class ApiObjects(object):
         """
         return self._module
 
+    @property
+    def compact(self):
+        """Get if the API objects module is a compact copy.
+
+        Returns:
+            :obj:`bool`
+
+        """
+        return self._compact
+
     @property
     def module_type(self):
         """Get the API type.
@@ -326,7 +355,15 @@ class ApiObjects(object):
         return name_map[name]
 
     @classmethod
-    def load(cls, api_type=DEFAULT_TYPE, veq="", vmax="", vmin="", vshrink=True):
+    def load(
+        cls,
+        api_type=DEFAULT_TYPE,
+        veq="",
+        vmax="",
+        vmin="",
+        vshrink=True,
+        compact=False,
+    ):
         """Import an API module for version and type.
 
         Args:
@@ -356,6 +393,11 @@ class ApiObjects(object):
                 down to this length.
 
                 Defaults to: True.
+            compact (:obj:`bool`, optional):
+                Load a compact copy of the API object module, see
+                :func:`import_compact`.
+
+                Defaults to: False.
 
         Raises:
             :exc:`exceptions.ModuleError`:
@@ -365,7 +407,14 @@ class ApiObjects(object):
             :obj:`ApiObjects`
 
         """
-        return load(api_type=api_type, veq=veq, vmax=vmax, vmin=vmin, vshrink=vshrink)
+        return load(
+            api_type=api_type,
+            veq=veq,
+            vmax=vmax,
+            vmin=vmin,
+            vshrink=vshrink,
+            compact=compact,
+        )
 
 
 def get_versions(api_type=DEFAULT_TYPE):
@@ -483,7 +532,7 @@ def find_version(api_type=DEFAULT_TYPE, veq="", vmax="", vmin="", vshrink=True):
     raise exceptions.NoVersionFoundError(error)
 
 
-def load(api_type=DEFAULT_TYPE, veq="", vmax="", vmin="", vshrink=True):
+def load(api_type=DEFAULT_TYPE, veq="", vmax="", vmin="", vshrink=True, compact=False):
     """Import an API module for version and type.
 
     Args:
@@ -513,6 +562,11 @@ def load(api_type=DEFAULT_TYPE, veq="", vmax="", vmin="", vshrink=True):
             down to this length.
 
             Defaults to: True.
+        compact (:obj:`bool`, optional):
+            Load a compact copy of the API object module, see
+            :func:`import_compact`.
+
+            Defaults to: False.
 
     Raises:
         :exc:`exceptions.ModuleError`:
@@ -531,5 +585,112 @@ def load(api_type=DEFAULT_TYPE, veq="", vmax="", vmin="", vshrink=True):
     version = find_version(
         api_type=api_type, veq=veq, vmin=vmin, vmax=vmax, vshrink=vshrink
     )
-    ret = ApiObjects(module_file=version["module_file"])
+    ret = ApiObjects(module_file=version["module_file"], compact=compact)
     return ret
+
+
+def import_compact(module_file):
+    """Import a compact copy of an API object module.
+
+    Args:
+        module_file (:obj:`str`):
+            API Object module file name in import string format.
+
+    Notes:
+        The module is imported a second time under a name with
+        :data:`COMPACT_SUFFIX` added, so the classes from a normal import are
+        left untouched. The classes in the copy are then replaced using
+        :func:`compact_cls` and all references between them are updated.
+
+        Instances of compact ApiItem classes store API attributes in __slots__,
+        any other attributes set on them still go into a __dict__ that is only
+        created when needed.
+
+    Returns:
+        :obj:`object`
+
+    """
+    module_path = "{p}.{f}{s}".format(p=__name__, f=module_file, s=COMPACT_SUFFIX)
+    if module_path in sys.modules:
+        return sys.modules[module_path]
+
+    path = pathlib.Path(__file__).absolute().parent / "{}.py".format(module_file)
+
+    if six.PY2:  # pragma: no cover
+        module = imp.load_source(module_path, format(path))
+    else:
+        spec = importlib.util.spec_from_file_location(module_path, format(path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_path] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            del sys.modules[module_path]
+            raise
+
+    classes = [module.ApiModel, module.ApiItem, module.ApiList]
+    classes += module.ApiItem.__subclasses__() + module.ApiList.__subclasses__()
+
+    cls_map = {}
+    for cls in classes:
+        cls_map[cls] = compact_cls(cls=cls, cls_map=cls_map)
+        setattr(module, cls.__name__, cls_map[cls])
+
+    for cls in cls_map.values():
+        cls.API_COMPLEX = compact_ref(obj=cls.API_COMPLEX, cls_map=cls_map)
+        if issubclass(cls, api_models.ApiItem):
+            cls.API_LIST_CLS = compact_ref(obj=cls.API_LIST_CLS, cls_map=cls_map)
+        if issubclass(cls, api_models.ApiList):
+            cls.API_ITEM_CLS = compact_ref(obj=cls.API_ITEM_CLS, cls_map=cls_map)
+    return module
+
+
+def compact_cls(cls, cls_map):
+    """Create a copy of an API object class that uses __slots__.
+
+    Args:
+        cls (:class:`tantrum.api_models.ApiModel`):
+            Class to copy.
+        cls_map (:obj:`dict`):
+            Map of classes already copied to their copies, used to swap out the
+            bases of cls.
+
+    Returns:
+        :class:`tantrum.api_models.ApiModel`
+
+    """
+    skips = ["__dict__", "__weakref__", "_api_meta"]
+    attrs = {k: v for k, v in cls.__dict__.items() if k not in skips}
+
+    if issubclass(cls, api_models.ApiItem) and cls.API_SIMPLE is not None:
+        slots = [x for x in cls.api_meta().attrs if x not in attrs]
+        attrs["__slots__"] = tuple(slots + ["__dict__"])
+    elif cls.API_SIMPLE is not None:
+        attrs["__slots__"] = ("__dict__",)
+    else:
+        attrs["__slots__"] = ()
+
+    bases = tuple(cls_map.get(x, x) for x in cls.__bases__)
+    return type(cls.__name__, bases, attrs)
+
+
+def compact_ref(obj, cls_map):
+    """Swap classes in obj with their copies in cls_map recursively.
+
+    Args:
+        obj (:obj:`dict` or :obj:`list` or :obj:`tuple` or :obj:`object`):
+            Object to swap classes in.
+        cls_map (:obj:`dict`):
+            Map of classes to their copies.
+
+    Returns:
+        :obj:`dict` or :obj:`list` or :obj:`tuple` or :obj:`object`
+
+    """
+    if isinstance(obj, dict):
+        return {k: compact_ref(obj=v, cls_map=cls_map) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(compact_ref(obj=x, cls_map=cls_map) for x in obj)
+    if isinstance(obj, type):
+        return cls_map.get(obj, obj)
+    return obj
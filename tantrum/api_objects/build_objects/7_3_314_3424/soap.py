@@ -45,6 +45,9 @@ def api_fixes():
     fix = {"cache_info": "CacheInfo"}
     models["AuditDataList"].API_COMPLEX.update(fix)
 
+    for model in models.values():
+        model.api_meta_reset()
+
 
 def expand_cls_globals():
     """Replace str values with global vars for attrs on ApiModel classes.
@@ -353,8 +356,8 @@ class ResultSet(ApiItem):
     API_LIST_API_NAME = "result_sets"
     """:obj:`str`: Name of :attr:`API_LIST_CLS` used in API calls."""
 
-    def __init__(self, **kwargs):
-        """Constructor.
+    def api_init_hook(self):
+        """Construction hook that links columns and rows.
 
         Notes:
             Sets :attr:`Column.API_DATA_SET` so column objects can access rows.
@@ -365,12 +368,7 @@ class ResultSet(ApiItem):
             Sets :attr:`Column.API_IDX` and :attr:`RowColumn.API_IDX` so column
             objects know what their index is without having to do lookups.
 
-        Args:
-            **kwargs:
-                Passed back to parent class.
-
         """
-        super(ResultSet, self).__init__(**kwargs)
         self.cs = ColumnList() if self.cs is None else self.cs
         self.rs = RowList() if self.rs is None else self.rs
         for row in self.rows:
@@ -480,7 +478,7 @@ class Column(ApiItem):
     """Manually defined API object."""
 
     API_DATA_SET = None
-    """:obj:`ResultSet`: Parent of this object, set by :meth:`ResultSet.__init__`."""
+    """:obj:`ResultSet`: Parent object, set by :meth:`ResultSet.api_init_hook`."""
 
     API_IDX = None
     """:obj:`int`: Index of this object in :obj:`ColumnList`."""
@@ -898,7 +896,7 @@ class RowColumn(ApiList):
     """Manually defined API array object."""
 
     API_COLUMN = None
-    """:obj:`Column`: Index correlated column, set by :meth:`ResultSet.__init__`."""
+    """:obj:`Column`: Correlated column, set by :meth:`ResultSet.api_init_hook`."""
 
     API_IDX = None
     """:obj:`int`: Index of this object in :obj:`RowColumnList`."""
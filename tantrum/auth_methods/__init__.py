@@ -8,6 +8,7 @@ from __future__ import unicode_literals
 import abc
 import six
 import re
+import threading
 
 from datetime import datetime, timedelta
 
@@ -140,6 +141,16 @@ class AuthMethod(object):
         """
         raise NotImplementedError  # pragma: no cover
 
+    def in_band_refresh(self, token, **kwargs):
+        """Set a token that was received in an API response.
+
+        Args:
+            token (:obj:`str`):
+                Token received in the response.
+
+        """
+        self.token = token
+
 
 class CommonMixin(object):
     """Shared methods common amongst all :class:`AuthMethod`."""
@@ -150,6 +161,9 @@ class CommonMixin(object):
         login_timeout=5,
         logout_timeout=5,
         expires_after=295,
+        revalidate_after=5,
+        refresh_before=30,
+        trust_received=True,
         lvl="info",
     ):
         """Constructor.
@@ -169,6 +183,21 @@ class CommonMixin(object):
                 Life of received tokens in seconds.
 
                 Defaults to: 295.
+            revalidate_after (:obj:`int`, optional):
+                Validate a token that was not received from the API if it has not
+                been used in this many seconds.
+
+                Defaults to: 5.
+            refresh_before (:obj:`int`, optional):
+                Seconds before expiry that the background refresher validates the
+                token, see :meth:`CommonMixin.start_refresher`.
+
+                Defaults to: 30.
+            trust_received (:obj:`bool`, optional):
+                Trust tokens received from the API until they expire, instead of
+                validating them after revalidate_after.
+
+                Defaults to: True.
             lvl (:obj:`str`, optional):
                 Logging level for this object.
 
@@ -178,8 +207,20 @@ class CommonMixin(object):
         self.log = utils.logs.get_obj_log(obj=self, lvl=lvl)
         """:obj:`logging.Logger`: Log for this object."""
 
-        self.revalidate_after = 5
-        """:obj:`int`: Revalidate token if :attr:`last_used` is higher than this."""
+        self.revalidate_after = revalidate_after
+        """:obj:`int`: Validate a token that was not received from the API if
+        :attr:`last_used_secs` is higher than this."""
+
+        self.refresh_before = refresh_before
+        """:obj:`int`: Seconds before :attr:`expiry_dt` that the background
+        refresher validates the token."""
+
+        self.trust_received = trust_received
+        """:obj:`bool`: Trust tokens received from the API until they expire."""
+
+        self.counts = {"login": 0, "validate": 0, "in_band": 0, "refresh": 0}
+        """:obj:`dict`: Number of logins, validates, tokens received in API
+        responses, and refreshes done by :meth:`refresh`."""
 
         self._http_client = http_client
         self._login_timeout = login_timeout
@@ -187,6 +228,9 @@ class CommonMixin(object):
         self._expires_after = expires_after
         self._last_used = None
         self._token = None
+        self._trusted = False
+        self._lock = threading.RLock()
+        self._refresher = None
         self.token = None
 
     def __str__(self):
@@ -200,6 +244,7 @@ class CommonMixin(object):
             "logged_in={}".format(self.logged_in),
             "last_used_secs={}".format(self.last_used_secs),
             "expiry_dt={}".format(self.expiry_dt),
+            "counts={}".format(self.counts),
         ]
         bits = "({})".format(", ".join(bits))
         cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
@@ -234,7 +279,8 @@ class CommonMixin(object):
             If :attr:`expired` is True, :meth:`login` to get a new one.
 
             If :attr:`logged_in` is True, and :attr:`last_used_secs` is older than
-            :attr:`revalidate_after`, :meth:`validate` to re-validate token.
+            :attr:`revalidate_after`, :meth:`validate` to re-validate token,
+            unless :attr:`trusted` is True.
 
             If :meth:`validate` fails validation, :meth:`login` to get a new one.
 
@@ -242,12 +288,12 @@ class CommonMixin(object):
             :obj:`str`
 
         """
-        if not self.logged_in:
-            self.login(cause="Initial login")
-        elif self.expired:
-            self.login(cause="Re-login due to expired token")
-        else:
-            if self.last_used_secs >= self.revalidate_after:
+        with self._lock:
+            if not self.logged_in:
+                self.login(cause="Initial login")
+            elif self.expired:
+                self.login(cause="Re-login due to expired token")
+            elif not self.trusted and self.last_used_secs >= self.revalidate_after:
                 try:
                     self.validate(cause="Validate existing token")
                 except exceptions.InvalidToken:
@@ -255,7 +301,7 @@ class CommonMixin(object):
                     m = m.format(uid=self.uid)
                     self.log.debug(m)
                     self.login(cause="Re-login due to invalid token")
-        return self._token
+            return self._token
 
     @token.setter
     def token(self, value):
@@ -265,9 +311,55 @@ class CommonMixin(object):
             value (:obj:`str`):
                 Value to set _token to
 
+        Notes:
+            A token set this way is not :attr:`trusted`.
+
         """
         self._token = value
         self._last_used = None if value is None else datetime.utcnow()
+        self._trusted = False
+
+    @property
+    def trusted(self):
+        """Check if the token was received from the API and can be used until it
+        expires without being validated.
+
+        Returns:
+            :obj:`bool`
+
+        """
+        return self._trusted
+
+    def in_band_refresh(self, token, **kwargs):
+        """Set a token that was received in an API response.
+
+        Args:
+            token (:obj:`str`):
+                Token received in the response.
+
+        Notes:
+            The API returns the session in every SOAP response, which proves the
+            token is still valid, so :attr:`token` does not need to
+            :meth:`validate` it before it expires if :attr:`trust_received` is
+            True.
+
+        """
+        with self._lock:
+            self.token = token
+            self._trusted = self.trust_received
+            self.count(action="in_band")
+
+    def count(self, action):
+        """Count an auth action in :attr:`counts` and "auth_total" of
+        :data:`tantrum.utils.metrics.REGISTRY`.
+
+        Args:
+            action (:obj:`str`):
+                Action to count.
+
+        """
+        self.counts[action] = self.counts.get(action, 0) + 1
+        utils.metrics.REGISTRY.incr(name="auth_total", labels={"action": action})
 
     @property
     def token_headers(self):
@@ -301,9 +393,27 @@ class CommonMixin(object):
 
     @property
     def expiry_dt(self):
+        """Get the datetime that the token expires at if it is not used again.
+
+        Returns:
+            :obj:`datetime.datetime`
+
+        """
         delta = timedelta(seconds=self._expires_after)
         return None if not self._last_used else self._last_used + delta
 
+    @property
+    def expires_secs(self):
+        """Get the number of seconds until :attr:`expiry_dt`.
+
+        Returns:
+            :obj:`float`: 0 if no token has been received, negative if expired.
+
+        """
+        if not self._last_used:
+            return 0
+        return (self.expiry_dt - datetime.utcnow()).total_seconds()
+
     @property
     def expired(self):
         """Check if token has expired.
@@ -357,6 +467,8 @@ class CommonMixin(object):
             raise exceptions.LoginError(auth_method=self, response=r)
 
         self.token = r.text
+        self._trusted = self.trust_received
+        self.count(action="login")
         m = "Token received for User ID {uid!r} from {url!r}"
         m = m.format(uid=self.uid, url=r.url)
         self.log.debug(m)
@@ -404,6 +516,7 @@ class CommonMixin(object):
         m = "Token revoked for User ID {uid!r} from {url!r}"
         m = m.format(uid=self.uid, url=r.url)
         self.log.debug(m)
+        self.stop_refresher()
         self.token = None
         return None
 
@@ -449,6 +562,7 @@ class CommonMixin(object):
         m = "All tokens revoked for User ID {uid!r} from {url!r}"
         m = m.format(uid=self.uid, url=r.url)
         self.log.debug(m)
+        self.stop_refresher()
         self.token = None
         return None
 
@@ -494,8 +608,115 @@ class CommonMixin(object):
         m = m.format(uid=self.uid, url=r.url)
         self.log.debug(m)
         self.token = r.text
+        self._trusted = self.trust_received
+        self.count(action="validate")
         return r.text
 
+    def refresh(self, **kwargs):
+        """Validate the token to extend its life, or login if it is invalid.
+
+        Args:
+            **kwargs:
+                cause (:obj:`str`):
+                    String to explain purpose of request.
+
+                    Defaults to: "Refresh token".
+
+        Raises:
+            :exc:`exceptions.NotLoggedInError`:
+                If :attr:`logged_in` is False.
+
+        Returns:
+            :obj:`str`
+
+        """
+        with self._lock:
+            if not self.logged_in:
+                raise exceptions.NotLoggedInError(auth_method=self)
+
+            if self.expired:
+                self.login(cause="Re-login due to expired token")
+            else:
+                try:
+                    self.validate(cause=kwargs.pop("cause", "Refresh token"))
+                except exceptions.InvalidToken:
+                    self.login(cause="Re-login due to invalid token")
+
+            self.count(action="refresh")
+            return self._token
+
+    def start_refresher(self):
+        """Start a background thread that calls :meth:`refresh` when the token is
+        within :attr:`refresh_before` seconds of :attr:`expiry_dt`.
+
+        Notes:
+            Every SOAP response extends the life of the token, so the thread only
+            sends requests when the token is idle, i.e. between long polls, and
+            the next request does not have to wait for a login.
+
+            The thread is stopped by :meth:`stop_refresher`, :meth:`logout`, and
+            :meth:`logout_all`.
+
+        """
+        with self._lock:
+            if self._refresher is not None:
+                return
+
+            stop = threading.Event()
+            thread = threading.Thread(
+                target=self.refresh_loop,
+                kwargs={"stop": stop},
+                name="{}_refresher".format(self.log.name),
+            )
+            thread.daemon = True
+            self._refresher = (thread, stop)
+            thread.start()
+
+        m = "Started token refresher {refresh_before} seconds before expiry"
+        m = m.format(refresh_before=self.refresh_before)
+        self.log.debug(m)
+
+    def stop_refresher(self):
+        """Stop the thread started by :meth:`start_refresher`."""
+        with self._lock:
+            if self._refresher is None:
+                return
+            thread, stop = self._refresher
+            self._refresher = None
+            stop.set()
+
+        if thread is not threading.current_thread():
+            thread.join()
+        self.log.debug("Stopped token refresher")
+
+    def refresh_loop(self, stop):
+        """Call :meth:`refresh` before the token expires until stop is set.
+
+        Args:
+            stop (:obj:`threading.Event`):
+                Event to stop the loop.
+
+        """
+        wait = 0
+        while not stop.wait(wait):
+            wait = self.refresh_before
+            if not self.logged_in:
+                continue
+
+            if self.expires_secs > self.refresh_before:
+                wait = self.expires_secs - self.refresh_before
+                continue
+
+            try:
+                self.refresh(cause="Refresh token before expiry")
+            except Exception as exc:
+                m = "Token refresh failed, will retry in {s} seconds: {exc}"
+                m = m.format(s=self.refresh_before, exc=exc)
+                self.log.warning(m)
+                continue
+
+            wait = max(1, self.expires_secs - self.refresh_before)
+
 
 class Credentials(CommonMixin, AuthMethod):
     """Method that uses credentials to interact with the '/auth' API."""
@@ -510,6 +731,9 @@ class Credentials(CommonMixin, AuthMethod):
         login_timeout=5,
         logout_timeout=5,
         expires_after=295,
+        revalidate_after=5,
+        refresh_before=30,
+        trust_received=True,
         lvl="info",
     ):
         """Constructor.
@@ -541,6 +765,21 @@ class Credentials(CommonMixin, AuthMethod):
                 Life of received tokens in seconds.
 
                 Defaults to: 295.
+            revalidate_after (:obj:`int`, optional):
+                Validate a token that was not received from the API if it has not
+                been used in this many seconds.
+
+                Defaults to: 5.
+            refresh_before (:obj:`int`, optional):
+                Seconds before expiry that the background refresher validates the
+                token, see :meth:`CommonMixin.start_refresher`.
+
+                Defaults to: 30.
+            trust_received (:obj:`bool`, optional):
+                Trust tokens received from the API until they expire, instead of
+                validating them after revalidate_after.
+
+                Defaults to: True.
             lvl (:obj:`str`, optional):
                 Logging level for this object.
 
@@ -559,6 +798,9 @@ class Credentials(CommonMixin, AuthMethod):
             login_timeout=login_timeout,
             logout_timeout=logout_timeout,
             expires_after=expires_after,
+            revalidate_after=revalidate_after,
+            refresh_before=refresh_before,
+            trust_received=trust_received,
             lvl=lvl,
         )
 
@@ -573,6 +815,9 @@ class SessionId(CommonMixin, AuthMethod):
         login_timeout=5,
         logout_timeout=5,
         expires_after=295,
+        revalidate_after=5,
+        refresh_before=30,
+        trust_received=True,
         lvl="info",
     ):
         """Constructor.
@@ -594,6 +839,21 @@ class SessionId(CommonMixin, AuthMethod):
                 Life of received tokens in seconds.
 
                 Defaults to: 295.
+            revalidate_after (:obj:`int`, optional):
+                Validate a token that was not received from the API if it has not
+                been used in this many seconds.
+
+                Defaults to: 5.
+            refresh_before (:obj:`int`, optional):
+                Seconds before expiry that the background refresher validates the
+                token, see :meth:`CommonMixin.start_refresher`.
+
+                Defaults to: 30.
+            trust_received (:obj:`bool`, optional):
+                Trust tokens received from the API until they expire, instead of
+                validating them after revalidate_after.
+
+                Defaults to: True.
             lvl (:obj:`str`, optional):
                 Logging level for this object.
 
@@ -607,6 +867,9 @@ class SessionId(CommonMixin, AuthMethod):
             login_timeout=login_timeout,
             logout_timeout=logout_timeout,
             expires_after=expires_after,
+            revalidate_after=revalidate_after,
+            refresh_before=refresh_before,
+            trust_received=trust_received,
             lvl=lvl,
         )
         self.token = session
@@ -625,7 +888,8 @@ class SessionId(CommonMixin, AuthMethod):
             If :attr:`CommonMixin.logged_in` is True, and
             :attr:`CommonMixin.last_used_secs` is older than
             :attr:`CommonMixin.revalidate_after`,
-            :meth:`CommonMixin.validate` to re-validate token.
+            :meth:`CommonMixin.validate` to re-validate token, unless
+            :attr:`CommonMixin.trusted` is True.
 
             If :meth:`CommonMixin.validate` fails validation, can not login
             to get a new one with just a session.
@@ -634,9 +898,10 @@ class SessionId(CommonMixin, AuthMethod):
             :obj:`str`
 
         """
-        if self.last_used_secs is None or self.last_used >= self.revalidate_after:
-            self.validate(cause="Validate existing token")
-        return self._token
+        with self._lock:
+            if not self.trusted and self.last_used_secs >= self.revalidate_after:
+                self.validate(cause="Validate existing token")
+            return self._token
 
     @token.setter
     def token(self, value):
@@ -648,6 +913,7 @@ class SessionId(CommonMixin, AuthMethod):
 
         """
         self._token = value
+        self._trusted = False
         if value is None:
             self._last_used = None
             self._last_validated = None
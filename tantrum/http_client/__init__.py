@@ -5,7 +5,17 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import collections
+import gzip
+import json
+import os
+import re
+import threading
+import time
+
 import requests
+import six
+import urllib3
 
 from . import exceptions
 from .. import utils
@@ -24,6 +34,14 @@ class HttpClient(object):
         save_history=False,
         log_request=False,
         log_response=False,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        pool_idle_timeout=None,
+        pool_prewarm=0,
+        history_entries=100,
+        history_bytes=104857600,
+        history_path=None,
         lvl="info",
     ):
         """Constructor.
@@ -61,6 +79,45 @@ class HttpClient(object):
                 Log response details to debug level.
 
                 Defaults to: False.
+            pool_connections (:obj:`int`, optional):
+                Number of per host connection pools to cache.
+
+                Defaults to: 10.
+            pool_maxsize (:obj:`int`, optional):
+                Maximum number of connections to keep open to a single host.
+
+                Defaults to: 10.
+            pool_block (:obj:`bool`, optional):
+                If True, wait for a free connection when all connections to a host
+                are in use. If False, open a new connection and discard it after
+                the request if the pool is full.
+
+                Defaults to: False.
+            pool_idle_timeout (:obj:`int` or :obj:`float`, optional):
+                Close and reopen pooled connections that have been idle for longer
+                than this many seconds instead of reusing them. If None, idle
+                connections are reused until the server closes them.
+
+                Defaults to: None.
+            pool_prewarm (:obj:`int`, optional):
+                Number of connections to open to :attr:`url` before the first
+                request is sent, see :meth:`prewarm`.
+
+                Defaults to: 0.
+            history_entries (:obj:`int`, optional):
+                Maximum number of responses to keep in :attr:`HttpClient.history`,
+                see :obj:`History`.
+
+                Defaults to: 100.
+            history_bytes (:obj:`int`, optional):
+                Maximum number of body bytes to keep in :attr:`HttpClient.history`.
+
+                Defaults to: 104857600 (100 MB).
+            history_path (:obj:`str`, optional):
+                Directory to spill responses evicted from :attr:`HttpClient.history` to.
+                If None, evicted responses are dropped.
+
+                Defaults to: None.
 
         Notes:
             If verify is True or None, verification is done using default/built in
@@ -89,8 +146,13 @@ class HttpClient(object):
         """:obj:`requests.PreparedRequest`: Last request sent."""
         self.last_response = None
         """:obj:`requests.Response`: Last response received."""
-        self.history = []
-        """:obj:`list`: History of all responses received."""
+        self.history = History(
+            max_entries=history_entries,
+            max_bytes=history_bytes,
+            spill_path=history_path,
+            lvl=lvl,
+        )
+        """:obj:`History`: History of responses received."""
         self.verify = verify
         """:obj:`bool`: SSL Verification."""
         self.save_last = save_last
@@ -103,6 +165,19 @@ class HttpClient(object):
         """:obj:`bool`: Log responses."""
         self.session = requests.Session()
         """:obj:`requests.Session`: Requests session object."""
+        self.pool_prewarm = pool_prewarm
+        """:obj:`int`: Connections to open before the first request is sent."""
+        self.pool_adapter = PoolAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            idle_timeout=pool_idle_timeout,
+        )
+        """:obj:`PoolAdapter`: Transport adapter mounted on :attr:`session`."""
+        self.session.mount("https://", self.pool_adapter)
+        self.session.mount("http://", self.pool_adapter)
+        self._prewarmed = False
+        self._prewarm_lock = threading.Lock()
 
     @property
     def url(self):
@@ -114,6 +189,16 @@ class HttpClient(object):
         """
         return self.parsed_url.url
 
+    @property
+    def pool_stats(self):
+        """Get the connection pool counters from :attr:`pool_adapter`.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        return self.pool_adapter.stats.to_dict()
+
     def __str__(self):
         """Show object info.
 
@@ -150,6 +235,7 @@ class HttpClient(object):
         log_request=None,
         log_response=None,
         cause="",
+        stream=False,
     ):
         """Create, prepare a request, and then send it.
 
@@ -212,6 +298,11 @@ class HttpClient(object):
                 String to explain purpose of request.
 
                 Defaults to: "".
+            stream (:obj:`bool`, optional):
+                Do not read the response body until it is accessed, use
+                :meth:`requests.Response.iter_content` to read it in chunks.
+
+                Defaults to: False.
 
         Returns:
             :obj:`requests.Response`
@@ -255,15 +346,13 @@ class HttpClient(object):
 
         send_args = {}
         send_args["timeout"] = (self.timeout, timeout)
-        send_args.update(
-            self.session.merge_environment_settings(
-                url=self.url,
-                proxies=None,  # rely on OS env proxies, then self.session.proxies
-                stream=None,  # not using
-                verify=verify,
-                cert=None,  # rely on client cert set in self.session.cert
-            )
-        )
+        send_args.update(self.env_settings(verify=verify, stream=stream))
+
+        if self.pool_prewarm and not self._prewarmed:
+            with self._prewarm_lock:
+                # another thread may have pre-warmed while this one waited
+                if not self._prewarmed:
+                    self.prewarm(verify=verify)
 
         r = self.session.send(prequest, **send_args)
         r.cause = cause
@@ -272,7 +361,6 @@ class HttpClient(object):
             self.last_response = r
 
         if save_history:
-            self.history = getattr(self, "history", [])
             self.history.append(r)
 
         if log_response:
@@ -286,11 +374,86 @@ class HttpClient(object):
                 "cause={r.cause!r}",
             ]
             m = ", ".join(m)
-            m = m.format(r=r, size=len(r.text or ""))
+            if stream:
+                size = r.headers.get("Content-Length", "streamed")
+            else:
+                size = len(r.content or b"")
+            m = m.format(r=r, size=size)
             self.log.debug(m)
 
         return r
 
+    def env_settings(self, verify=None, stream=None):
+        """Get the settings to send requests with from the environment and session.
+
+        Args:
+            verify (:obj:`bool` or :obj:`str`, optional):
+                Enable SSL certification validation.
+                If None uses :attr:`HttpClient.verify`.
+
+                Defaults to: None.
+            stream (:obj:`bool`, optional):
+                Do not read the response body until it is accessed.
+                If None uses :attr:`requests.Session.stream`.
+
+                Defaults to: None.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        return self.session.merge_environment_settings(
+            url=self.url,
+            proxies=None,  # rely on OS env proxies, then self.session.proxies
+            stream=stream,
+            verify=utils.tools.def_none(verify, self.verify),
+            cert=None,  # rely on client cert set in self.session.cert
+        )
+
+    def prewarm(self, count=None, verify=None):
+        """Open connections to :attr:`url` ahead of time and put them in the pool.
+
+        Args:
+            count (:obj:`int`, optional):
+                Number of connections to open.
+                If None uses :attr:`HttpClient.pool_prewarm`.
+
+                Defaults to: None.
+            verify (:obj:`bool` or :obj:`str`, optional):
+                Enable SSL certification validation.
+                If None uses :attr:`HttpClient.verify`.
+
+                Defaults to: None.
+
+        Notes:
+            The TLS handshake for each connection is done here, so the first
+            requests sent afterwards are served by already established connections.
+
+        Returns:
+            :obj:`int`: Number of connections that were opened.
+
+        """
+        count = utils.tools.def_none(count, self.pool_prewarm)
+        settings = self.env_settings(verify=verify)
+        opened = self.pool_adapter.prewarm(
+            url=self.url,
+            count=count,
+            verify=settings["verify"],
+            proxies=settings["proxies"],
+            cert=settings["cert"],
+        )
+        self._prewarmed = True
+
+        m = "Pre-warmed {o} of {c} connections to {url!r}, pool stats: {s}"
+        m = m.format(o=opened, c=count, url=self.url, s=self.pool_stats)
+        self.log.debug(m)
+        return opened
+
+    def close(self):
+        """Close all pooled connections held by :attr:`session`."""
+        self.session.close()
+        self._prewarmed = False
+
     def parse_url(self, url):
         """Parse a URL using UrlParser.
 
@@ -323,6 +486,652 @@ class HttpClient(object):
         )
 
 
+class History(object):
+    """Bounded store of the responses received by :obj:`HttpClient`."""
+
+    REDACT_HEADERS = ["authorization", "cookie", "password", "session", "set-cookie"]
+    """:obj:`list` of :obj:`str`: Lower case names of headers whose values are
+    replaced with "REDACTED" when entries are written to disk."""
+
+    REDACT_TAGS = ["session"]
+    """:obj:`list` of :obj:`str`: Names of XML tags in request and response bodies
+    whose text is replaced with "REDACTED" when entries are written to disk."""
+
+    REDACT_PATHS = ["/auth"]
+    """:obj:`list` of :obj:`str`: URL paths whose request and response bodies are
+    replaced with "REDACTED" when entries are written to disk."""
+
+    def __init__(
+        self, max_entries=100, max_bytes=104857600, spill_path=None, lvl="info"
+    ):
+        """Constructor.
+
+        Args:
+            max_entries (:obj:`int`, optional):
+                Maximum number of responses to keep in memory.
+                If 0, no limit.
+
+                Defaults to: 100.
+            max_bytes (:obj:`int`, optional):
+                Maximum number of request and response body bytes to keep in
+                memory. If 0, no limit.
+
+                Defaults to: 104857600 (100 MB).
+            spill_path (:obj:`str`, optional):
+                Directory to write responses to when they are evicted from memory,
+                see :meth:`spill`. If None, evicted responses are dropped.
+
+                Defaults to: None.
+            lvl (:obj:`str`, optional):
+                Logging level for this object.
+
+                Defaults to: "info".
+
+        Notes:
+            Iterating, indexing and len() only cover the responses still in
+            memory, use :meth:`find` to look up spilled responses as well.
+
+        """
+        self.log = utils.logs.get_obj_log(obj=self, lvl=lvl)
+        """:obj:`logging.Logger`: Log for this object."""
+        self.max_entries = max_entries
+        """:obj:`int`: Maximum number of responses to keep in memory."""
+        self.max_bytes = max_bytes
+        """:obj:`int`: Maximum number of body bytes to keep in memory."""
+        self.spill_path = spill_path
+        """:obj:`str`: Directory to write evicted responses to."""
+        self.size = 0
+        """:obj:`int`: Number of body bytes of the responses in memory."""
+        self.evicted = 0
+        """:obj:`int`: Number of responses evicted from memory."""
+        self.spilled = 0
+        """:obj:`int`: Number of responses written to :attr:`spill_path`."""
+        self._entries = collections.deque()
+        self._evicted = collections.deque()
+        self._lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = [
+            "count={!r}".format(len(self)),
+            "size={!r}".format(self.size),
+            "evicted={!r}".format(self.evicted),
+            "spilled={!r}".format(self.spilled),
+            "spill_path={!r}".format(self.spill_path),
+        ]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    def __len__(self):
+        """Get the number of responses in memory.
+
+        Returns:
+            :obj:`int`
+
+        """
+        return len(self._entries)
+
+    def __iter__(self):
+        """Iterate over the responses in memory, oldest first.
+
+        Yields:
+            :obj:`requests.Response`
+
+        """
+        with self._lock:
+            entries = list(self._entries)
+        for entry in entries:
+            yield entry[2]
+
+    def __getitem__(self, index):
+        """Get a response in memory by index, oldest first.
+
+        Args:
+            index (:obj:`int`):
+                Index of response.
+
+        Returns:
+            :obj:`requests.Response`
+
+        """
+        return self._entries[index][2]
+
+    def append(self, response):
+        """Add a response, evicting the oldest responses that do not fit.
+
+        Args:
+            response (:obj:`requests.Response`):
+                Response to add.
+
+        """
+        timestamp = time.time() - response_elapsed(response=response)
+        size = response_size(response=response)
+        evicted = []
+        with self._lock:
+            self._entries.append((timestamp, size, response))
+            self.size += size
+            while self._entries and self.over_limits():
+                entry = self._entries.popleft()
+                self.size -= entry[1]
+                evicted.append(entry)
+            self.evicted += len(evicted)
+            if self.spill_path:
+                self._evicted.extend(evicted)
+
+        if evicted and self.spill_path:
+            self.spill(block=False)
+
+    def over_limits(self):
+        """Check if the responses in memory are over the limits.
+
+        Returns:
+            :obj:`bool`
+
+        """
+        over_entries = self.max_entries and len(self._entries) > self.max_entries
+        over_bytes = self.max_bytes and self.size > self.max_bytes
+        return bool(over_entries or over_bytes)
+
+    def clear(self):
+        """Drop all responses in memory without spilling them."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def flush(self):
+        """Spill all responses in memory to :attr:`spill_path` and drop them.
+
+        Raises:
+            :exc:`exceptions.ModuleError`:
+                If :attr:`spill_path` is not set.
+
+        """
+        if not self.spill_path:
+            error = "No spill_path set on {o}, can not flush"
+            error = error.format(o=self)
+            raise exceptions.ModuleError(error)
+
+        with self._lock:
+            self._evicted.extend(self._entries)
+            self._entries.clear()
+            self.size = 0
+        self.spill()
+
+    def spill(self, block=True):
+        """Write the evicted responses to the spill file for the cause of each.
+
+        Args:
+            block (:obj:`bool`, optional):
+                Wait for a spill that is already being written by another thread.
+                If False, return right away and leave the evicted responses for
+                that thread to write.
+
+                Defaults to: True.
+
+        Notes:
+            Responses are queued in the order they are evicted and the queue is
+            only written by one thread at a time, so the lines in each file are
+            in the order the responses were evicted. The thread writing the queue
+            keeps going until it is empty, so threads adding responses with
+            :meth:`append` do not wait for the write.
+
+        """
+        while self._spill_lock.acquire(block):
+            try:
+                self.write_evicted()
+            finally:
+                self._spill_lock.release()
+            with self._lock:
+                if not self._evicted:
+                    return
+
+    def write_evicted(self):
+        """Write the queue of evicted responses, see :meth:`spill`.
+
+        Notes:
+            Each response is converted with :meth:`to_har` and appended as one
+            line of JSON to "{cause}.jsonl.gz" in :attr:`spill_path`, so the
+            responses for a cause can be read back without reading the rest.
+
+        """
+        with self._lock:
+            entries = list(self._evicted)
+            self._evicted.clear()
+        if not entries:
+            return
+
+        by_path = collections.OrderedDict()
+        for timestamp, size, response in entries:
+            path = self.get_spill_file(cause=getattr(response, "cause", ""))
+            har = self.to_har(response=response, timestamp=timestamp)
+            line = json.dumps(har, sort_keys=True) + "\n"
+            by_path.setdefault(path, []).append(line.encode("utf-8"))
+
+        if not os.path.isdir(self.spill_path):
+            os.makedirs(self.spill_path)
+        for path, lines in by_path.items():
+            with gzip.open(path, "ab") as fh:
+                fh.write(b"".join(lines))
+            self.spilled += len(lines)
+
+        m = "Spilled {c} responses to {p!r}"
+        m = m.format(c=len(entries), p=self.spill_path)
+        self.log.debug(m)
+
+    def to_har(self, response, timestamp):
+        """Convert a response into a redacted HAR-like entry.
+
+        Args:
+            response (:obj:`requests.Response`):
+                Response to convert.
+            timestamp (:obj:`float`):
+                Epoch time the request was sent.
+
+        Notes:
+            Uses :attr:`REDACT_HEADERS`, :attr:`REDACT_TAGS` and
+            :attr:`REDACT_PATHS`, see :func:`to_har`.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        return to_har(
+            response=response,
+            timestamp=timestamp,
+            redact=self.REDACT_HEADERS,
+            redact_tags=self.REDACT_TAGS,
+            redact_paths=self.REDACT_PATHS,
+        )
+
+    def get_spill_file(self, cause):
+        """Get the path of the spill file for a cause.
+
+        Args:
+            cause (:obj:`str`):
+                Cause of requests.
+
+        Returns:
+            :obj:`str`
+
+        """
+        name = re.sub(r"[^\w.-]+", "_", cause or "").strip("._") or "no_cause"
+        return os.path.join(self.spill_path, "{}.jsonl.gz".format(name))
+
+    def find(self, start=None, end=None, cause=None):
+        """Lazily look up responses by time range and/or cause.
+
+        Args:
+            start (:obj:`float`, optional):
+                Only include requests sent at or after this epoch time.
+
+                Defaults to: None.
+            end (:obj:`float`, optional):
+                Only include requests sent before this epoch time.
+
+                Defaults to: None.
+            cause (:obj:`str`, optional):
+                Only include requests with this cause.
+
+                Defaults to: None.
+
+        Notes:
+            Spilled responses are read one line at a time from the spill files,
+            only the file for cause is read if cause is supplied. Spilled
+            responses are yielded first, see :meth:`iter_spilled`, then the
+            responses still in memory, oldest first.
+
+            Responses are kept in the order they were received, which is not
+            always the order they were sent in, so entries are not sorted by
+            "_timestamp".
+
+        Yields:
+            :obj:`dict`: HAR-like entry of each response, see :func:`to_har`.
+
+        """
+
+        def match(timestamp, entry_cause):
+            if start is not None and timestamp < start:
+                return False
+            if end is not None and timestamp >= end:
+                return False
+            return cause is None or entry_cause == cause
+
+        for har in self.iter_spilled(cause=cause):
+            if match(timestamp=har["_timestamp"], entry_cause=har["_cause"]):
+                yield har
+
+        with self._lock:
+            entries = list(self._entries)
+
+        for timestamp, size, response in entries:
+            if match(timestamp=timestamp, entry_cause=getattr(response, "cause", "")):
+                yield self.to_har(response=response, timestamp=timestamp)
+
+    def iter_spilled(self, cause=None):
+        """Read the entries in the spill files.
+
+        Args:
+            cause (:obj:`str`, optional):
+                Only read the spill file of this cause.
+
+                Defaults to: None.
+
+        Notes:
+            Files are read one after the other, sorted by name, and the entries
+            of each file are yielded in the order they were evicted from memory.
+
+        Yields:
+            :obj:`dict`
+
+        """
+        if not self.spill_path or not os.path.isdir(self.spill_path):
+            return
+
+        if cause is not None:
+            paths = [self.get_spill_file(cause=cause)]
+        else:
+            paths = [
+                os.path.join(self.spill_path, x)
+                for x in sorted(os.listdir(self.spill_path))
+                if x.endswith(".jsonl.gz")
+            ]
+
+        for path in paths:
+            if os.path.isfile(path):
+                for entry in read_spill(path=path):
+                    yield entry
+
+
+class PoolStats(object):
+    """Thread safe counters for connection pool usage."""
+
+    KEYS = ["requests", "hits", "misses", "handshakes", "expired", "discarded"]
+    """:obj:`list` of :obj:`str`: Names of counters tracked."""
+
+    def __init__(self):
+        """Constructor."""
+        self._lock = threading.Lock()
+        self._counts = {k: 0 for k in self.KEYS}
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = ["{}={}".format(k, v) for k, v in self.to_dict().items()]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    def incr(self, key, value=1):
+        """Increment a counter.
+
+        Args:
+            key (:obj:`str`):
+                Counter to increment, one of :attr:`KEYS`.
+            value (:obj:`int`, optional):
+                Amount to increment by.
+
+                Defaults to: 1.
+
+        """
+        with self._lock:
+            self._counts[key] += value
+
+    def reset(self):
+        """Set all counters back to 0."""
+        with self._lock:
+            self._counts = {k: 0 for k in self.KEYS}
+
+    def to_dict(self):
+        """Get a copy of the counters.
+
+        Notes:
+            "hits" are requests sent on an already established connection,
+            "misses" are requests that had to open a new connection, and
+            "handshakes" are the misses that needed a TLS handshake.
+            Connections opened by :meth:`PoolAdapter.prewarm` count as misses.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        with self._lock:
+            return {k: self._counts[k] for k in self.KEYS}
+
+
+class PoolTrackingMixin(object):
+    """Track reuse of connections for a :obj:`urllib3.HTTPConnectionPool`."""
+
+    stats = None
+    """:obj:`PoolStats`: Counters to update, set by :class:`PoolManager`."""
+
+    idle_timeout = None
+    """:obj:`int` or :obj:`float`: Close connections idle this long before reuse."""
+
+    def _get_conn(self, timeout=None):
+        """Get a connection from the pool and track if it was reused."""
+        conn = super(PoolTrackingMixin, self)._get_conn(timeout=timeout)
+        stats = self.stats or PoolStats()
+        connected = getattr(conn, "sock", None) is not None
+
+        idle_since = getattr(conn, "_tantrum_idle_since", None)
+        if connected and self.idle_timeout and idle_since is not None:
+            if time.time() - idle_since >= self.idle_timeout:
+                conn.close()
+                connected = False
+                stats.incr("expired")
+
+        stats.incr("requests")
+        if connected:
+            stats.incr("hits")
+        else:
+            stats.incr("misses")
+            if self.scheme == "https":
+                stats.incr("handshakes")
+        return conn
+
+    def _put_conn(self, conn):
+        """Put a connection back into the pool and track if it was discarded."""
+        if conn is not None:
+            conn._tantrum_idle_since = time.time()
+            pool = getattr(self, "pool", None)
+            if pool is not None and pool.full() and self.stats:
+                self.stats.incr("discarded")
+        return super(PoolTrackingMixin, self)._put_conn(conn)
+
+
+class HTTPConnectionPool(PoolTrackingMixin, urllib3.HTTPConnectionPool):
+    """HTTP connection pool that tracks connection reuse."""
+
+    pass
+
+
+class HTTPSConnectionPool(PoolTrackingMixin, urllib3.HTTPSConnectionPool):
+    """HTTPS connection pool that tracks connection reuse."""
+
+    pass
+
+
+class PoolManager(urllib3.PoolManager):
+    """Pool manager that creates connection pools that track connection reuse."""
+
+    def __init__(self, stats, idle_timeout=None, **kwargs):
+        """Constructor.
+
+        Args:
+            stats (:obj:`PoolStats`):
+                Counters to update from each connection pool.
+            idle_timeout (:obj:`int` or :obj:`float`, optional):
+                Close connections idle this long before reuse.
+
+                Defaults to: None.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :obj:`urllib3.PoolManager`.
+
+        """
+        super(PoolManager, self).__init__(**kwargs)
+        self.stats = stats
+        self.idle_timeout = idle_timeout
+        self.pool_classes_by_scheme = {
+            "http": HTTPConnectionPool,
+            "https": HTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        """Create a new connection pool and hand it :attr:`stats`."""
+        pool = super(PoolManager, self)._new_pool(
+            scheme, host, port, request_context=request_context
+        )
+        pool.stats = self.stats
+        pool.idle_timeout = self.idle_timeout
+        return pool
+
+
+class PoolAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter with connection reuse tracking and pre-warming."""
+
+    __attrs__ = requests.adapters.HTTPAdapter.__attrs__ + ["idle_timeout"]
+
+    def __init__(self, idle_timeout=None, **kwargs):
+        """Constructor.
+
+        Args:
+            idle_timeout (:obj:`int` or :obj:`float`, optional):
+                Close connections idle this long before reuse.
+
+                Defaults to: None.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :obj:`requests.adapters.HTTPAdapter`.
+
+        """
+        self.stats = PoolStats()
+        """:obj:`PoolStats`: Connection reuse counters for all pools."""
+        self.idle_timeout = idle_timeout
+        """:obj:`int` or :obj:`float`: Close connections idle this long."""
+        super(PoolAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        """Initialize a :obj:`PoolManager` instead of a :obj:`urllib3.PoolManager`."""
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.stats = getattr(self, "stats", None) or PoolStats()
+        self.poolmanager = PoolManager(
+            stats=self.stats,
+            idle_timeout=getattr(self, "idle_timeout", None),
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs
+        )
+
+    def get_pool(self, url, verify=True, proxies=None, cert=None):
+        """Get the connection pool that requests to url will be sent with.
+
+        Args:
+            url (:obj:`str`):
+                URL to get connection pool for.
+            verify (:obj:`bool` or :obj:`str`, optional):
+                SSL verification setting used for requests.
+
+                Defaults to: True.
+            proxies (:obj:`dict`, optional):
+                Proxies used for requests.
+
+                Defaults to: None.
+            cert (:obj:`str` or :obj:`tuple`, optional):
+                Client certificate used for requests.
+
+                Defaults to: None.
+
+        Returns:
+            :obj:`urllib3.HTTPConnectionPool`
+
+        """
+        if hasattr(self, "get_connection_with_tls_context"):
+            request = requests.Request(method="get", url=url).prepare()
+            return self.get_connection_with_tls_context(
+                request=request, verify=verify, proxies=proxies, cert=cert
+            )
+        pool = self.get_connection(url, proxies)  # pragma: no cover
+        self.cert_verify(pool, url, verify, cert)  # pragma: no cover
+        return pool  # pragma: no cover
+
+    def prewarm(self, url, count, verify=True, proxies=None, cert=None):
+        """Open connections to url and put them in the pool.
+
+        Args:
+            url (:obj:`str`):
+                URL to open connections to.
+            count (:obj:`int`):
+                Number of connections to open, limited to the pool max size.
+            verify (:obj:`bool` or :obj:`str`, optional):
+                SSL verification setting used for requests.
+
+                Defaults to: True.
+            proxies (:obj:`dict`, optional):
+                Proxies used for requests.
+
+                Defaults to: None.
+            cert (:obj:`str` or :obj:`tuple`, optional):
+                Client certificate used for requests.
+
+                Defaults to: None.
+
+        Returns:
+            :obj:`int`: Number of connections that were opened.
+
+        """
+        count = min(count or 0, self._pool_maxsize)
+        if not count:
+            return 0
+
+        pool = self.get_pool(url=url, verify=verify, proxies=proxies, cert=cert)
+        conns = []
+        opened = 0
+        try:
+            for _ in range(count):
+                conn = pool._get_conn()
+                conns.append(conn)
+                if getattr(conn, "sock", None) is None:
+                    conn.connect()
+                    opened += 1
+        finally:
+            for conn in conns:
+                pool._put_conn(conn)
+        return opened
+
+
 class UrlParser(object):
     """Parse a URL and ensure it has the neccessary bits."""
 
@@ -577,3 +1386,192 @@ class UrlParser(object):
 
         """
         return requests.compat.urlunparse(p)
+
+
+def response_elapsed(response):
+    """Get the seconds between sending a request and receiving its response.
+
+    Args:
+        response (:obj:`requests.Response`):
+            Response to get elapsed seconds of.
+
+    Returns:
+        :obj:`float`
+
+    """
+    elapsed = getattr(response, "elapsed", None)
+    return elapsed.total_seconds() if elapsed else 0.0
+
+
+def response_content(response):
+    """Get the body of a response without reading a streamed body.
+
+    Args:
+        response (:obj:`requests.Response`):
+            Response to get body of.
+
+    Returns:
+        :obj:`bytes`: None if the body has not been read yet.
+
+    """
+    if hasattr(response, "_content"):
+        # requests.Response sets _content to False until the body is read
+        content = response._content
+        return None if content is False else content or b""
+    return getattr(response, "content", None) or b""
+
+
+def response_size(response):
+    """Get the number of bytes in the bodies of a response and its request.
+
+    Args:
+        response (:obj:`requests.Response`):
+            Response to get size of.
+
+    Returns:
+        :obj:`int`
+
+    """
+    content = response_content(response=response) or b""
+    body = getattr(response.request, "body", None) or b""
+    return len(content) + len(body)
+
+
+def to_text(value):
+    """Decode bytes as UTF-8 for :func:`to_har`.
+
+    Args:
+        value (:obj:`bytes` or :obj:`str`):
+            Value to decode.
+
+    Returns:
+        :obj:`str`
+
+    """
+    if isinstance(value, six.binary_type):
+        return value.decode("utf-8", "replace")
+    return value or ""
+
+
+def to_har(response, timestamp, redact=None, redact_tags=None, redact_paths=None):
+    """Convert a response into a HAR-like entry.
+
+    Args:
+        response (:obj:`requests.Response`):
+            Response to convert.
+        timestamp (:obj:`float`):
+            Epoch time the request was sent.
+        redact (:obj:`list` of :obj:`str`, optional):
+            Lower case names of headers to replace the values of with "REDACTED".
+
+            Defaults to: None.
+        redact_tags (:obj:`list` of :obj:`str`, optional):
+            Names of XML tags in the request and response bodies to replace the
+            text of with "REDACTED", see :func:`redact_xml_tags`.
+
+            Defaults to: None.
+        redact_paths (:obj:`list` of :obj:`str`, optional):
+            URL paths to replace the request and response bodies of with
+            "REDACTED", i.e. "/auth" whose response body is a session token.
+
+            Defaults to: None.
+
+    Notes:
+        Follows the layout of a HAR 1.2 entry with the fields tantrum has, plus
+        "_cause" and "_timestamp" for :meth:`History.find`. A streamed body that
+        was not read is not read, its text is empty and its size is -1.
+
+    Returns:
+        :obj:`dict`
+
+    """
+    redact = redact or []
+    request = response.request
+
+    def to_headers(headers):
+        return [
+            {"name": k, "value": "REDACTED" if k.lower() in redact else to_text(v)}
+            for k, v in (headers or {}).items()
+        ]
+
+    def to_body(body):
+        if redact_path:
+            return "REDACTED"
+        return redact_xml_tags(text=to_text(body), tags=redact_tags)
+
+    started = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(timestamp))
+    started += ".{:03d}Z".format(int(timestamp % 1 * 1000))
+    path = six.moves.urllib.parse.urlparse(request.url or "").path.rstrip("/")
+    redact_path = path in [x.rstrip("/") for x in redact_paths or []]
+    request_body = to_text(getattr(request, "body", None))
+    content = response_content(response=response)
+    response_headers = getattr(response, "headers", None) or {}
+
+    return {
+        "startedDateTime": started,
+        "time": int(response_elapsed(response=response) * 1000),
+        "request": {
+            "method": request.method,
+            "url": request.url,
+            "headers": to_headers(getattr(request, "headers", None)),
+            "postData": {"text": to_body(request_body)},
+            "bodySize": len(request_body),
+        },
+        "response": {
+            "status": response.status_code,
+            "statusText": response.reason,
+            "headers": to_headers(response_headers),
+            "content": {
+                "size": -1 if content is None else len(content),
+                "mimeType": response_headers.get("Content-Type", ""),
+                "text": to_body(content),
+            },
+        },
+        "_cause": getattr(response, "cause", ""),
+        "_timestamp": timestamp,
+    }
+
+
+def redact_xml_tags(text, tags=None):
+    """Replace the text of XML tags with "REDACTED".
+
+    Args:
+        text (:obj:`str`):
+            Text to redact.
+        tags (:obj:`list` of :obj:`str`, optional):
+            Names of tags to redact, i.e. "session".
+
+            Defaults to: None.
+
+    Returns:
+        :obj:`str`
+
+    """
+    for tag in tags or []:
+        if tag not in text:
+            continue
+        pattern = r"(<{t}>).*?(</{t}>)".format(t=re.escape(tag))
+        text = re.sub(pattern, r"\1REDACTED\2", text, flags=re.S)
+    return text
+
+
+def read_spill(path):
+    """Read the entries in a spill file written by :meth:`History.spill`.
+
+    Args:
+        path (:obj:`str`):
+            Path of spill file.
+
+    Notes:
+        A partly written entry at the end of the file is skipped.
+
+    Yields:
+        :obj:`dict`
+
+    """
+    with gzip.open(path, "rb") as fh:
+        try:
+            for line in fh:
+                yield json.loads(line.decode("utf-8"))
+        except (EOFError, ValueError):
+            return
@@ -0,0 +1,633 @@
+# -*- coding: utf-8 -*-
+"""Client for making HTTP requests with asyncio."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import datetime
+import ssl
+
+import requests
+
+from . import exceptions
+from . import History
+from . import UrlParser
+from .. import utils
+from .. import version
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncHttpClient(object):
+    """Convenience class for aiohttp package."""
+
+    def __init__(
+        self,
+        url,
+        verify=True,
+        timeout=5,
+        save_last=False,
+        save_history=False,
+        log_request=False,
+        log_response=False,
+        pool_maxsize=100,
+        pool_maxsize_per_host=0,
+        pool_idle_timeout=15,
+        history_entries=100,
+        history_bytes=104857600,
+        history_path=None,
+        lvl="info",
+    ):
+        """Constructor.
+
+        Args:
+            url (:obj:`str`):
+                URL to use.
+            timeout (:obj:`int`, optional):
+                Connect timeout to use for requests.
+
+                Defaults to: 5.
+            lvl (:obj:`str`, optional):
+                Logging level for this object.
+
+                Defaults to: "info".
+            verify (:obj:`bool` or :obj:`str`, optional):
+                Enable/Disable SSL certificate validation using built in CAs,
+                or a path to custom cert.
+
+                Defaults to: True.
+            save_last (:obj:`bool`, optional):
+                Save last request to :attr:`AsyncHttpClient.last_request` and last
+                response to :attr:`AsyncHttpClient.last_response`.
+
+                Defaults to: False.
+            save_history (:obj:`bool`, optional):
+                Append last response to :attr:`AsyncHttpClient.history`.
+
+                Defaults to: False.
+            log_request (:obj:`bool`, optional):
+                Log request details to debug level.
+
+                Defaults to: False.
+            log_response (:obj:`bool`, optional):
+                Log response details to debug level.
+
+                Defaults to: False.
+            pool_maxsize (:obj:`int`, optional):
+                Maximum number of connections open at once, 0 for no limit.
+
+                Defaults to: 100.
+            pool_maxsize_per_host (:obj:`int`, optional):
+                Maximum number of connections open at once to a single host,
+                0 for no limit.
+
+                Defaults to: 0.
+            pool_idle_timeout (:obj:`int` or :obj:`float`, optional):
+                Close pooled connections that have been idle for this many seconds.
+
+                Defaults to: 15.
+            history_entries (:obj:`int`, optional):
+                Maximum number of responses to keep in :attr:`AsyncHttpClient.history`,
+                see :obj:`tantrum.http_client.History`.
+
+                Defaults to: 100.
+            history_bytes (:obj:`int`, optional):
+                Maximum number of body bytes to keep in :attr:`AsyncHttpClient.history`.
+
+                Defaults to: 104857600 (100 MB).
+            history_path (:obj:`str`, optional):
+                Directory to spill responses evicted from
+                :attr:`AsyncHttpClient.history` to. If None, evicted responses are
+                dropped.
+
+                Defaults to: None.
+
+        Raises:
+            :exc:`exceptions.ModuleError`:
+                If the aiohttp package is not installed.
+
+        Notes:
+            The aiohttp session is created on the first request, so it is bound to
+            the event loop that sends the first request. Call :meth:`close`
+            or use this object as an async context manager to close it.
+
+        """
+        if aiohttp is None:
+            error = "The aiohttp package is required to use {c}"
+            error = error.format(c=self.__class__.__name__)
+            raise exceptions.ModuleError(error)
+
+        self.log = utils.logs.get_obj_log(obj=self, lvl=lvl)
+        """:obj:`logging.Logger`: Log for this object."""
+        self.timeout = timeout
+        """:obj:`int`: Connect timeout used for all requests."""
+        self.parsed_url = self.parse_url(url)
+        """:obj:`tantrum.http_client.UrlParser`: Parsed version of URL."""
+        self.last_request = None
+        """:obj:`Request`: Last request sent."""
+        self.last_response = None
+        """:obj:`Response`: Last response received."""
+        self.history = History(
+            max_entries=history_entries,
+            max_bytes=history_bytes,
+            spill_path=history_path,
+            lvl=lvl,
+        )
+        """:obj:`tantrum.http_client.History`: History of responses received."""
+        self.verify = verify
+        """:obj:`bool`: SSL Verification."""
+        self.save_last = save_last
+        """:obj:`bool`: Save requests/responses to last_request/last_response."""
+        self.save_history = save_history
+        """:obj:`bool`: Append requests/responses to history."""
+        self.log_request = log_request
+        """:obj:`bool`: Log requests."""
+        self.log_response = log_response
+        """:obj:`bool`: Log responses."""
+        self.pool_maxsize = pool_maxsize
+        """:obj:`int`: Maximum number of connections open at once."""
+        self.pool_maxsize_per_host = pool_maxsize_per_host
+        """:obj:`int`: Maximum number of connections open at once to a host."""
+        self.pool_idle_timeout = pool_idle_timeout
+        """:obj:`int` or :obj:`float`: Close connections idle this long."""
+        self.session = None
+        """:obj:`aiohttp.ClientSession`: Session object, created on first request."""
+        self._ssl_contexts = {}
+
+    @property
+    def url(self):
+        """Get the URL string from :attr:`AsyncHttpClient.parsed_url`.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.parsed_url.url
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = ["url={!r}".format(self.url)]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    async def __aenter__(self):
+        """Support async with.
+
+        Returns:
+            :obj:`AsyncHttpClient`
+
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        """Close :attr:`session` on exit of async with."""
+        await self.close()
+
+    async def __call__(
+        self,
+        method="get",
+        path="",
+        data=None,
+        timeout=5,
+        params=None,
+        headers=None,
+        b64_headers=None,
+        verify=None,
+        save_last=None,
+        save_history=None,
+        log_request=None,
+        log_response=None,
+        cause="",
+    ):
+        """Create a request, send it, and read the response body.
+
+        Args:
+            method (:obj:`str`, optional):
+                Method to use.
+
+                Defaults to: "get".
+            path (:obj:`str`, optional):
+                Path to append to :attr:`AsyncHttpClient.url` for this request.
+
+                Defaults to: "".
+            data (:obj:`str`, optional):
+                Data to send with POST.
+
+                Defaults to: None.
+            timeout (:obj:`int`, optional):
+                Response timeout.
+
+                Defaults to: 5.
+            params (:obj:`dict`, optional):
+                URL parameters.
+
+                Defaults to: None.
+            headers (:obj:`dict`, optional):
+                Headers.
+
+                Defaults to: None.
+            b64_headers (:obj:`list` of :obj:`str`, optional):
+                Headers to base 64 encode.
+
+                Defaults to: None.
+            verify (:obj:`bool` or :obj:`str`, optional):
+                Enable SSL certification validation.
+                If None uses :attr:`AsyncHttpClient.verify`.
+
+                Defaults to: None.
+            save_last (:obj:`bool`, optional):
+                Save last request to :attr:`AsyncHttpClient.last_request` and last
+                response to :attr:`AsyncHttpClient.last_response`.
+                If None uses :attr:`AsyncHttpClient.save_last`.
+
+                Defaults to: None.
+            save_history (:obj:`bool`, optional):
+                Append last response to :attr:`AsyncHttpClient.history`.
+                If None uses :attr:`AsyncHttpClient.save_history`.
+
+                Defaults to: None.
+            log_request (:obj:`bool`, optional):
+                Log request details to debug level.
+                If None uses :attr:`AsyncHttpClient.log_request`.
+
+                Defaults to: None.
+            log_response (:obj:`bool`, optional):
+                Log response details to debug level.
+                If None uses :attr:`AsyncHttpClient.log_response`.
+
+                Defaults to: None.
+            cause (:obj:`str`, optional):
+                String to explain purpose of request.
+
+                Defaults to: "".
+
+        Returns:
+            :obj:`Response`
+
+        """
+        b64 = b64_headers or []
+        headers = headers or {}
+        headers = {k: v for k, v in headers.items()}
+
+        verify = utils.tools.def_none(verify, self.verify)
+        save_last = utils.tools.def_none(save_last, self.save_last)
+        save_history = utils.tools.def_none(save_history, self.save_history)
+        log_request = utils.tools.def_none(log_request, self.log_request)
+        log_response = utils.tools.def_none(log_response, self.log_response)
+
+        h = {}
+        h.update(headers)
+        h.setdefault("User-Agent", self.user_agent)
+        h.update({k: utils.tools.b64_encode(v) for k, v in h.items() if k in b64})
+
+        request = Request(
+            method=method.upper(),
+            url=requests.compat.urljoin(self.url, path),
+            body=data,
+            headers=h,
+            cause=cause,
+        )
+
+        if save_last:
+            self.last_request = request
+
+        if log_request:
+            m = ["request sent: url={p.url!r}", "method={p.method!r}", "size={size}"]
+            m = ", ".join(m)
+            m = m.format(p=request, size=len(request.body or ""))
+            self.log.debug(m)
+
+        send_args = {}
+        send_args["data"] = request.body
+        send_args["headers"] = request.headers
+        send_args["params"] = params
+        send_args["ssl"] = self.ssl_context(verify=verify)
+        send_args["timeout"] = aiohttp.ClientTimeout(
+            sock_connect=self.timeout, sock_read=timeout
+        )
+
+        session = self.get_session()
+        start = datetime.datetime.utcnow()
+        async with session.request(request.method, request.url, **send_args) as resp:
+            content = await resp.read()
+            r = Response(
+                request=request,
+                url=format(resp.url),
+                status_code=resp.status,
+                reason=resp.reason,
+                headers=dict(resp.headers),
+                content=content,
+                encoding=resp.get_encoding() if content else "utf-8",
+                elapsed=datetime.datetime.utcnow() - start,
+                cause=cause,
+            )
+
+        if save_last:
+            self.last_response = r
+
+        if save_history:
+            self.history.append(r)
+
+        if log_response:
+            m = [
+                "response received: url={r.url!r}",
+                "method={r.request.method!r}",
+                "size={size}",
+                "status={r.status_code!r}",
+                "reason={r.reason!r}",
+                "elapsed={r.elapsed}",
+                "cause={r.cause!r}",
+            ]
+            m = ", ".join(m)
+            m = m.format(r=r, size=len(r.content or b""))
+            self.log.debug(m)
+
+        return r
+
+    def get_session(self):
+        """Get :attr:`session`, creating it if it does not exist yet.
+
+        Returns:
+            :obj:`aiohttp.ClientSession`
+
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize,
+                limit_per_host=self.pool_maxsize_per_host,
+                keepalive_timeout=self.pool_idle_timeout,
+            )
+            self.session = aiohttp.ClientSession(connector=connector, trust_env=True)
+        return self.session
+
+    def ssl_context(self, verify):
+        """Get the ssl argument to use for a verify setting.
+
+        Args:
+            verify (:obj:`bool` or :obj:`str`):
+                Enable/Disable SSL certificate validation using built in CAs,
+                or a path to custom cert.
+
+        Returns:
+            :obj:`ssl.SSLContext` or :obj:`bool`
+
+        """
+        if verify is False:
+            return False
+        if verify in [True, None]:
+            return True
+        if verify not in self._ssl_contexts:
+            self._ssl_contexts[verify] = ssl.create_default_context(cafile=verify)
+        return self._ssl_contexts[verify]
+
+    async def close(self):
+        """Close :attr:`session` and all of its connections."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    def parse_url(self, url):
+        """Parse a URL using UrlParser.
+
+        Args:
+            url (:obj:`str`):
+                URL to parse.
+
+        Returns:
+            :obj:`tantrum.http_client.UrlParser`
+
+        """
+        parsed_url = UrlParser(url=url, default_scheme="https")
+        m = "Parsed url {old!r} into {new!r} using {parsed}"
+        m = m.format(old=url, new=parsed_url.url, parsed=parsed_url)
+        self.log.debug(m)
+        return parsed_url
+
+    @property
+    def user_agent(self):
+        """Build a user agent string for use in headers.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return "{pkg}.{name}/{ver}".format(
+            pkg=__name__.split(".")[0],
+            name=self.__class__.__name__,
+            ver=version.__version__,
+        )
+
+
+class Request(object):
+    """Request sent by :obj:`AsyncHttpClient`."""
+
+    def __init__(self, method, url, body, headers, cause=""):
+        """Constructor.
+
+        Args:
+            method (:obj:`str`):
+                Method used.
+            url (:obj:`str`):
+                Full URL used.
+            body (:obj:`str`):
+                Body sent.
+            headers (:obj:`dict`):
+                Headers sent.
+            cause (:obj:`str`, optional):
+                String to explain purpose of request.
+
+                Defaults to: "".
+
+        """
+        self.method = method
+        """:obj:`str`: Method used."""
+        self.url = url
+        """:obj:`str`: Full URL used."""
+        self.body = body
+        """:obj:`str`: Body sent."""
+        self.headers = headers
+        """:obj:`dict`: Headers sent."""
+        self.cause = cause
+        """:obj:`str`: String to explain purpose of request."""
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = ["method={!r}".format(self.method), "url={!r}".format(self.url)]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+
+class Response(object):
+    """Fully read response received by :obj:`AsyncHttpClient`.
+
+    Notes:
+        Exposes the same attributes of :obj:`requests.Response` that
+        :mod:`tantrum.adapters` and :mod:`tantrum.results` use, so results
+        can be deserialized the same way for both clients.
+
+    """
+
+    def __init__(
+        self,
+        request,
+        url,
+        status_code,
+        reason,
+        headers,
+        content,
+        encoding="utf-8",
+        elapsed=None,
+        cause="",
+    ):
+        """Constructor.
+
+        Args:
+            request (:obj:`Request`):
+                Request that this response is for.
+            url (:obj:`str`):
+                Final URL of response.
+            status_code (:obj:`int`):
+                Status code of response.
+            reason (:obj:`str`):
+                Reason of status code.
+            headers (:obj:`dict`):
+                Headers of response.
+            content (:obj:`bytes`):
+                Body of response.
+            encoding (:obj:`str`, optional):
+                Encoding to use for :attr:`text`.
+
+                Defaults to: "utf-8".
+            elapsed (:obj:`datetime.timedelta`, optional):
+                Time between sending the request and reading the response body.
+
+                Defaults to: None.
+            cause (:obj:`str`, optional):
+                String to explain purpose of request.
+
+                Defaults to: "".
+
+        """
+        self.request = request
+        """:obj:`Request`: Request that this response is for."""
+        self.url = url
+        """:obj:`str`: Final URL of response."""
+        self.status_code = status_code
+        """:obj:`int`: Status code of response."""
+        self.reason = reason
+        """:obj:`str`: Reason of status code."""
+        self.headers = headers
+        """:obj:`dict`: Headers of response."""
+        self.content = content
+        """:obj:`bytes`: Body of response."""
+        self.encoding = encoding
+        """:obj:`str`: Encoding to use for :attr:`text`."""
+        self.elapsed = elapsed or datetime.timedelta()
+        """:obj:`datetime.timedelta`: Time between request and response."""
+        self.cause = cause
+        """:obj:`str`: String to explain purpose of request."""
+        self._text = None
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = [
+            "status_code={!r}".format(self.status_code),
+            "url={!r}".format(self.url),
+        ]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    @property
+    def text(self):
+        """Get :attr:`content` decoded using :attr:`encoding`.
+
+        Returns:
+            :obj:`str`
+
+        """
+        if self._text is None:
+            self._text = (self.content or b"").decode(self.encoding, "replace")
+        return self._text
+
+    def json(self):
+        """Get :attr:`text` deserialized from JSON.
+
+        Returns:
+            :obj:`object`
+
+        """
+        return requests.compat.json.loads(self.text)
+
+
+async def gather_limited(coros, limit=100):
+    """Await coroutines concurrently with at most limit of them in flight.
+
+    Args:
+        coros (:obj:`list` of :obj:`coroutine`):
+            Coroutines to await.
+        limit (:obj:`int`, optional):
+            Maximum number of coroutines to have in flight at once.
+
+            Defaults to: 100.
+
+    Returns:
+        :obj:`list`: Return of each coroutine in the same order as coros.
+
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*[run(coro) for coro in coros])
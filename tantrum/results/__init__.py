@@ -6,11 +6,16 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import abc
+import functools
+import itertools
 import re
 import six
 
+from xml.etree import ElementTree
+
 import xmltodict
 
+from . import columnar
 from . import exceptions
 from .. import utils
 
@@ -21,7 +26,7 @@ class Result(object):
 
     @classmethod
     @abc.abstractmethod
-    def from_response(cls, api_objects, response, lvl="info"):
+    def from_response(cls, api_objects, response, lvl="info", **kwargs):
         """Create :obj:`Result` from :obj:`requests.Response`.
 
         Args:
@@ -33,6 +38,9 @@ class Result(object):
                 Logging level.
 
                 Defaults to: "info".
+            **kwargs:
+                rest of kwargs:
+                    Request metadata known by the adapter that sent the request.
 
         Returns:
             :obj:`Result`
@@ -197,7 +205,7 @@ class Result(object):
         """Deserialize string into a python object.
 
         Args:
-            text (:obj:`str`):
+            text (:obj:`str` or :obj:`bytes`):
                 String to decode into python object
             src (:obj:`str`):
                 Where text came from, used in error text.
@@ -233,6 +241,9 @@ class Soap(Result):
 
     DATA_ROUTES = ["GetResultInfo", "GetResultData", "GetMergedResultData"]
 
+    RETAIN = ["all", "parsed", "api"]
+    """:obj:`list` of :obj:`str`: Valid retention policies, see :meth:`release`."""
+
     def __init__(
         self,
         api_objects,
@@ -243,13 +254,16 @@ class Soap(Result):
         status_code,
         origin=None,
         lvl="info",
+        command=None,
+        request_object=None,
+        retain="all",
     ):
         """Constructor.
 
         Args:
             api_objects (:obj:`tantrum.api_objects.ApiObjects`):
                 API Objects Container to use.
-            response_body (:obj:`str`):
+            response_body (:obj:`bytes` or :obj:`str`):
                 Response body received from Tanium API.
             request_body (:obj:`str`):
                 Request body sent to Tanium API.
@@ -267,12 +281,47 @@ class Soap(Result):
                 Logging level.
 
                 Defaults to: "info".
+            command (:obj:`str`, optional):
+                Command sent in request to Tanium API. If None, it is
+                deserialized from request_body when needed.
+
+                Defaults to: None.
+            request_object (:obj:`dict`, optional):
+                Serialized object(s) sent in request to Tanium API. If None, they
+                are deserialized from request_body when needed.
+
+                Defaults to: None.
+            retain (:obj:`str`, optional):
+                What to keep once :meth:`data_api` or :meth:`object_api` has run,
+                one of :attr:`RETAIN`, see :meth:`release`.
+
+                Defaults to: "all".
+
+        Raises:
+            :exc:`exceptions.ModuleError`:
+                If retain is not one of :attr:`RETAIN`.
 
         """
+        if retain not in self.RETAIN:
+            error = "Invalid retain {r!r}, must be one of {vr}"
+            error = error.format(r=retain, vr=self.RETAIN)
+            raise exceptions.ModuleError(error)
+
         self.log = utils.logs.get_obj_log(obj=self, lvl=lvl)
         """:obj:`logging.Logger`: Log for this object."""
+        self.retain = retain
+        """:obj:`str`: What to keep once :meth:`data_api` or :meth:`object_api` has
+        run, see :meth:`release`."""
+        self.released = None
+        """:obj:`str`: Retention policy applied by :meth:`release`, None if nothing
+        has been released."""
+        self.api_obj = None
+        """:obj:`tantrum.api_models.ApiModel`: Object returned by the last call to
+        :meth:`data_api` or :meth:`object_api`."""
         self._api_objects = api_objects
-        self._response_body_str = response_body
+        self._command = command
+        self._request_object = request_object
+        self._response_body = response_body
         self._request_body_str = request_body
         self._method = method
         self._url = url
@@ -280,6 +329,9 @@ class Soap(Result):
         self._cache = {}
         self.origin = origin
         """:obj:`requests.Response`: Original response object."""
+        self.cause = getattr(origin, "cause", "")
+        """:obj:`str`: Cause of the request of :attr:`origin`, used as a label of
+        metrics."""
 
     def __str__(self):
         """Show object info.
@@ -308,7 +360,15 @@ class Soap(Result):
         return self.__str__()
 
     @classmethod
-    def from_response(cls, api_objects, response, lvl="info"):
+    def from_response(
+        cls,
+        api_objects,
+        response,
+        lvl="info",
+        command=None,
+        request_object=None,
+        retain="all",
+    ):
         """Create Result from a requests response object.
 
         Args:
@@ -320,6 +380,24 @@ class Soap(Result):
                 Logging level.
 
                 Defaults to: "info".
+            command (:obj:`str`, optional):
+                Command sent in request to Tanium API.
+
+                Defaults to: None.
+            request_object (:obj:`dict`, optional):
+                Serialized object(s) sent in request to Tanium API.
+
+                Defaults to: None.
+            retain (:obj:`str`, optional):
+                What to keep once the response has been deserialized, see
+                :meth:`Soap.release`.
+
+                Defaults to: "all".
+
+        Notes:
+            The body is taken from response.content so the result shares the bytes
+            already held by the response instead of decoding them into a second
+            copy, see :attr:`Soap.response_body_bytes`.
 
         Returns:
             :obj:`Result`
@@ -327,13 +405,16 @@ class Soap(Result):
         """
         return cls(
             api_objects=api_objects,
-            response_body=response.text,
+            response_body=response.content,
             request_body=response.request.body,
             method=response.request.method,
             url=response.url,
             status_code=response.status_code,
             origin=response,
             lvl=lvl,
+            command=command,
+            request_object=request_object,
+            retain=retain,
         )
 
     @property
@@ -386,17 +467,41 @@ class Soap(Result):
         """
         return self._request_body_str or ""
 
+    @property
+    def response_body_bytes(self):
+        """Get the full response body as bytes.
+
+        Notes:
+            If the body was supplied as bytes, the same object is returned without
+            being copied.
+
+        Returns:
+            :obj:`bytes`
+
+        """
+        body = self._response_body or b""
+        if isinstance(body, six.text_type):
+            body = body.encode("utf-8")
+        return body
+
     @property
     def response_body_str(self):
         """Get the full response body.
 
+        Notes:
+            If the body was supplied as bytes, it is decoded as UTF-8 every time
+            this is accessed and the decoded copy is not kept.
+
         Returns:
             :obj:`str`
 
         """
-        return self._response_body_str or ""
+        body = self._response_body or ""
+        if isinstance(body, six.binary_type):
+            body = body.decode("utf-8", "replace")
+        return body
 
-    def obj_to_api(self, api_name, obj, src):
+    def obj_to_api(self, api_name, obj, src, validate=True):
         """Deserialize a python object into :obj:`tantrum.api_models.ApiModel`.
 
         Args:
@@ -406,6 +511,12 @@ class Soap(Result):
                 Python object to deserialize into a tantrum API object.
             src (:obj:`str`):
                 Where obj came from, used in error text.
+            validate (:obj:`bool`, optional):
+                Type check every attribute while deserializing.
+                If False, use from_server of the API object class to skip type
+                checking of values that are already the right type.
+
+                Defaults to: True.
 
         Returns:
             :obj:`tantrum.api_models.ApiModel`
@@ -418,6 +529,8 @@ class Soap(Result):
         with utils.tools.Timer() as t:
             if cls.__name__ == "ClientCount":
                 ret = cls(count=obj)
+            elif not validate and isinstance(obj, (list, tuple, dict)):
+                ret = cls.from_server(obj)
             elif isinstance(obj, (list, tuple)):
                 ret = cls(*obj)
             elif isinstance(obj, dict):
@@ -428,8 +541,11 @@ class Soap(Result):
                 raise exceptions.ResponseError(result=self, error=error)
 
             # LATER(!) raise exc
+        self.observe_stage(stage="build", timer=t)
         m = "Deserialized API name {a} obj type {t} from API into {cls!r}, took {e}"
-        m = m.format(a=api_name, t=type(obj), cls=ret.__class__, e=t.elapsed)
+        m = utils.logs.LazyFormat(
+            m, a=api_name, t=type(obj), cls=ret.__class__, e=t.elapsed
+        )
         self.log.debug(m)
         return ret
 
@@ -477,10 +593,30 @@ class Soap(Result):
             Will return :meth:`object_api` or :meth:`data_api` by
             determining if :attr:`command_request` is an object or data request.
 
+            If :meth:`release` has dropped everything but :attr:`api_obj`,
+            :attr:`api_obj` is returned and any other kwargs are ignored.
+
+        Raises:
+            :exc:`exceptions.ResultReleasedError`:
+                If :meth:`release` has dropped everything but :attr:`api_obj` and
+                lazy, columns, or predicate are supplied, since the bodies needed
+                to apply them are gone.
+
         Returns:
             :obj:`tantrum.api_models.ApiModel` or :obj:`object`
 
         """
+        if self.released == "api" and not raw:
+            reparse = [
+                k
+                for k in ["lazy", "columns", "predicate"]
+                if kwargs.get(k, None) not in [None, False]
+            ]
+            if reparse:
+                error = "Unable to apply {k}, released with retain {r!r}"
+                error = error.format(k=", ".join(reparse), r=self.released)
+                raise exceptions.ResultReleasedError(result=self, error=error)
+            return self.api_obj
         self.error_check()
         is_result_data = self.command_request in self.DATA_ROUTES
         if is_result_data:
@@ -596,10 +732,16 @@ class Soap(Result):
     def command_request(self):
         """Get the "command" element from :attr:`request_body_obj`.
 
+        Notes:
+            If the command was supplied when this object was created, the
+            request body is not deserialized.
+
         Returns:
             :obj:`str`
 
         """
+        if self._command is not None:
+            return self._command
         obj = self.request_body_obj
         path = "soap:Envelope/soap:Body/t:tanium_soap_request/command"
         src = "SOAP API deserialized request body"
@@ -607,16 +749,73 @@ class Soap(Result):
 
     @property
     def command_response(self):
-        """Get the "command" element from :attr:`response_body_obj`.
+        """Get the "command" element from the response body.
+
+        Notes:
+            Read with :meth:`response_text`, so :attr:`response_body_obj` is not
+            created just to check the response for errors. The command is kept
+            once it has been read.
 
         Returns:
             :obj:`str`
 
         """
-        obj = self.response_body_obj
-        path = "soap:Envelope/soap:Body/t:return/command"
-        src = "SOAP API deserialized response body"
-        return self.get_dict_path(obj=obj, path=path, src=src)
+        key = "command_response"
+        if key not in self._cache:
+            path = "soap:Envelope/soap:Body/t:return/command"
+            src = "SOAP API response body"
+            self._cache[key] = self.response_text(path=path, src=src)
+        return self._cache[key]
+
+    def response_text(self, path, src):
+        """Get the text of an element in the response body.
+
+        Args:
+            path (:obj:`str`):
+                Nested element names seperated by / to find in the response body.
+            src (:obj:`str`):
+                Where the element comes from, used in error text.
+
+        Notes:
+            If :attr:`response_body_obj` has already been created, path is found
+            in it. Otherwise :attr:`response_body_bytes` is parsed with
+            :func:`find_xml_text` until the element is found, without
+            deserializing the rest of the response body.
+
+        Raises:
+            :exc:`exceptions.TextDeserializeError`:
+                If the response body can not be parsed.
+            :exc:`exceptions.DictionaryPathError`:
+                If path is not in the response body.
+
+        Returns:
+            :obj:`str`
+
+        """
+        obj = self._cache.get("response_body_obj", None)
+        if obj is not None:
+            return self.get_dict_path(obj=obj, path=path, src=src)
+
+        self.check_released(src=src)
+        text = self.response_body_bytes
+        with utils.tools.Timer() as t:
+            try:
+                ret = find_xml_text(chunks=[text], path=path)
+            except exceptions.ModuleError as exc:
+                raise exceptions.TextDeserializeError(
+                    result=self, text=self.response_body_str, src=src, exc=exc
+                )
+        self.observe_stage(stage="parse", timer=t)
+
+        if ret is None:
+            exc = KeyError(path.split("/")[-1])
+            raise exceptions.DictionaryPathError(
+                result=self, obj={}, path=path, src=src, exc=exc
+            )
+        m = "Finished reading {path!r} from {src}, {size} took {e}"
+        m = utils.logs.LazyFormat(m, path=path, src=src, size=len(text), e=t.elapsed)
+        self.log.debug(m)
+        return ret
 
     @property
     def request_body_obj(self):
@@ -630,6 +829,7 @@ class Soap(Result):
         if key not in self._cache:
             text = self.request_body_str
             src = "SOAP API request body"
+            self.check_released(src=src)
             self._cache[key] = self.str_to_obj(
                 text=text, src=src, try_int=True, use_dict=True, flat_attrs=True
             )
@@ -639,10 +839,17 @@ class Soap(Result):
     def request_object_obj(self):
         """Get the request objects from :attr:`request_body_obj`.
 
+        Notes:
+            If the request objects were supplied when this object was created, the
+            request body is not deserialized and the objects are returned as
+            they were serialized by the adapter.
+
         Returns:
             :obj:`dict`
 
         """
+        if self._request_object is not None:
+            return self._request_object
         obj = self.request_body_obj
         path = "soap:Envelope/soap:Body/t:tanium_soap_request/object_list"
         src = "SOAP API deserialized request body"
@@ -650,7 +857,11 @@ class Soap(Result):
 
     @property
     def response_body_obj(self):
-        """Get :attr:`Soap.response_body_str` deserialized into a python object.
+        """Get :attr:`Soap.response_body_bytes` deserialized into a python object.
+
+        Notes:
+            The bytes are parsed directly, the parser decodes them using the
+            encoding in the XML declaration.
 
         Returns:
             :obj:`dict`
@@ -658,8 +869,9 @@ class Soap(Result):
         """
         key = "response_body_obj"
         if key not in self._cache:
-            text = self.response_body_str
+            text = self.response_body_bytes
             src = "SOAP API response body"
+            self.check_released(src=src)
             self._cache[key] = self.str_to_obj(
                 text=text, src=src, try_int=True, use_dict=True, flat_attrs=True
             )
@@ -667,17 +879,32 @@ class Soap(Result):
 
     @property
     def data_xml(self):
-        """Get the "ResultXML" element from :attr:`response_body_obj`.
+        """Get the "ResultXML" element from the response body.
+
+        Notes:
+            Read with :meth:`response_text`, so :attr:`response_body_obj` is not
+            created for data requests. Only kept once :meth:`release` has dropped
+            the response body.
 
         Returns:
             :obj:`str`
 
         """
-        obj = self.response_body_obj
+        if "data_xml" in self._cache:
+            return self._cache["data_xml"]
         path = "soap:Envelope/soap:Body/t:return/ResultXML"
-        src = "SOAP API deserialized response body"
-        data = self.get_dict_path(obj=obj, path=path, src=src)
-        return data or ""
+        src = "SOAP API response body"
+        return self.response_text(path=path, src=src) or ""
+
+    @property
+    def data_projection(self):
+        """Get the projection used by the last call to :meth:`data_api`.
+
+        Returns:
+            :obj:`RowProjection`: None if no columns or predicate were supplied.
+
+        """
+        return self._cache.get("data_projection", None)
 
     @property
     def data_obj(self):
@@ -696,16 +923,50 @@ class Soap(Result):
             )
         return self._cache[key]
 
-    def data_api(self, **kwargs):
+    def data_api(
+        self, lazy=False, validate=True, columns=None, predicate=None, **kwargs
+    ):
         """Get :attr:`data_obj` deserialized into an ApiModel object.
 
         Args:
+            lazy (:obj:`bool`, optional):
+                Return a :obj:`LazyResultSet` that deserializes rows from
+                :attr:`data_xml` as it is iterated instead of deserializing all of
+                :attr:`data_obj` up front.
+
+                Defaults to: False.
+            validate (:obj:`bool`, optional):
+                Type check every attribute while deserializing, see
+                :meth:`Soap.obj_to_api`.
+
+                Defaults to: True.
+            columns (:obj:`list` of :obj:`str`, optional):
+                Only deserialize the columns with these names, see
+                :obj:`RowProjection`.
+
+                Defaults to: None.
+            predicate (:obj:`callable`, optional):
+                Only deserialize the rows that this returns True for, see
+                :obj:`RowProjection`.
+
+                Defaults to: None.
             **kwargs:
                 rest of kwargs:
                     passed to :meth:`Soap.obj_to_api`
 
+        Notes:
+            If columns or predicate are supplied, :attr:`data_xml` is parsed with
+            :func:`parse_result_set_xml` so that excluded columns and rows are
+            dropped before they are deserialized, and :attr:`data_obj` is never
+            created. The :obj:`RowProjection` used is kept in
+            :attr:`data_projection`.
+
+            Unless lazy is True, :meth:`release` is called with :attr:`retain`
+            once the object is created. A :obj:`LazyResultSet` still needs
+            :attr:`data_xml`, so nothing is released for it.
+
         Returns:
-            :obj:`tantrum.api_models.ApiModel`
+            :obj:`tantrum.api_models.ApiModel` or :obj:`LazyResultSet`
 
         """
         if self.command_request not in self.DATA_ROUTES:
@@ -713,10 +974,56 @@ class Soap(Result):
             error = error.format(req=self.command_request, data=self.DATA_ROUTES)
             raise exceptions.ApiWrongRequestType(result=self, error=error)
 
+        if lazy:
+            return LazyResultSet(
+                result=self, validate=validate, columns=columns, predicate=predicate
+            )
+
+        kwargs["validate"] = validate
         kwargs["src"] = "Result data from 'ResultXML' element in SOAP response"
-        kwargs["api_name"] = list(self.data_obj.keys())[0]
-        kwargs["obj"] = list(self.data_obj.values())[0]
-        return self.obj_to_api(**kwargs)
+        if columns is None and predicate is None:
+            self._cache.pop("data_projection", None)
+            data = self.data_obj
+        else:
+            projection = RowProjection(columns=columns, predicate=predicate)
+            self._cache["data_projection"] = projection
+            with utils.tools.Timer() as t:
+                elem = parse_result_set_xml(
+                    chunks=LazyResultSet(result=self).iter_chunks(),
+                    wrap=None,
+                    projection=projection,
+                )
+            self.observe_stage(stage="parse", timer=t)
+            data = {} if elem is None else {elem.tag: elem_to_obj(elem=elem)}
+        kwargs["api_name"] = list(data.keys())[0]
+        kwargs["obj"] = list(data.values())[0]
+        self.api_obj = self.obj_to_api(**kwargs)
+        self.release()
+        return self.api_obj
+
+    def data_columns(self):
+        """Get the result sets in :attr:`data_xml` as columnar result sets.
+
+        Notes:
+            Rows are read straight from :attr:`data_xml` into the arrays of each
+            column, see :func:`iter_result_set_columns`. No Row objects are
+            created and :attr:`data_obj` is never created.
+
+        Returns:
+            :obj:`list` of :obj:`tantrum.results.columnar.ColumnarResultSet`
+
+        """
+        if self.command_request not in self.DATA_ROUTES:
+            error = "Route {req!r} is not one of {data}, not a data request?"
+            error = error.format(req=self.command_request, data=self.DATA_ROUTES)
+            raise exceptions.ApiWrongRequestType(result=self, error=error)
+
+        result_sets = iter_result_set_columns(
+            chunks=LazyResultSet(result=self).iter_chunks(),
+            api_objects=self.api_objects,
+            wrap=None,
+        )
+        return list(result_sets)
 
     @property
     def object_obj(self):
@@ -740,6 +1047,10 @@ class Soap(Result):
                 rest of kwargs:
                     passed to :meth:`Soap.obj_to_api`
 
+        Notes:
+            :meth:`release` is called with :attr:`retain` once the object is
+            created.
+
         Returns:
             :obj:`tantrum.api_models.ApiModel`
 
@@ -751,7 +1062,91 @@ class Soap(Result):
         kwargs["src"] = "Result object from 'result_object' element in SOAP response"
         kwargs["api_name"] = list(self.object_obj.keys())[0]
         kwargs["obj"] = list(self.object_obj.values())[0]
-        return self.obj_to_api(**kwargs)
+        self.api_obj = self.obj_to_api(**kwargs)
+        self.release()
+        return self.api_obj
+
+    def release(self, retain=None):
+        """Drop the bodies and deserialized objects that retain does not keep.
+
+        Args:
+            retain (:obj:`str`, optional):
+                One of :attr:`RETAIN`:
+
+                * "all": keep everything.
+                * "parsed": drop the request and response bodies and :attr:`origin`,
+                  keep the deserialized dicts, :attr:`data_xml` and
+                  :attr:`api_obj`.
+                * "api": also drop the deserialized dicts, keep only
+                  :attr:`api_obj`.
+
+                If None, uses :attr:`retain`.
+
+                Defaults to: None.
+
+        Raises:
+            :exc:`exceptions.ModuleError`:
+                If retain is not one of :attr:`RETAIN`.
+
+        Notes:
+            :attr:`origin` is dropped from this object but not changed, if it is
+            also kept in :attr:`tantrum.http_client.HttpClient.history` or
+            :attr:`tantrum.http_client.HttpClient.last_response` it still holds
+            the response body there.
+
+            Getting anything that needs a dropped body afterwards throws
+            :exc:`exceptions.ResultReleasedError`, and :attr:`response_body_str`
+            and :attr:`request_body_str` are empty.
+
+        """
+        retain = self.retain if retain is None else retain
+        if retain not in self.RETAIN:
+            error = "Invalid retain {r!r}, must be one of {vr}"
+            error = error.format(r=retain, vr=self.RETAIN)
+            raise exceptions.ModuleError(error)
+
+        if retain == "all":
+            return
+
+        self._command = self.command_request
+        if retain == "parsed" and self._command in self.DATA_ROUTES:
+            self._cache["data_xml"] = self.data_xml
+        self._response_body = None
+        self._request_body_str = None
+        self.origin = None
+
+        if retain == "api":
+            keys = [
+                "request_body_obj",
+                "response_body_obj",
+                "command_response",
+                "data_obj",
+                "data_xml",
+            ]
+            for key in keys:
+                self._cache.pop(key, None)
+
+        self.released = retain
+        m = "Released result with retain {r!r}, kept cache keys: {k}"
+        m = utils.logs.LazyFormat(m, r=retain, k=list(self._cache))
+        self.log.debug(m)
+
+    def check_released(self, src):
+        """Check that the body src is deserialized from was not dropped.
+
+        Args:
+            src (:obj:`str`):
+                Body that is about to be deserialized, used in error text.
+
+        Raises:
+            :exc:`exceptions.ResultReleasedError`:
+                If :meth:`release` has dropped the bodies.
+
+        """
+        if self.released is not None:
+            error = "Unable to deserialize {src}, released with retain {r!r}"
+            error = error.format(src=src, r=self.released)
+            raise exceptions.ResultReleasedError(result=self, error=error)
 
     def str_to_obj(
         self, text, src, use_dict=True, try_int=True, flat_attrs=True, **kwargs
@@ -759,7 +1154,7 @@ class Soap(Result):
         """Deserialize string into a python object.
 
         Args:
-            text (:obj:`str`):
+            text (:obj:`str` or :obj:`bytes`):
                 String to decode into python object
             src (:obj:`str`):
                 Where text came from, used in error text.
@@ -806,11 +1201,29 @@ class Soap(Result):
                     )
             else:
                 ret = {}
+        self.observe_stage(stage="parse", timer=t)
         m = "Finished deserializing {src} into {t}, {size} took {e}"
-        m = m.format(size=len(text), src=src, t=type(ret), e=t.elapsed)
+        m = utils.logs.LazyFormat(m, size=len(text), src=src, t=type(ret), e=t.elapsed)
         self.log.debug(m)
         return ret
 
+    def observe_stage(self, stage, timer):
+        """Add the elapsed time of a stage to :data:`tantrum.utils.metrics.REGISTRY`.
+
+        Args:
+            stage (:obj:`str`):
+                Stage that was timed, one of :data:`tantrum.utils.metrics.STAGES`.
+            timer (:obj:`tantrum.utils.tools.Timer`):
+                Timer of stage.
+
+        """
+        labels = {"command": self._command or "", "cause": self.cause, "stage": stage}
+        utils.metrics.REGISTRY.observe(
+            name="stage_seconds",
+            value=timer.elapsed_delta.total_seconds(),
+            labels=labels,
+        )
+
     @staticmethod
     def pretty_xml(obj, **kwargs):
         return pretty_xml(obj=obj, **kwargs)
@@ -823,6 +1236,149 @@ class Soap(Result):
         )
 
 
+class LazyResultSet(object):
+    """Lazy iterable of the rows in the "ResultXML" element of a SOAP response."""
+
+    CHUNK_SIZE = 65536
+    """:obj:`int`: Number of characters of "ResultXML" to encode and parse at once."""
+
+    def __init__(self, result, validate=True, columns=None, predicate=None):
+        """Constructor.
+
+        Args:
+            result (:obj:`Soap`):
+                Result to get :attr:`Soap.data_xml` from.
+            validate (:obj:`bool`, optional):
+                Type check every attribute while deserializing rows, see
+                :func:`iter_result_set_rows`.
+
+                Defaults to: True.
+            columns (:obj:`list` of :obj:`str`, optional):
+                Only deserialize the columns with these names, see
+                :obj:`RowProjection`.
+
+                Defaults to: None.
+            predicate (:obj:`callable`, optional):
+                Only deserialize the rows that this returns True for, see
+                :obj:`RowProjection`.
+
+                Defaults to: None.
+
+        Notes:
+            Rows are deserialized one at a time each time this object is iterated,
+            see :func:`iter_result_set_rows`. :attr:`Soap.data_obj` is never
+            created.
+
+        """
+        self.result = result
+        """:obj:`Soap`: Result to get :attr:`Soap.data_xml` from."""
+
+        self.validate = validate
+        """:obj:`bool`: Type check every attribute while deserializing rows."""
+
+        self.columns_only = columns
+        """:obj:`list` of :obj:`str`: Only deserialize columns with these names."""
+
+        self.predicate = predicate
+        """:obj:`callable`: Only deserialize rows that this returns True for."""
+        self._result_set = None
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = ["result_set={!r}".format(self.result_set)]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    def __iter__(self):
+        """Deserialize and yield each row.
+
+        Yields:
+            :obj:`tantrum.api_models.ApiItem`: Row objects.
+
+        """
+        rows = iter_result_set_rows(
+            chunks=self.iter_chunks(),
+            api_objects=self.result.api_objects,
+            wrap=None,
+            validate=self.validate,
+            columns=self.columns_only,
+            predicate=self.predicate,
+        )
+        for row in rows:
+            if self._result_set is None:
+                self._result_set = row[0].API_COLUMN.API_DATA_SET if len(row) else None
+            yield row
+
+    def iter_chunks(self):
+        """Encode :attr:`Soap.data_xml` a chunk at a time.
+
+        Yields:
+            :obj:`bytes`
+
+        """
+        text = self.result.data_xml
+        start = 0
+        while start < len(text):
+            end = start + self.CHUNK_SIZE
+            yield utils.tools.ensure_binary(text[start:end])
+            start = end
+
+    @property
+    def result_set(self):
+        """Get the ResultSet that the rows belong to, without any rows.
+
+        Notes:
+            If there are no rows, the result set is read from :attr:`Soap.data_xml`
+            with every row dropped, without calling :meth:`Soap.release`.
+
+        Returns:
+            :obj:`tantrum.api_models.ApiItem`
+
+        """
+        if self._result_set is None:
+            for row in self:
+                break
+        if self._result_set is None:
+            projection = RowProjection(
+                columns=self.columns_only, predicate=lambda values: False
+            )
+            root = parse_result_set_xml(
+                chunks=self.iter_chunks(), wrap=None, projection=projection
+            )
+            if root is not None and root.tag != "result_set":
+                root = root.find("result_set")
+            if root is not None:
+                self._result_set = result_set_from_elem(
+                    elem=root, api_objects=self.result.api_objects, to_dict=elem_to_obj
+                )
+        return self._result_set
+
+    @property
+    def columns(self):
+        """Get the columns of :attr:`result_set`.
+
+        Returns:
+            :obj:`tantrum.api_models.ApiList`
+
+        """
+        return getattr(self.result_set, "columns", None)
+
+
 def try_int_xml(path, key, value):
     """Parser hook for xmltodict.parse to try to convert str to int.
 
@@ -906,3 +1462,511 @@ def pretty_bodies(response_body, request_body, as_str=True):
         ]
         ret = "\n".join(ret_list)
     return ret
+
+
+def iter_result_set_rows(
+    chunks,
+    api_objects,
+    wrap="result_set",
+    try_int=False,
+    validate=True,
+    columns=None,
+    predicate=None,
+):
+    """Incrementally deserialize rows from result set XML as it is read.
+
+    Args:
+        chunks (:obj:`iterable` of :obj:`bytes`):
+            Chunks of result set XML, i.e. the body of a server side export in XML
+            format or the "ResultXML" element of a GetResultData response.
+        api_objects (:obj:`tantrum.api_objects.ApiObjects`):
+            API Objects Container to use.
+        wrap (:obj:`str`, optional):
+            Wrap chunks in an element of this name before parsing, for result
+            set XML that does not have a root element.
+
+            Defaults to: "result_set".
+        try_int (:obj:`bool`, optional):
+            Try to convert str into int when deserializing.
+
+            Defaults to: False.
+        validate (:obj:`bool`, optional):
+            Type check every attribute while deserializing rows.
+            If False, rows are created with from_server of the Row class.
+
+            Defaults to: True.
+        columns (:obj:`list` of :obj:`str`, optional):
+            Only deserialize the columns with these names, see
+            :obj:`RowProjection`.
+
+            Defaults to: None.
+        predicate (:obj:`callable`, optional):
+            Only deserialize the rows that this returns True for, see
+            :obj:`RowProjection`.
+
+            Defaults to: None.
+
+    Notes:
+        Each <r> element is deserialized into a Row and removed from the parsed
+        tree as soon as it has been read, so memory use does not grow with the
+        number of rows.
+
+        The columns of each Row are linked to the columns of a ResultSet that
+        holds all of the other elements of the parent of <rs> that were read before
+        the first <r> element, which can be accessed from
+        ``row[0].API_COLUMN.API_DATA_SET``.
+
+    Raises:
+        :exc:`exceptions.ModuleError`:
+            If the XML can not be parsed.
+
+    Yields:
+        :obj:`tantrum.api_models.ApiItem`: Row objects.
+
+    """
+    reader = utils.tools.ChunkReader(wrap_chunks(chunks=chunks, wrap=wrap))
+    stack = []
+    result_set = None
+    result_set_elem = None
+    projection = RowProjection(columns=columns, predicate=predicate)
+    to_dict = functools.partial(elem_to_obj, try_int=try_int)
+
+    try:
+        for event, elem in ElementTree.iterparse(reader, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                continue
+
+            stack.pop()
+
+            if elem.tag == "cs" and stack and stack[-1].tag == "result_set":
+                projection.bind(elem=elem)
+                continue
+
+            if not (len(stack) > 1 and stack[-1].tag == "rs" and elem.tag == "r"):
+                continue
+
+            row = None
+            if projection.apply(elem=elem):
+                if result_set_elem is not stack[-2]:
+                    result_set_elem = stack[-2]
+                    result_set = result_set_from_elem(
+                        elem=result_set_elem, api_objects=api_objects, to_dict=to_dict
+                    )
+                row = row_from_elem(
+                    elem=elem,
+                    result_set=result_set,
+                    api_objects=api_objects,
+                    to_dict=to_dict,
+                    validate=validate,
+                )
+            stack[-1].remove(elem)
+            if row is not None:
+                yield row
+    except ElementTree.ParseError as exc:
+        error = "Unable to incrementally deserialize result set XML, error: {e}"
+        error = error.format(e=exc)
+        raise exceptions.ModuleError(error)
+
+
+def find_xml_text(chunks, path):
+    """Find the text of an element in XML as it is read.
+
+    Args:
+        chunks (:obj:`iterable` of :obj:`bytes`):
+            Chunks of XML.
+        path (:obj:`str`):
+            Nested element names seperated by / to find, starting at the root
+            element. Namespace prefixes are ignored, i.e. "soap:Envelope" matches
+            any element named "Envelope".
+
+    Notes:
+        Parsing stops as soon as the element has been read, and every other
+        element is cleared once it has been read.
+
+    Raises:
+        :exc:`exceptions.ModuleError`:
+            If the XML can not be parsed.
+
+    Returns:
+        :obj:`str`: None if path was not found, "" if the element is empty.
+
+    """
+    reader = utils.tools.ChunkReader(chunks)
+    want = [x.rpartition(":")[2] for x in path.split("/")]
+    stack = []
+
+    try:
+        for event, elem in ElementTree.iterparse(reader, events=("start", "end")):
+            if event == "start":
+                stack.append(elem.tag.rpartition("}")[2])
+                continue
+            if stack == want:
+                return elem.text or ""
+            stack.pop()
+            elem.clear()
+    except ElementTree.ParseError as exc:
+        error = "Unable to find {p!r} in XML, error: {e}"
+        error = error.format(p=path, e=exc)
+        raise exceptions.ModuleError(error)
+    return None
+
+
+def wrap_chunks(chunks, wrap):
+    """Wrap chunks of XML in an element.
+
+    Args:
+        chunks (:obj:`iterable` of :obj:`bytes`):
+            Chunks of XML.
+        wrap (:obj:`str`):
+            Name of element to wrap chunks in. If empty, chunks are returned as is.
+
+    Returns:
+        :obj:`iterable` of :obj:`bytes`
+
+    """
+    if not wrap:
+        return chunks
+    head = "<{w}>".format(w=wrap).encode("utf-8")
+    tail = "</{w}>".format(w=wrap).encode("utf-8")
+    return itertools.chain([head], chunks, [tail])
+
+
+def row_from_elem(elem, result_set, api_objects, to_dict, validate=True):
+    """Deserialize a <r> element into a Row linked to the columns of a ResultSet.
+
+    Args:
+        elem (:obj:`xml.etree.ElementTree.Element`):
+            <r> element to deserialize.
+        result_set (:obj:`tantrum.api_models.ApiItem`):
+            ResultSet with the columns of the row.
+        api_objects (:obj:`tantrum.api_objects.ApiObjects`):
+            API Objects Container to use.
+        to_dict (:obj:`callable`):
+            Function to convert elem into a dict.
+        validate (:obj:`bool`, optional):
+            Type check every attribute while deserializing the row.
+            If False, the row is created with from_server of the Row class.
+
+            Defaults to: True.
+
+    Returns:
+        :obj:`tantrum.api_models.ApiItem`
+
+    """
+    row_obj = to_dict(elem) or {}
+    if validate:
+        row = api_objects.Row(**row_obj)
+    else:
+        row = api_objects.Row.from_server(row_obj)
+    for idx, row_column in enumerate(row.columns or []):
+        row_column.API_COLUMN = result_set.columns[idx]
+        row_column.API_IDX = idx
+    return row
+
+
+def iter_result_set_columns(chunks, api_objects, wrap="result_set"):
+    """Incrementally deserialize result set XML into columnar result sets.
+
+    Args:
+        chunks (:obj:`iterable` of :obj:`bytes`):
+            Chunks of result set XML, i.e. the body of a server side export in XML
+            format or the "ResultXML" element of a GetResultData response.
+        api_objects (:obj:`tantrum.api_objects.ApiObjects`):
+            API Objects Container to use.
+        wrap (:obj:`str`, optional):
+            Wrap chunks in an element of this name before parsing, for result
+            set XML that does not have a root element.
+
+            Defaults to: "result_set".
+
+    Notes:
+        The values of each <r> element are added to the columns of a
+        :obj:`tantrum.results.columnar.ResultSetBuilder` and the element is removed
+        from the parsed tree as soon as it has been read, without creating a Row.
+
+    Raises:
+        :exc:`exceptions.ModuleError`:
+            If the XML can not be parsed.
+
+    Yields:
+        :obj:`tantrum.results.columnar.ColumnarResultSet`: For each <result_set>.
+
+    """
+    reader = utils.tools.ChunkReader(wrap_chunks(chunks=chunks, wrap=wrap))
+    stack = []
+    builder = None
+    strings = {}
+
+    def new_builder(elem):
+        result_set = result_set_from_elem(
+            elem=elem, api_objects=api_objects, to_dict=elem_to_obj
+        )
+        return columnar.ResultSetBuilder(result_set=result_set, strings=strings)
+
+    try:
+        for event, elem in ElementTree.iterparse(reader, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                continue
+
+            stack.pop()
+
+            is_row = len(stack) > 1 and stack[-1].tag == "rs" and elem.tag == "r"
+            if is_row:
+                if builder is None:
+                    builder = new_builder(elem=stack[-2])
+                add_row_elem(builder=builder, elem=elem)
+                stack[-1].remove(elem)
+            elif elem.tag == "result_set":
+                if builder is None:
+                    builder = new_builder(elem=elem)
+                yield builder.build()
+                builder = None
+                elem.clear()
+    except ElementTree.ParseError as exc:
+        error = "Unable to incrementally deserialize result set XML, error: {e}"
+        error = error.format(e=exc)
+        raise exceptions.ModuleError(error)
+
+
+def add_row_elem(builder, elem):
+    """Add the values of a <r> element to a columnar result set builder.
+
+    Args:
+        builder (:obj:`tantrum.results.columnar.ResultSetBuilder`):
+            Builder to add row to.
+        elem (:obj:`xml.etree.ElementTree.Element`):
+            <r> element to add.
+
+    """
+    values = [
+        [(v.text or "").strip() for v in c.findall("v")] for c in elem.findall("c")
+    ]
+    builder.add(id=elem.findtext("id"), cid=elem.findtext("cid"), values=values)
+
+
+def parse_result_set_xml(chunks, wrap="result_set", projection=None):
+    """Parse result set XML into an element, dropping columns and rows as read.
+
+    Args:
+        chunks (:obj:`iterable` of :obj:`bytes`):
+            Chunks of result set XML, i.e. the body of a server side export in XML
+            format or the "ResultXML" element of a GetResultData response.
+        wrap (:obj:`str`, optional):
+            Wrap chunks in an element of this name before parsing, for result
+            set XML that does not have a root element.
+
+            Defaults to: "result_set".
+        projection (:obj:`RowProjection`, optional):
+            Columns and rows to keep. If None, keep all columns and rows.
+
+            Defaults to: None.
+
+    Raises:
+        :exc:`exceptions.ModuleError`:
+            If the XML can not be parsed.
+
+    Returns:
+        :obj:`xml.etree.ElementTree.Element`: Root element, None if chunks are
+        empty.
+
+    """
+    reader = utils.tools.ChunkReader(wrap_chunks(chunks=chunks, wrap=wrap))
+    root = None
+    dropped = []
+    projection = projection or RowProjection()
+
+    try:
+        for _, elem in ElementTree.iterparse(reader, events=("end",)):
+            root = elem
+            if elem.tag == "cs":
+                projection.bind(elem=elem)
+            elif elem.tag == "r" and not projection.apply(elem=elem):
+                # the parent <rs> is not known until it ends, so empty the row now
+                # and remove it then
+                elem.clear()
+                dropped.append(elem)
+            elif elem.tag == "rs" and dropped:
+                dropped = set(id(x) for x in dropped)
+                elem[:] = [x for x in elem if id(x) not in dropped]
+                dropped = []
+    except ElementTree.ParseError as exc:
+        if root is None and exc.code == 3:
+            return None
+        error = "Unable to incrementally deserialize result set XML, error: {e}"
+        error = error.format(e=exc)
+        raise exceptions.ModuleError(error)
+    return root
+
+
+class RowProjection(object):
+    """Column projection and row predicate applied to result set XML elements."""
+
+    def __init__(self, columns=None, predicate=None):
+        """Constructor.
+
+        Args:
+            columns (:obj:`list` of :obj:`str`, optional):
+                Names of columns from :attr:`ColumnList.names` to keep, all other
+                <c> elements of <cs> and of each <r> are removed.
+                If None, keep all columns.
+
+                Defaults to: None.
+            predicate (:obj:`callable`, optional):
+                Called for each <r> element with a :obj:`dict` of the name of
+                every column to the :obj:`list` of :obj:`str` values of the row
+                for that column, before any columns are removed.
+                The row is dropped if this returns False.
+                If None, keep all rows.
+
+                Defaults to: None.
+
+        """
+        self.columns = columns
+        """:obj:`list` of :obj:`str`: Names of columns to keep."""
+        self.predicate = predicate
+        """:obj:`callable`: Rows are only kept if this returns True."""
+        self.names = []
+        """:obj:`list` of :obj:`str`: Names of all columns from :meth:`bind`."""
+        self.keep = None
+        """:obj:`set` of :obj:`int`: Index of columns to keep from :meth:`bind`."""
+        self.rows_read = 0
+        """:obj:`int`: Number of rows checked by :meth:`apply`."""
+        self.rows_kept = 0
+        """:obj:`int`: Number of rows checked by :meth:`apply` that were kept."""
+
+    def bind(self, elem):
+        """Get the names of the columns of a result set and remove other columns.
+
+        Args:
+            elem (:obj:`xml.etree.ElementTree.Element`):
+                The <cs> element of a result set.
+
+        Raises:
+            :exc:`exceptions.ModuleError`:
+                If any of :attr:`columns` are not the name of a column.
+
+        """
+        cs = elem.findall("c")
+        self.names = [(c.findtext("dn") or "").strip() for c in cs]
+        if self.columns is None:
+            self.keep = None
+            return
+
+        missing = [x for x in self.columns if x not in self.names]
+        if missing:
+            error = [
+                "Valid Column Names:",
+                "{vc}",
+                "{c!r} are invalid column names in this data set",
+            ]
+            error = "\n  ".join(error)
+            error = error.format(c=missing, vc=self.names)
+            raise exceptions.ModuleError(error)
+
+        self.keep = set(
+            idx for idx, name in enumerate(self.names) if name in self.columns
+        )
+        for idx, c in enumerate(cs):
+            if idx not in self.keep:
+                elem.remove(c)
+
+    def apply(self, elem):
+        """Check a row against :attr:`predicate` and remove other columns.
+
+        Args:
+            elem (:obj:`xml.etree.ElementTree.Element`):
+                A <r> element of a result set.
+
+        Returns:
+            :obj:`bool`: False if the row should be dropped.
+
+        """
+        self.rows_read += 1
+        if self.predicate is None and self.keep is None:
+            self.rows_kept += 1
+            return True
+
+        cs = elem.findall("c")
+        if self.predicate is not None:
+            values = {
+                name: [(v.text or "").strip() for v in c.findall("v")]
+                for name, c in zip(self.names, cs)
+            }
+            if not self.predicate(values):
+                return False
+
+        if self.keep is not None:
+            for idx, c in enumerate(cs):
+                if idx not in self.keep:
+                    elem.remove(c)
+        self.rows_kept += 1
+        return True
+
+
+def result_set_from_elem(elem, api_objects, to_dict):
+    """Create a ResultSet without rows from a result set XML element.
+
+    Args:
+        elem (:obj:`xml.etree.ElementTree.Element`):
+            Result set element to deserialize, any <rs> elements are skipped.
+        api_objects (:obj:`tantrum.api_objects.ApiObjects`):
+            API Objects Container to use.
+        to_dict (:obj:`callable`):
+            Function that deserializes an element into a dict.
+
+    Returns:
+        :obj:`tantrum.api_models.ApiItem`
+
+    """
+    header = ElementTree.Element(elem.tag)
+    header.extend([x for x in elem if x.tag != "rs"])
+    return api_objects.ResultSet(**(to_dict(header) or {}))
+
+
+def elem_to_obj(elem, try_int=False):
+    """Deserialize an XML element into a python object the same way as str_to_obj.
+
+    Args:
+        elem (:obj:`xml.etree.ElementTree.Element`):
+            Element to deserialize.
+        try_int (:obj:`bool`, optional):
+            Try to convert str into int when deserializing.
+
+            Defaults to: False.
+
+    Notes:
+        Matches the output of xmltodict.parse with the keyword arguments used by
+        :meth:`Soap.str_to_obj`, without serializing elem back into a string.
+
+    Returns:
+        :obj:`dict` or :obj:`str` or :obj:`int` or None
+
+    """
+    text = elem.text.strip() if elem.text else ""
+    text = text or None
+
+    if not len(elem) and not elem.attrib:
+        if try_int and text is not None:
+            return try_int_xml(path=None, key=None, value=text)[1]
+        return text
+
+    ret = {}
+    for key, value in elem.attrib.items():
+        if try_int:
+            value = try_int_xml(path=None, key=key, value=value)[1]
+        ret[key] = value
+
+    for child in elem:
+        value = elem_to_obj(elem=child, try_int=try_int)
+        if child.tag in ret:
+            if not isinstance(ret[child.tag], list):
+                ret[child.tag] = [ret[child.tag]]
+            ret[child.tag].append(value)
+        else:
+            ret[child.tag] = value
+
+    if text is not None:
+        ret["text"] = text
+    return ret
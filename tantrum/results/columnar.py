@@ -0,0 +1,816 @@
+# -*- coding: utf-8 -*-
+"""Column oriented storage of result sets from Tanium API."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import array
+import collections
+import operator
+import re
+import six
+
+from . import exceptions
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+NUMERIC_TYPES = (3, 9)
+""":obj:`tuple` of :obj:`int`: Result types stored as numbers.
+
+NumericDecimal and NumericInteger from :data:`tantrum.workflows.TYPE_MAP`.
+"""
+
+NUMBER_OPS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "le": operator.le,
+}
+""":obj:`dict`: Map of filter ops to functions that compare numbers."""
+
+STRING_OPS = {
+    "in": lambda x, v: x in v,
+    "contains": lambda x, v: v in x,
+    "regex": lambda x, v: v.search(x) is not None,
+}
+""":obj:`dict`: Map of filter ops to functions that compare strings.
+
+Also supports all of :data:`NUMBER_OPS`.
+"""
+STRING_OPS.update(NUMBER_OPS)
+
+AGGS = ["count", "sum", "mean", "min", "max"]
+""":obj:`list` of :obj:`str`: Valid aggs for :meth:`ColumnarResultSet.group_by`."""
+
+
+def make_array(values, typecode):
+    """Create a numpy array, or an :obj:`array.array` if numpy is not installed.
+
+    Args:
+        values (:obj:`list`):
+            Values to put in array.
+        typecode (:obj:`str`):
+            Type of values, "i" for int or "d" for float.
+
+    Returns:
+        :obj:`numpy.ndarray` or :obj:`array.array`
+
+    """
+    if numpy is not None:
+        dtype = numpy.int64 if typecode == "i" else numpy.float64
+        return numpy.array(values, dtype=dtype)
+    if typecode == "i":
+        typecode = "q" if six.PY3 else "l"
+    return array.array(str(typecode), values)
+
+
+def to_float(value):
+    """Convert a string to a float, or NaN if it is not a number.
+
+    Args:
+        value (:obj:`str`):
+            String to convert.
+
+    Returns:
+        :obj:`float`
+
+    """
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return float("nan")
+
+
+def count_codes(codes, size):
+    """Count how many times each code occurs.
+
+    Args:
+        codes (:obj:`numpy.ndarray` or :obj:`array.array`):
+            Codes to count.
+        size (:obj:`int`):
+            Number of possible codes.
+
+    Returns:
+        :obj:`list` of :obj:`int`: Count of each code.
+
+    """
+    if numpy is not None:
+        return numpy.bincount(codes, minlength=size).tolist()
+    counts = [0] * size
+    for code in codes:
+        counts[code] += 1
+    return counts
+
+
+def aggregate_numpy(codes, numbers, size, agg):
+    """Aggregate the numbers of each code using numpy.
+
+    Args:
+        codes (:obj:`numpy.ndarray`):
+            Code of the group of each number.
+        numbers (:obj:`numpy.ndarray`):
+            Numbers to aggregate, NaN values are skipped.
+        size (:obj:`int`):
+            Number of possible codes.
+        agg (:obj:`str`):
+            Aggregation, one of :data:`AGGS` except "count".
+
+    Returns:
+        :obj:`tuple` of (:obj:`list`, :obj:`list`): Aggregate and count of numbers
+        of each code.
+
+    """
+    valid = ~numpy.isnan(numbers)
+    codes = codes[valid]
+    numbers = numbers[valid]
+    counts = numpy.bincount(codes, minlength=size)
+    if agg in ["sum", "mean"]:
+        aggs = numpy.bincount(codes, weights=numbers, minlength=size)
+        if agg == "mean":
+            aggs = aggs / numpy.maximum(counts, 1)
+    else:
+        func = numpy.minimum if agg == "min" else numpy.maximum
+        aggs = numpy.full(size, numpy.nan)
+        aggs[codes] = numbers
+        func.at(aggs, codes, numbers)
+    return aggs.tolist(), counts.tolist()
+
+
+def aggregate_python(codes, numbers, size, agg):
+    """Aggregate the numbers of each code without numpy.
+
+    Args:
+        codes (:obj:`array.array`):
+            Code of the group of each number.
+        numbers (:obj:`array.array`):
+            Numbers to aggregate, NaN values are skipped.
+        size (:obj:`int`):
+            Number of possible codes.
+        agg (:obj:`str`):
+            Aggregation, one of :data:`AGGS` except "count".
+
+    Returns:
+        :obj:`tuple` of (:obj:`list`, :obj:`list`): Aggregate and count of numbers
+        of each code.
+
+    """
+    counts = [0] * size
+    aggs = [None] * size
+    func = {"min": min, "max": max}.get(agg, operator.add)
+    for code, number in zip(codes, numbers):
+        if number != number:
+            continue
+        counts[code] += 1
+        current = aggs[code]
+        aggs[code] = number if current is None else func(current, number)
+    if agg == "mean":
+        aggs = [x / c if c else x for x, c in zip(aggs, counts)]
+    return aggs, counts
+
+
+class ColumnBuilder(object):
+    """Builds a :obj:`ColumnData` one row at a time."""
+
+    def __init__(self, name, result_type, hash, strings=None):
+        """Constructor.
+
+        Args:
+            name (:obj:`str`):
+                Name of column.
+            result_type (:obj:`int`):
+                Result type of column.
+            hash (:obj:`int`):
+                Sensor hash of column.
+            strings (:obj:`dict`, optional):
+                Map of strings to their interned copy shared between columns.
+
+                Defaults to: None.
+
+        """
+        self.name = name
+        self.result_type = result_type
+        self.hash = hash
+        self.is_numeric = result_type in NUMERIC_TYPES
+        self.lookup = {}
+        self.strings = []
+        self.codes = []
+        self.numbers = []
+        self.multi = {}
+        self._interned = {} if strings is None else strings
+
+    def intern(self, value):
+        """Get the shared copy of a string.
+
+        Args:
+            value (:obj:`str`):
+                String to get shared copy of.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self._interned.setdefault(value, value)
+
+    def add(self, values):
+        """Add the values of this column for a row.
+
+        Args:
+            values (:obj:`list` of :obj:`str`):
+                Values of this column in the row.
+
+        """
+        value = values[0] if values else ""
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.strings)
+            value = self.intern(value)
+            self.lookup[value] = code
+            self.strings.append(value)
+            if self.is_numeric:
+                self.numbers.append(to_float(value))
+        self.codes.append(code)
+        if len(values) > 1:
+            self.multi[len(self.codes) - 1] = [self.intern(x) for x in values]
+
+    def build(self):
+        """Create the column from the rows that have been added.
+
+        Returns:
+            :obj:`ColumnData`
+
+        """
+        numbers = None
+        if self.is_numeric:
+            numbers = [self.numbers[code] for code in self.codes]
+            numbers = make_array(values=numbers, typecode="d")
+        return ColumnData(
+            name=self.name,
+            result_type=self.result_type,
+            hash=self.hash,
+            strings=self.strings,
+            codes=make_array(values=self.codes, typecode="i"),
+            numbers=numbers,
+            multi=self.multi,
+        )
+
+
+class ColumnData(object):
+    """Values of a column of a result set stored as arrays."""
+
+    def __init__(self, name, result_type, hash, strings, codes, numbers, multi):
+        """Constructor.
+
+        Args:
+            name (:obj:`str`):
+                Name of column.
+            result_type (:obj:`int`):
+                Result type of column.
+            hash (:obj:`int`):
+                Sensor hash of column.
+            strings (:obj:`list` of :obj:`str`):
+                Unique values of column.
+            codes (:obj:`numpy.ndarray` or :obj:`array.array`):
+                Index into strings of the first value of each row.
+            numbers (:obj:`numpy.ndarray` or :obj:`array.array`):
+                First value of each row as a float, NaN if not a number.
+                None if result_type is not one of :data:`NUMERIC_TYPES`.
+            multi (:obj:`dict`):
+                Map of row index to all values of rows with more than one value.
+
+        """
+        self.name = name
+        """:obj:`str`: Name of column."""
+        self.result_type = result_type
+        """:obj:`int`: Result type of column."""
+        self.hash = hash
+        """:obj:`int`: Sensor hash of column."""
+        self.strings = strings
+        """:obj:`list` of :obj:`str`: Unique values of column."""
+        self.codes = codes
+        """:obj:`numpy.ndarray` or :obj:`array.array`: Index into strings per row."""
+        self.numbers = numbers
+        """:obj:`numpy.ndarray` or :obj:`array.array`: Value per row as float."""
+        self.multi = multi
+        """:obj:`dict`: Map of row index to all values of multi value rows."""
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = [
+            "name={!r}".format(self.name),
+            "result_type={!r}".format(self.result_type),
+            "rows={}".format(len(self)),
+            "unique={}".format(len(self.strings)),
+            "numeric={}".format(self.is_numeric),
+        ]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    def __len__(self):
+        """Get the number of rows in this column.
+
+        Returns:
+            :obj:`int`
+
+        """
+        return len(self.codes)
+
+    def __getitem__(self, idx):
+        """Get the first value of a row.
+
+        Args:
+            idx (:obj:`int`):
+                Index of row.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.strings[self.codes[idx]]
+
+    @property
+    def is_numeric(self):
+        """Get if the values of this column are also stored as numbers.
+
+        Returns:
+            :obj:`bool`
+
+        """
+        return self.numbers is not None
+
+    @property
+    def values(self):
+        """Get the first value of every row.
+
+        Returns:
+            :obj:`list` of :obj:`str`
+
+        """
+        strings = self.strings
+        return [strings[code] for code in self.codes]
+
+    def get_values(self, idx):
+        """Get all of the values of a row.
+
+        Args:
+            idx (:obj:`int`):
+                Index of row.
+
+        Returns:
+            :obj:`list` of :obj:`str`
+
+        """
+        if idx in self.multi:
+            return list(self.multi[idx])
+        return [self[idx]]
+
+    def mask(self, value, op="eq"):
+        """Get a mask of the rows whose first value matches value.
+
+        Args:
+            value (:obj:`str` or :obj:`int` or :obj:`float` or :obj:`list`):
+                Value to compare the first value of each row to.
+            op (:obj:`str`, optional):
+                Comparison to make, one of :data:`STRING_OPS`.
+                If this column is numeric and value is a number, the comparison
+                is made against :attr:`numbers` with one of :data:`NUMBER_OPS`.
+
+                Defaults to: "eq".
+
+        Notes:
+            String comparisons are made once against each unique value in
+            :attr:`strings`, not once per row.
+
+        Raises:
+            :exc:`exceptions.ModuleError`:
+                If op is not valid.
+
+        Returns:
+            :obj:`numpy.ndarray` or :obj:`list` of :obj:`bool`
+
+        """
+        if op not in STRING_OPS:
+            error = "Invalid op {o!r}, must be one of {vo}"
+            error = error.format(o=op, vo=list(STRING_OPS))
+            raise exceptions.ModuleError(error)
+
+        is_number = isinstance(value, (six.integer_types, float))
+        if self.is_numeric and is_number and op in NUMBER_OPS:
+            func = NUMBER_OPS[op]
+            if numpy is not None:
+                return func(self.numbers, value)
+            return [func(x, value) for x in self.numbers]
+
+        if op == "regex":
+            value = re.compile(value)
+        elif is_number:
+            value = format(value)
+        func = STRING_OPS[op]
+        matched = [idx for idx, x in enumerate(self.strings) if func(x, value)]
+        if numpy is not None:
+            return numpy.isin(self.codes, matched)
+        matched = set(matched)
+        return [code in matched for code in self.codes]
+
+    def take(self, idxs):
+        """Create a column with only some of the rows of this column.
+
+        Args:
+            idxs (:obj:`numpy.ndarray` or :obj:`list` of :obj:`int`):
+                Index of rows to keep.
+
+        Returns:
+            :obj:`ColumnData`
+
+        """
+        if numpy is not None:
+            codes = self.codes[idxs]
+            numbers = None if self.numbers is None else self.numbers[idxs]
+        else:
+            codes = array.array(self.codes.typecode, [self.codes[x] for x in idxs])
+            numbers = self.numbers
+            if numbers is not None:
+                numbers = array.array(numbers.typecode, [numbers[x] for x in idxs])
+        multi = {}
+        if self.multi:
+            for new_idx, idx in enumerate(idxs):
+                if idx in self.multi:
+                    multi[new_idx] = self.multi[idx]
+        return ColumnData(
+            name=self.name,
+            result_type=self.result_type,
+            hash=self.hash,
+            strings=self.strings,
+            codes=codes,
+            numbers=numbers,
+            multi=multi,
+        )
+
+
+class ColumnarResultSet(object):
+    """Result set with the values of each column stored as arrays.
+
+    Notes:
+        Uses numpy arrays if numpy is installed, otherwise uses
+        :obj:`array.array`. The value of a column for each row is stored as an
+        index into the unique values of the column, so a repeated value is stored
+        once. Columns with a result type in :data:`NUMERIC_TYPES` also store the
+        value for each row as a float.
+
+        Only the first value of a row column is used by :meth:`filter`,
+        :meth:`count`, and :meth:`group_by`; all values of rows with more than
+        one value are available from :meth:`ColumnData.get_values`.
+
+    """
+
+    def __init__(self, result_set, columns, ids, cids):
+        """Constructor.
+
+        Args:
+            result_set (:obj:`tantrum.api_models.ApiItem`):
+                ResultSet without rows that the columns came from.
+            columns (:obj:`list` of :obj:`ColumnData`):
+                Columns of result set.
+            ids (:obj:`numpy.ndarray` or :obj:`array.array`):
+                Id of each row.
+            cids (:obj:`numpy.ndarray` or :obj:`array.array`):
+                Cid of each row.
+
+        """
+        self.result_set = result_set
+        """:obj:`tantrum.api_models.ApiItem`: ResultSet without rows."""
+        self.columns = columns
+        """:obj:`list` of :obj:`ColumnData`: Columns of result set."""
+        self.ids = ids
+        """:obj:`numpy.ndarray` or :obj:`array.array`: Id of each row."""
+        self.cids = cids
+        """:obj:`numpy.ndarray` or :obj:`array.array`: Cid of each row."""
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = ["rows={}".format(len(self)), "names={!r}".format(self.names)]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    def __len__(self):
+        """Get the number of rows.
+
+        Returns:
+            :obj:`int`
+
+        """
+        return len(self.ids)
+
+    def __getitem__(self, value):
+        """Get a column by name or index.
+
+        Args:
+            value (:obj:`int` or :obj:`str`):
+                Index or name of column.
+
+        Raises:
+            :exc:`exceptions.ModuleError`:
+                If value is a name that is not one of :attr:`names`.
+
+        Returns:
+            :obj:`ColumnData`
+
+        """
+        if isinstance(value, six.string_types):
+            try:
+                value = self.names.index(value)
+            except ValueError:
+                error = [
+                    "Valid Column Names:",
+                    "{vc}",
+                    "{c!r} is an invalid column name in this data set",
+                ]
+                error = "\n  ".join(error)
+                error = error.format(c=value, vc=self.names)
+                raise exceptions.ModuleError(error)
+        return self.columns[value]
+
+    @property
+    def names(self):
+        """Get the names of :attr:`columns`.
+
+        Returns:
+            :obj:`list` of :obj:`str`
+
+        """
+        return [x.name for x in self.columns]
+
+    @classmethod
+    def from_result_set(cls, result_set):
+        """Create a columnar result set from a ResultSet.
+
+        Args:
+            result_set (:obj:`tantrum.api_models.ApiItem`):
+                ResultSet to get columns and rows from.
+
+        Returns:
+            :obj:`ColumnarResultSet`
+
+        """
+        builder = ResultSetBuilder(result_set=result_set)
+        for row in result_set.rows:
+            values = [x.get_values(attr="value") for x in row.columns or []]
+            builder.add(id=row.id, cid=row.cid, values=values)
+        return builder.build()
+
+    def get_values(self, idx):
+        """Get all values from all columns of a row.
+
+        Args:
+            idx (:obj:`int`):
+                Index of row.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        return {x.name: x.get_values(idx) for x in self.columns}
+
+    def mask(self, name, value, op="eq"):
+        """Get a mask of the rows whose first value of a column matches value.
+
+        Args:
+            name (:obj:`str` or :obj:`int`):
+                Name or index of column.
+            value (:obj:`object`):
+                Passed to :meth:`ColumnData.mask`.
+            op (:obj:`str`, optional):
+                Passed to :meth:`ColumnData.mask`.
+
+                Defaults to: "eq".
+
+        Returns:
+            :obj:`numpy.ndarray` or :obj:`list` of :obj:`bool`
+
+        """
+        return self[name].mask(value=value, op=op)
+
+    def take(self, mask):
+        """Create a columnar result set with only some rows.
+
+        Args:
+            mask (:obj:`numpy.ndarray` or :obj:`list` of :obj:`bool`):
+                Mask from :meth:`mask`.
+
+        Returns:
+            :obj:`ColumnarResultSet`
+
+        """
+        if numpy is not None:
+            idxs = numpy.flatnonzero(mask)
+            ids = self.ids[idxs]
+            cids = self.cids[idxs]
+        else:
+            idxs = [idx for idx, x in enumerate(mask) if x]
+            ids = array.array(self.ids.typecode, [self.ids[x] for x in idxs])
+            cids = array.array(self.cids.typecode, [self.cids[x] for x in idxs])
+        return self.__class__(
+            result_set=self.result_set,
+            columns=[x.take(idxs=idxs) for x in self.columns],
+            ids=ids,
+            cids=cids,
+        )
+
+    def filter(self, name, value, op="eq"):
+        """Create a columnar result set with only the rows that match value.
+
+        Args:
+            name (:obj:`str` or :obj:`int`):
+                Name or index of column.
+            value (:obj:`object`):
+                Passed to :meth:`ColumnData.mask`.
+            op (:obj:`str`, optional):
+                Passed to :meth:`ColumnData.mask`.
+
+                Defaults to: "eq".
+
+        Returns:
+            :obj:`ColumnarResultSet`
+
+        """
+        return self.take(mask=self.mask(name=name, value=value, op=op))
+
+    def count(self, name=None, value=None, op="eq"):
+        """Count the rows that match value.
+
+        Args:
+            name (:obj:`str` or :obj:`int`, optional):
+                Name or index of column. If None, count all rows.
+
+                Defaults to: None.
+            value (:obj:`object`, optional):
+                Passed to :meth:`ColumnData.mask`.
+
+                Defaults to: None.
+            op (:obj:`str`, optional):
+                Passed to :meth:`ColumnData.mask`.
+
+                Defaults to: "eq".
+
+        Returns:
+            :obj:`int`
+
+        """
+        if name is None:
+            return len(self)
+        mask = self.mask(name=name, value=value, op=op)
+        if numpy is not None:
+            return int(numpy.count_nonzero(mask))
+        return sum(mask)
+
+    def group_by(self, name, value_name=None, agg="count"):
+        """Group rows by the first value of a column and aggregate each group.
+
+        Args:
+            name (:obj:`str` or :obj:`int`):
+                Name or index of column to group by.
+            value_name (:obj:`str` or :obj:`int`, optional):
+                Name or index of numeric column to aggregate, required if agg is
+                not "count".
+
+                Defaults to: None.
+            agg (:obj:`str`, optional):
+                Aggregation for each group, one of :data:`AGGS`.
+                Rows whose value_name is not a number are skipped.
+
+                Defaults to: "count".
+
+        Raises:
+            :exc:`exceptions.ModuleError`:
+                If agg is not valid or value_name is not a numeric column.
+
+        Returns:
+            :obj:`collections.OrderedDict`: Map of each value of name to the
+            aggregate of its group, in the order each value was first seen.
+
+        """
+        if agg not in AGGS:
+            error = "Invalid agg {a!r}, must be one of {va}"
+            error = error.format(a=agg, va=AGGS)
+            raise exceptions.ModuleError(error)
+
+        column = self[name]
+        size = len(column.strings)
+
+        if agg == "count":
+            items = zip(column.strings, count_codes(codes=column.codes, size=size))
+            return collections.OrderedDict((k, v) for k, v in items if v)
+
+        values = self[value_name] if value_name is not None else None
+        if values is None or not values.is_numeric:
+            error = "Column {c!r} is not numeric, can not get {a!r} of it"
+            error = error.format(c=value_name, a=agg)
+            raise exceptions.ModuleError(error)
+
+        aggregate = aggregate_numpy if numpy is not None else aggregate_python
+        aggs, counts = aggregate(
+            codes=column.codes, numbers=values.numbers, size=size, agg=agg
+        )
+        items = zip(column.strings, aggs, counts)
+        return collections.OrderedDict((k, v) for k, v, c in items if c)
+
+
+class ResultSetBuilder(object):
+    """Builds a :obj:`ColumnarResultSet` one row at a time."""
+
+    def __init__(self, result_set, strings=None):
+        """Constructor.
+
+        Args:
+            result_set (:obj:`tantrum.api_models.ApiItem`):
+                ResultSet to get columns from, rows are ignored.
+            strings (:obj:`dict`, optional):
+                Passed to :obj:`ColumnBuilder`.
+
+                Defaults to: None.
+
+        """
+        self.result_set = result_set
+        self.strings = {} if strings is None else strings
+        self.ids = []
+        self.cids = []
+        self.columns = []
+        for column in result_set.columns or []:
+            try:
+                result_type = int(column.type)
+            except (ValueError, TypeError):
+                result_type = column.type
+            self.columns.append(
+                ColumnBuilder(
+                    name=column.name,
+                    result_type=result_type,
+                    hash=column.hash,
+                    strings=self.strings,
+                )
+            )
+
+    def add(self, id, cid, values):
+        """Add a row.
+
+        Args:
+            id (:obj:`int`):
+                Id of row.
+            cid (:obj:`int`):
+                Cid of row.
+            values (:obj:`list` of :obj:`list` of :obj:`str`):
+                Values of each column of row.
+
+        """
+        self.ids.append(int(id or 0))
+        self.cids.append(int(cid or 0))
+        for column, column_values in zip(self.columns, values):
+            column.add(column_values)
+
+    def build(self):
+        """Create the columnar result set from the rows that have been added.
+
+        Returns:
+            :obj:`ColumnarResultSet`
+
+        """
+        return ColumnarResultSet(
+            result_set=self.result_set,
+            columns=[x.build() for x in self.columns],
+            ids=make_array(values=self.ids, typecode="i"),
+            cids=make_array(values=self.cids, typecode="i"),
+        )
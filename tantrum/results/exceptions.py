@@ -135,6 +135,27 @@ class ApiWrongRequestType(ModuleError):
         super(ApiWrongRequestType, self).__init__(self.error)
 
 
+class ResultReleasedError(ModuleError):
+    """Thrown when getting something from a result that was dropped by release."""
+
+    def __init__(self, result, error):
+        """Constructor.
+
+        Args:
+            result (:obj:`tantrum.results.Result`):
+                Object exception was thrown from.
+            error (:obj:`str`):
+                Error string.
+        """
+        self.result = result
+        """:obj:`tantrum.results.Result`: Object exception was thrown from."""
+
+        error = ["", "-- From: {o}".format(o=result), "-- Error: {o}".format(o=error)]
+        self.error = "\n".join(error)
+        """:obj:`str`: Error message that was thrown."""
+        super(ResultReleasedError, self).__init__(self.error)
+
+
 class DictionaryPathError(ModuleError):
     """Thrown when a response has an error when deserializing."""
 
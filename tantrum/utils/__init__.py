@@ -8,6 +8,7 @@ from __future__ import unicode_literals
 from . import exceptions
 from . import tools
 from . import logs
+from . import metrics
 from . import versions
 
-__all__ = ("exceptions", "logs", "tools", "versions")
+__all__ = ("exceptions", "logs", "metrics", "tools", "versions")
@@ -5,12 +5,20 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import atexit
 import inspect
 import logging
 import logging.handlers
 import time
 import six
 import sys
+import threading
+
+try:
+    from logging.handlers import QueueHandler, QueueListener
+except ImportError:  # pragma: no cover
+    # python 2 has no queue handlers, queue_handler throws ModuleError
+    QueueHandler = QueueListener = object
 
 from . import exceptions
 from . import tools
@@ -117,7 +125,11 @@ def set_level(lvl="info", obj=LOG):
         obj.disabled = True
     else:
         obj.disabled = False
-        obj.setLevel(level_int(lvl=lvl))
+        lvl = level_int(lvl=lvl)
+        # setLevel clears the isEnabledFor cache of every logger, skip it if the
+        # level is not changing since objects set the level of their log on init
+        if obj.level != lvl:
+            obj.setLevel(lvl)
 
 
 def get_obj_log(obj, lvl="debug"):
@@ -246,7 +258,9 @@ def handler_str(obj):
     return m.format(lvl=lvl, name=obj.name, cls=cls)
 
 
-def add_stdout(lvl="info", fmt=LOG_CON_FMT, obj=LOG):
+def add_stdout(
+    lvl="info", fmt=LOG_CON_FMT, obj=LOG, queued=False, queue_size=10000, block=False
+):
     """Add a STDOUT handler to a logger object.
 
     Args:
@@ -263,11 +277,25 @@ def add_stdout(lvl="info", fmt=LOG_CON_FMT, obj=LOG):
 
             Defaults to: :data:`LOG`.
 
+        queued (:obj:`bool`, optional):
+            Write records from a background thread, see :func:`queue_handler`.
+
+            Defaults to: False.
+        queue_size (:obj:`int`, optional):
+            Maximum number of records waiting to be written if queued is True.
+
+            Defaults to: 10000.
+        block (:obj:`bool`, optional):
+            If queued is True and the queue is full, wait for space instead of
+            dropping the record.
+
+            Defaults to: False.
+
     Notes:
         Will remove handler from obj if exists before adding.
 
     Returns:
-        :obj:`logging.StreamHandler`
+        :obj:`logging.StreamHandler` or :obj:`QueuedHandler`
 
     """
     remove_stdout(obj=obj)
@@ -276,17 +304,21 @@ def add_stdout(lvl="info", fmt=LOG_CON_FMT, obj=LOG):
     handler = logging.StreamHandler(stream=sys.stdout)
     handler.setFormatter(log_fmt)
     set_level(lvl=lvl, obj=handler)
+    if queued:
+        handler = queue_handler(handler=handler, queue_size=queue_size, block=block)
     handler.name = name
     obj.addHandler(handler)
     lvl = level_name(lvl=lvl)
     log = log_str(obj=obj)
-    m = "Started logging to STDOUT at level {lvl!r} on {log}"
-    m = m.format(lvl=lvl, log=log)
+    m = "Started logging to STDOUT at level {lvl!r} on {log}, queued: {q}"
+    m = m.format(lvl=lvl, log=log, q=queued)
     LOG.debug(m)
     return handler
 
 
-def add_stderr(lvl="info", fmt=LOG_CON_FMT, obj=LOG):
+def add_stderr(
+    lvl="info", fmt=LOG_CON_FMT, obj=LOG, queued=False, queue_size=10000, block=False
+):
     """Add a STDERR handler to a logger object.
 
     Args:
@@ -303,11 +335,25 @@ def add_stderr(lvl="info", fmt=LOG_CON_FMT, obj=LOG):
 
             Defaults to: :data:`LOG`.
 
+        queued (:obj:`bool`, optional):
+            Write records from a background thread, see :func:`queue_handler`.
+
+            Defaults to: False.
+        queue_size (:obj:`int`, optional):
+            Maximum number of records waiting to be written if queued is True.
+
+            Defaults to: 10000.
+        block (:obj:`bool`, optional):
+            If queued is True and the queue is full, wait for space instead of
+            dropping the record.
+
+            Defaults to: False.
+
     Notes:
         Will remove handler from obj if exists before adding.
 
     Returns:
-        :obj:`logging.StreamHandler`
+        :obj:`logging.StreamHandler` or :obj:`QueuedHandler`
 
     """
     remove_stderr(obj=obj)
@@ -315,12 +361,14 @@ def add_stderr(lvl="info", fmt=LOG_CON_FMT, obj=LOG):
     handler = logging.StreamHandler(stream=sys.stderr)
     handler.setFormatter(logging.Formatter(fmt))
     set_level(lvl=lvl, obj=handler)
+    if queued:
+        handler = queue_handler(handler=handler, queue_size=queue_size, block=block)
     handler.name = name
     obj.addHandler(handler)
     lvl = level_name(lvl=lvl)
     log = log_str(obj=obj)
-    m = "Started logging to STDERR at level {lvl!r} on {log}"
-    m = m.format(lvl=lvl, log=log)
+    m = "Started logging to STDERR at level {lvl!r} on {log}, queued: {q}"
+    m = m.format(lvl=lvl, log=log, q=queued)
     LOG.debug(m)
     return handler
 
@@ -334,6 +382,9 @@ def add_file(
     max_num=5,
     fmt=LOG_PATH_FMT,
     obj=LOG,
+    queued=False,
+    queue_size=10000,
+    block=False,
 ):
     """Add a rotating log file handler to a logger object.
 
@@ -373,11 +424,25 @@ def add_file(
 
             Defaults to: :data:`LOG`.
 
+        queued (:obj:`bool`, optional):
+            Write records from a background thread, see :func:`queue_handler`.
+
+            Defaults to: False.
+        queue_size (:obj:`int`, optional):
+            Maximum number of records waiting to be written if queued is True.
+
+            Defaults to: 10000.
+        block (:obj:`bool`, optional):
+            If queued is True and the queue is full, wait for space instead of
+            dropping the record.
+
+            Defaults to: False.
+
     Notes:
         Will remove handler from obj if exists before adding.
 
     Returns:
-        :obj:`logging.handlers.RotatingFileHandler`
+        :obj:`logging.handlers.RotatingFileHandler` or :obj:`QueuedHandler`
 
     """
     remove_file(path=path, path_sub=path_sub, path_file=path_file, obj=obj)
@@ -391,15 +456,17 @@ def add_file(
     )
     handler.setFormatter(logging.Formatter(fmt))
     set_level(lvl=lvl, obj=handler)
+    if queued:
+        handler = queue_handler(handler=handler, queue_size=queue_size, block=block)
     handler.name = format(path)
     obj.addHandler(handler)
     lvl = level_name(lvl=lvl)
     log = log_str(obj=obj)
     m = (
         "Started logging to file: '{path}' at level {lvl!r} "
-        "rotating {cnt} logs every {mb} MB on {log}"
+        "rotating {cnt} logs every {mb} MB on {log}, queued: {q}"
     )
-    m = m.format(path=format(path), lvl=lvl, cnt=max_num, mb=max_mb, log=log)
+    m = m.format(path=format(path), lvl=lvl, cnt=max_num, mb=max_mb, log=log, q=queued)
     LOG.debug(m)
     return handler
 
@@ -547,11 +614,17 @@ def remove_handler(handler, obj=LOG):
 
             Defaults to: :data:`LOG`.
 
+    Notes:
+        If handler is a :obj:`QueuedHandler`, its listener thread is stopped once
+        the records in its queue have been written.
+
     Returns:
         :obj:`logging.Handler`
 
     """
     obj.removeHandler(handler)
+    if isinstance(handler, QueuedHandler):
+        handler.close()
     return handler
 
 
@@ -628,6 +701,304 @@ def will_print_at(lvl="debug", obj=LOG):
     return True
 
 
+def queue_handler(handler, queue_size=10000, block=False):
+    """Wrap a handler so that records are written by a background thread.
+
+    Args:
+        handler (:obj:`logging.Handler`):
+            Handler that will write the records.
+        queue_size (:obj:`int`, optional):
+            Maximum number of records waiting to be written.
+
+            Defaults to: 10000.
+        block (:obj:`bool`, optional):
+            If the queue is full, wait for space instead of dropping the record.
+
+            Defaults to: False.
+
+    Raises:
+        :exc:`exceptions.ModuleError`:
+            If this version of python has no :obj:`logging.handlers.QueueHandler`.
+
+    Notes:
+        The thread logging a record only formats the message of the record and
+        puts it in the queue, the listener thread of the returned handler then
+        passes it to handler. The returned handler has the same level as handler.
+
+    Returns:
+        :obj:`QueuedHandler`
+
+    """
+    if QueueHandler is object:  # pragma: no cover
+        error = "Queued log handlers are not supported on python {v}"
+        error = error.format(v=sys.version.split()[0])
+        raise exceptions.ModuleError(error)
+
+    queued = QueuedHandler(target=handler, queue_size=queue_size, block=block)
+    queued.setLevel(handler.level)
+    queued.start()
+    return queued
+
+
+class QueuedHandler(QueueHandler):
+    """Handler that puts records in a bounded queue for a listener thread."""
+
+    def __init__(self, target, queue_size=10000, block=False):
+        """Constructor.
+
+        Args:
+            target (:obj:`logging.Handler`):
+                Handler that will write the records.
+            queue_size (:obj:`int`, optional):
+                Maximum number of records waiting to be written.
+
+                Defaults to: 10000.
+            block (:obj:`bool`, optional):
+                If the queue is full, wait for space instead of dropping the record.
+
+                Defaults to: False.
+
+        """
+        super(QueuedHandler, self).__init__(six.moves.queue.Queue(queue_size))
+        self.target = target
+        """:obj:`logging.Handler`: Handler that writes the records."""
+        self.block = block
+        """:obj:`bool`: If the queue is full, wait for space instead of dropping."""
+        self.dropped = 0
+        """:obj:`int`: Number of records dropped because the queue was full."""
+        self.dropped_lock = threading.Lock()
+        """:obj:`threading.Lock`: Lock for changes to :attr:`dropped`."""
+        self.listener = QueuedListener(self.queue, target, source=self)
+        """:obj:`QueuedListener`: Listener that writes records from the queue."""
+        self.started = False
+        """:obj:`bool`: If :attr:`listener` is running."""
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = [
+            "target={}".format(handler_str(self.target)),
+            "size={}".format(self.queue.qsize()),
+            "max={}".format(self.queue.maxsize),
+            "block={}".format(self.block),
+            "dropped={}".format(self.dropped),
+        ]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    def enqueue(self, record):
+        """Put a record in the queue, or drop it if the queue is full.
+
+        Args:
+            record (:obj:`logging.LogRecord`):
+                Record to put in the queue.
+
+        Notes:
+            The record is given the value of :attr:`dropped` as dropped_before,
+            so :attr:`listener` writes the warning for records dropped before
+            this one after the records that were queued before them.
+
+        """
+        with self.dropped_lock:
+            record.dropped_before = self.dropped
+        try:
+            self.queue.put(record, self.block)
+        except six.moves.queue.Full:
+            with self.dropped_lock:
+                self.dropped += 1
+
+    def start(self):
+        """Start :attr:`listener` if it is not running."""
+        if not self.started:
+            self.listener.start()
+            self.started = True
+            atexit.register(self.close)
+
+    def stop(self):
+        """Stop :attr:`listener` after it writes the records in the queue."""
+        if self.started:
+            self.started = False
+            self.listener.stop()
+            try:
+                atexit.unregister(self.close)
+            except AttributeError:  # pragma: no cover
+                pass
+
+    def close(self):
+        """Stop :attr:`listener` and close :attr:`target`."""
+        self.stop()
+        self.target.close()
+        super(QueuedHandler, self).close()
+
+
+class QueuedListener(QueueListener):
+    """Listener that writes records from the queue of a :obj:`QueuedHandler`."""
+
+    def __init__(self, queue, *handlers, **kwargs):
+        """Constructor.
+
+        Args:
+            queue (:obj:`queue.Queue`):
+                Queue to get records from.
+            *handlers (:obj:`logging.Handler`):
+                Handlers to write records with.
+            **kwargs:
+                source (:obj:`QueuedHandler`):
+                    Handler that puts records in queue.
+
+        """
+        self.source = kwargs.pop("source")
+        """:obj:`QueuedHandler`: Handler that puts records in the queue."""
+        self.reported = 0
+        """:obj:`int`: Number of dropped records that a warning was written for."""
+        super(QueuedListener, self).__init__(
+            queue, *handlers, respect_handler_level=True
+        )
+
+    def handle(self, record):
+        """Write a record, after a warning if records were dropped before it.
+
+        Args:
+            record (:obj:`logging.LogRecord`):
+                Record to write.
+
+        """
+        self.report(dropped=getattr(record, "dropped_before", 0), name=record.name)
+        super(QueuedListener, self).handle(record)
+
+    def report(self, dropped, name):
+        """Write a warning if dropped is more than :attr:`reported`.
+
+        Args:
+            dropped (:obj:`int`):
+                Number of records dropped so far.
+            name (:obj:`str`):
+                Logger name to use for the warning.
+
+        """
+        if dropped <= self.reported:
+            return
+
+        m = "Dropped {c} log records because the queue of {h} was full"
+        m = m.format(c=dropped - self.reported, h=self.source.name)
+        self.reported = dropped
+        warning = logging.makeLogRecord(
+            {
+                "name": name,
+                "msg": m,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "funcName": "enqueue",
+            }
+        )
+        super(QueuedListener, self).handle(warning)
+
+    def stop(self):
+        """Stop the thread after it writes the records in the queue.
+
+        Notes:
+            Writes a warning for records dropped after the last one written.
+
+        """
+        super(QueuedListener, self).stop()
+        with self.source.dropped_lock:
+            dropped = self.source.dropped
+        self.report(dropped=dropped, name=PACKAGE_ROOT)
+
+    def enqueue_sentinel(self):
+        """Put the stop sentinel in the queue, waiting for space if it is full."""
+        self.queue.put(self._sentinel)
+
+
+@six.python_2_unicode_compatible
+class LazyFormat(object):
+    """Log message that is only formatted if a log record is created for it.
+
+    Notes:
+        Pass this to a log method instead of a formatted str, i.e.
+        ``log.debug(LazyFormat("took {e}", e=elapsed))``. If the logger is not
+        enabled for the level, :meth:`__str__` is never called so the message is
+        never formatted.
+
+    """
+
+    def __init__(self, msg, **kwargs):
+        """Constructor.
+
+        Args:
+            msg (:obj:`str`):
+                Message to format.
+            **kwargs:
+                rest of kwargs:
+                    Passed to msg.format.
+
+        """
+        self.msg = msg
+        """:obj:`str`: Message to format."""
+        self.kwargs = kwargs
+        """:obj:`dict`: Passed to :attr:`msg` format."""
+
+    def __str__(self):
+        """Format the message.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.msg.format(**self.kwargs)
+
+
+@six.python_2_unicode_compatible
+class LazyCall(object):
+    """Log message that is only created by calling a function if it is logged.
+
+    Notes:
+        For messages that are expensive to create, i.e.
+        ``log.debug(LazyCall(result.pretty_bodies))`` only pretty prints the
+        bodies if the logger is enabled for debug.
+
+    """
+
+    def __init__(self, func, **kwargs):
+        """Constructor.
+
+        Args:
+            func (:obj:`callable`):
+                Function that returns the message.
+            **kwargs:
+                rest of kwargs:
+                    Passed to func.
+
+        """
+        self.func = func
+        """:obj:`callable`: Function that returns the message."""
+        self.kwargs = kwargs
+        """:obj:`dict`: Passed to :attr:`func`."""
+
+    def __str__(self):
+        """Call :attr:`func` to create the message.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return format(self.func(**self.kwargs))
+
+
 add_null()
 # Add a null handler by default to silence logging system warnings
 use_gmt()
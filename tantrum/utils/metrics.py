@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+"""In process metrics of requests sent by tantrum."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import bisect
+import contextlib
+import io
+import os
+import threading
+import time
+
+from . import exceptions
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+""":obj:`tuple` of :obj:`float`: Upper bounds in seconds of latency buckets."""
+
+SIZE_BUCKETS = tuple(1024 * 4**x for x in range(11))
+""":obj:`tuple` of :obj:`int`: Upper bounds in bytes of size buckets, 1 KB to 1 GB."""
+
+STAGES = ["serialize", "network", "parse", "build"]
+""":obj:`list` of :obj:`str`: Stages of a request timed in "stage_seconds"."""
+
+
+class Histogram(object):
+    """Counts of observed values in cumulative buckets."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """Constructor.
+
+        Args:
+            buckets (:obj:`tuple` of :obj:`float`, optional):
+                Upper bounds of buckets, in ascending order.
+
+                Defaults to: :data:`LATENCY_BUCKETS`.
+
+        """
+        self.buckets = tuple(buckets)
+        """:obj:`tuple` of :obj:`float`: Upper bounds of buckets."""
+        self.counts = [0] * (len(self.buckets) + 1)
+        """:obj:`list` of :obj:`int`: Count of values in each bucket, the last one
+        is for values over the last upper bound."""
+        self.count = 0
+        """:obj:`int`: Count of all values observed."""
+        self.sum = 0
+        """:obj:`float`: Sum of all values observed."""
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = ["count={!r}".format(self.count), "sum={!r}".format(self.sum)]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    def observe(self, value):
+        """Add a value.
+
+        Args:
+            value (:obj:`float`):
+                Value to add.
+
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        """Get the count of values less than or equal to each upper bound.
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: (upper bound, count), the last upper bound
+            is "+Inf".
+
+        """
+        ret = []
+        total = 0
+        for bound, count in zip(list(self.buckets) + ["+Inf"], self.counts):
+            total += count
+            ret.append((bound, total))
+        return ret
+
+
+class Registry(object):
+    """Thread safe counters and histograms keyed by name and labels."""
+
+    HELP = {
+        "requests_total": "Requests sent.",
+        "stage_seconds": "Seconds spent in each stage of a request.",
+        "request_bytes": "Size of request bodies in bytes.",
+        "response_bytes": "Size of response bodies in bytes.",
+        "auth_total": "Token logins, validates and refreshes.",
+    }
+    """:obj:`dict`: HELP text of known metrics for :meth:`to_prometheus`."""
+
+    BUCKETS = {
+        "stage_seconds": LATENCY_BUCKETS,
+        "request_bytes": SIZE_BUCKETS,
+        "response_bytes": SIZE_BUCKETS,
+    }
+    """:obj:`dict`: Buckets of known histograms, others use
+    :data:`LATENCY_BUCKETS`."""
+
+    def __init__(self, prefix="tantrum", enabled=True):
+        """Constructor.
+
+        Args:
+            prefix (:obj:`str`, optional):
+                Prefix to add to metric names in :meth:`to_prometheus`.
+
+                Defaults to: "tantrum".
+            enabled (:obj:`bool`, optional):
+                Record values. If False, :meth:`incr`, :meth:`observe` and
+                :meth:`timer` do nothing.
+
+                Defaults to: True.
+
+        """
+        self.prefix = prefix
+        """:obj:`str`: Prefix to add to metric names in :meth:`to_prometheus`."""
+        self.enabled = enabled
+        """:obj:`bool`: Record values."""
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = [
+            "enabled={!r}".format(self.enabled),
+            "counters={!r}".format(sorted(self._counters)),
+            "histograms={!r}".format(sorted(self._histograms)),
+        ]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    def check_name(self, name, kind):
+        """Check that name is not already used by a metric of another kind.
+
+        Args:
+            name (:obj:`str`):
+                Name of metric.
+            kind (:obj:`str`):
+                "counter" or "histogram".
+
+        Raises:
+            :exc:`exceptions.ModuleError`:
+                If name is already used by a metric of another kind.
+
+        """
+        other = self._histograms if kind == "counter" else self._counters
+        if name in other:
+            error = "Metric {n!r} can not be used as a {k}, it is already a {o}"
+            error = error.format(
+                n=name, k=kind, o="histogram" if kind == "counter" else "counter"
+            )
+            raise exceptions.ModuleError(error)
+
+    def incr(self, name, labels=None, value=1):
+        """Increment a counter.
+
+        Args:
+            name (:obj:`str`):
+                Name of counter.
+            labels (:obj:`dict`, optional):
+                Labels of counter.
+
+                Defaults to: None.
+            value (:obj:`int`, optional):
+                Amount to increment by.
+
+                Defaults to: 1.
+
+        """
+        if not self.enabled:
+            return
+        key = label_key(labels=labels)
+        with self._lock:
+            self.check_name(name=name, kind="counter")
+            counters = self._counters.setdefault(name, {})
+            counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name, value, labels=None, buckets=None):
+        """Add a value to a histogram.
+
+        Args:
+            name (:obj:`str`):
+                Name of histogram.
+            value (:obj:`float`):
+                Value to add.
+            labels (:obj:`dict`, optional):
+                Labels of histogram.
+
+                Defaults to: None.
+            buckets (:obj:`tuple` of :obj:`float`, optional):
+                Upper bounds of buckets to use if the histogram does not exist yet.
+                If None, uses the buckets for name in :attr:`BUCKETS` or
+                :data:`LATENCY_BUCKETS`.
+
+                Defaults to: None.
+
+        """
+        if not self.enabled:
+            return
+        key = label_key(labels=labels)
+        with self._lock:
+            self.check_name(name=name, kind="histogram")
+            histograms = self._histograms.setdefault(name, {})
+            if key not in histograms:
+                buckets = buckets or self.BUCKETS.get(name, LATENCY_BUCKETS)
+                histograms[key] = Histogram(buckets=buckets)
+            histograms[key].observe(value)
+
+    @contextlib.contextmanager
+    def timer(self, name, labels=None):
+        """Observe the seconds spent in a with block in a histogram.
+
+        Args:
+            name (:obj:`str`):
+                Name of histogram.
+            labels (:obj:`dict`, optional):
+                Labels of histogram.
+
+                Defaults to: None.
+
+        Notes:
+            Nothing is observed if the with block throws an exception.
+
+        """
+        start = time.time()
+        yield
+        self.observe(name=name, value=time.time() - start, labels=labels)
+
+    def reset(self):
+        """Remove all counters and histograms."""
+        with self._lock:
+            self._counters = {}
+            self._histograms = {}
+
+    def snapshot(self):
+        """Get a copy of all counters and histograms.
+
+        Returns:
+            :obj:`dict`: With "counters" and "histograms" keys, each a dict of
+            metric name to a list of dicts of the labels and values of that
+            metric.
+
+        """
+        with self._lock:
+            counters = {
+                name: [
+                    {"labels": dict(key), "value": value}
+                    for key, value in sorted(values.items())
+                ]
+                for name, values in self._counters.items()
+            }
+            histograms = {
+                name: [
+                    {
+                        "labels": dict(key),
+                        "count": hist.count,
+                        "sum": hist.sum,
+                        "buckets": hist.cumulative(),
+                    }
+                    for key, hist in sorted(values.items())
+                ]
+                for name, values in self._histograms.items()
+            }
+        return {"counters": counters, "histograms": histograms}
+
+    def to_prometheus(self):
+        """Get all counters and histograms in the Prometheus text format.
+
+        Returns:
+            :obj:`str`
+
+        """
+        snap = self.snapshot()
+        lines = []
+
+        for name, items in sorted(snap["counters"].items()):
+            full = self.full_name(name=name)
+            lines += prom_header(name=full, kind="counter", text=self.HELP.get(name))
+            for item in items:
+                line = "{n}{lb} {v}"
+                line = line.format(
+                    n=full, lb=prom_labels(labels=item["labels"]), v=item["value"]
+                )
+                lines.append(line)
+
+        for name, items in sorted(snap["histograms"].items()):
+            full = self.full_name(name=name)
+            lines += prom_header(name=full, kind="histogram", text=self.HELP.get(name))
+            for item in items:
+                for bound, count in item["buckets"]:
+                    lb = prom_labels(labels=dict(item["labels"], le=format(bound)))
+                    lines.append("{n}_bucket{lb} {v}".format(n=full, lb=lb, v=count))
+                lb = prom_labels(labels=item["labels"])
+                lines.append("{n}_sum{lb} {v!r}".format(n=full, lb=lb, v=item["sum"]))
+                lines.append("{n}_count{lb} {v}".format(n=full, lb=lb, v=item["count"]))
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write_prometheus(self, path):
+        """Write :meth:`to_prometheus` to a file, i.e. for a node exporter.
+
+        Args:
+            path (:obj:`str`):
+                Path of file to write.
+
+        Notes:
+            The text is written to path + ".tmp" which is then renamed to path, so
+            a reader never sees a partly written file.
+
+        """
+        tmp_path = "{}.tmp".format(path)
+        with io.open(tmp_path, "w", encoding="utf-8") as fh:
+            fh.write(self.to_prometheus())
+        getattr(os, "replace", os.rename)(tmp_path, path)
+
+    def full_name(self, name):
+        """Get the name of a metric with :attr:`prefix`.
+
+        Args:
+            name (:obj:`str`):
+                Name of metric.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return "{}_{}".format(self.prefix, name) if self.prefix else name
+
+
+def label_key(labels):
+    """Get a hashable key for a dict of labels.
+
+    Args:
+        labels (:obj:`dict`):
+            Labels to get key for.
+
+    Returns:
+        :obj:`tuple`
+
+    """
+    return tuple(sorted((k, format(v)) for k, v in (labels or {}).items()))
+
+
+def prom_header(name, kind, text=None):
+    """Get the HELP and TYPE lines of a metric in the Prometheus text format.
+
+    Args:
+        name (:obj:`str`):
+            Full name of metric.
+        kind (:obj:`str`):
+            Type of metric.
+        text (:obj:`str`, optional):
+            HELP text of metric.
+
+            Defaults to: None.
+
+    Returns:
+        :obj:`list` of :obj:`str`
+
+    """
+    lines = []
+    if text:
+        text = text.replace("\\", "\\\\").replace("\n", "\\n")
+        lines.append("# HELP {n} {t}".format(n=name, t=text))
+    lines.append("# TYPE {n} {k}".format(n=name, k=kind))
+    return lines
+
+
+def prom_labels(labels):
+    """Get labels in the Prometheus text format.
+
+    Args:
+        labels (:obj:`dict`):
+            Labels to format.
+
+    Returns:
+        :obj:`str`
+
+    """
+    if not labels:
+        return ""
+    bits = []
+    for k, v in sorted(labels.items(), key=lambda x: (x[0] == "le", x[0])):
+        v = format(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        bits.append('{k}="{v}"'.format(k=k, v=v))
+    return "{{{}}}".format(",".join(bits))
+
+
+REGISTRY = Registry()
+""":obj:`Registry`: Registry that tantrum records request metrics in."""
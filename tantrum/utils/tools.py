@@ -6,9 +6,14 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import base64
+import collections
 from datetime import datetime, timedelta
+import io
+import itertools
+from multiprocessing.pool import ThreadPool
 import os
 import six
+import zlib
 
 from .. import __package__ as PACKAGE_ROOT
 
@@ -167,8 +172,8 @@ def trim_txt(txt, limit=10000):
     """Trim a str if it is over n characters.
 
     Args:
-        txt (:obj:`str`):
-            String to trim.
+        txt (:obj:`str` or :obj:`bytes`):
+            String to trim. Bytes are trimmed then decoded as UTF-8.
         limit (:obj:`int`, optional):
             Number of characters to trim txt to.
 
@@ -179,6 +184,9 @@ def trim_txt(txt, limit=10000):
 
     """
     trim_line = "\n... trimmed over {limit} characters".format(limit=limit)
+    if isinstance(txt, six.binary_type):
+        trim_line = trim_line if len(txt) > limit else ""
+        return txt[:limit].decode("utf-8", "replace") + trim_line
     txt = txt[:limit] + trim_line if len(txt) > limit else txt
     return txt
 
@@ -317,6 +325,191 @@ class Timer(object):
         return self.elapsed_delta
 
 
+GZIP_MAGIC = b"\x1f\x8b"
+""":obj:`bytes`: First bytes of gzip compressed data."""
+
+
+def gunzip_chunks(chunks):
+    """Decompress gzip data from an iterable of bytes as it is read.
+
+    Args:
+        chunks (:obj:`iterable` of :obj:`bytes`):
+            Chunks of data that may be gzip compressed.
+
+    Notes:
+        If the first chunk does not start with :data:`GZIP_MAGIC`, all chunks are
+        yielded as is. Data made up of multiple gzip members is supported.
+
+    Yields:
+        :obj:`bytes`
+
+    """
+    head, chunks = peek_chunks(chunks=chunks, size=len(GZIP_MAGIC))
+    chunks = itertools.chain([head], chunks)
+    if head.startswith(GZIP_MAGIC):
+        chunks = gunzip_members(chunks=chunks)
+    for chunk in chunks:
+        if chunk:
+            yield chunk
+
+
+def peek_chunks(chunks, size):
+    """Read chunks from an iterable of bytes until at least size bytes are read.
+
+    Args:
+        chunks (:obj:`iterable` of :obj:`bytes`):
+            Chunks of data to read.
+        size (:obj:`int`):
+            Number of bytes to read.
+
+    Returns:
+        :obj:`tuple` of (:obj:`bytes`, :obj:`iterator`): The bytes read, which may
+        be less than size if chunks ran out, and an iterator of the rest of chunks.
+
+    """
+    chunks = iter(chunks)
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= size:
+            break
+    return head, chunks
+
+
+def gunzip_members(chunks):
+    """Decompress gzip data made up of one or more members.
+
+    Args:
+        chunks (:obj:`iterable` of :obj:`bytes`):
+            Chunks of gzip compressed data.
+
+    Yields:
+        :obj:`bytes`: May be empty.
+
+    """
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        while chunk:
+            yield decoder.decompress(chunk)
+            chunk = decoder.unused_data
+            if chunk:
+                decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    yield decoder.flush()
+
+
+class ChunkReader(io.RawIOBase):
+    """Read only file-like object that reads from an iterable of bytes."""
+
+    def __init__(self, chunks):
+        """Constructor.
+
+        Args:
+            chunks (:obj:`iterable` of :obj:`bytes`):
+                Chunks of data to read.
+
+        """
+        self._chunks = iter(chunks)
+        self._buffer = b""
+        self._offset = 0
+
+    def readable(self):
+        """Get if this object can be read.
+
+        Returns:
+            :obj:`bool`
+
+        """
+        return True
+
+    def readinto(self, b):
+        """Read bytes from chunks into a pre-allocated bytearray.
+
+        Args:
+            b (:obj:`bytearray`):
+                Buffer to read into.
+
+        Returns:
+            :obj:`int`: Number of bytes read, 0 when all chunks have been read.
+
+        """
+        while self._offset >= len(self._buffer):
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+            self._offset = 0
+        start = self._offset
+        end = min(start + len(b), len(self._buffer))
+        size = end - start
+        b[:size] = self._buffer[start:end]
+        self._offset = end
+        return size
+
+
+def chunk_list(items, size):
+    """Split a list into lists of at most size items.
+
+    Args:
+        items (:obj:`list`):
+            List to split.
+        size (:obj:`int`):
+            Maximum number of items in each chunk.
+            If 0, return all of the items in one chunk.
+
+    Returns:
+        :obj:`list` of :obj:`list`
+
+    """
+    items = list(items)
+    size = size or len(items) or 1
+    chunks = []
+    for start in range(0, len(items), size):
+        stop = start + size
+        chunks.append(items[start:stop])
+    return chunks
+
+
+def iter_threaded(func, calls, workers=4):
+    """Call a function from a pool of threads and yield the returns in order.
+
+    Args:
+        func (:obj:`callable`):
+            Function to call.
+        calls (:obj:`iterable` of :obj:`dict`):
+            Kwargs for each call to func.
+        workers (:obj:`int`, optional):
+            Number of threads to call func from.
+
+            Defaults to: 4.
+
+    Notes:
+        At most workers calls are pending at a time, so calls that have not been
+        reached are not started until the caller consumes the returns before them.
+        If a call raises an exception, it is raised when its return is reached and
+        no more calls are started.
+
+    Yields:
+        :obj:`object`: Return of each call to func, in the same order as calls.
+
+    """
+    workers = max(workers or 1, 1)
+    calls = iter(calls)
+    pending = collections.deque()
+    pool = ThreadPool(processes=workers)
+    try:
+        for kwargs in itertools.islice(calls, workers):
+            pending.append(pool.apply_async(func, kwds=kwargs))
+        while pending:
+            ret = pending.popleft().get()
+            kwargs = next(calls, None)
+            if kwargs is not None:
+                pending.append(pool.apply_async(func, kwds=kwargs))
+            yield ret
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 def calc_percent(part, whole):
     """Utility method for getting percentage of part out of whole
 
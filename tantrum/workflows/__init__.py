@@ -5,13 +5,17 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import contextlib
 import datetime
+import itertools
 import json
+import six
 import time
 
 from collections import OrderedDict
 
 from . import exceptions
+from . import polling
 from .. import utils
 from .. import results
 
@@ -131,6 +135,7 @@ class Clients(Workflow):
         max_page_count=0,
         cache_expiration=600,
         sleep=2,
+        workers=4,
         lvl="info",
         **kwargs
     ):
@@ -164,8 +169,18 @@ class Clients(Workflow):
                 Defaults to: 600.
             sleep (:obj:`int`, optional):
                 Wait N seconds between fetching each page.
+                Only used if workers is 0.
 
                 Defaults to: 2.
+            workers (:obj:`int`, optional):
+                Get up to this many of the pages after the first page at once using
+                :func:`tantrum.utils.tools.iter_threaded`, which limits how hard
+                the API is hit instead of waiting between pages. The http client
+                should have a pool_maxsize of at least this many connections.
+                If 0, get one page at a time and wait sleep seconds between each
+                page.
+
+                Defaults to: 4.
             lvl (:obj:`str`, optional):
                 Logging level.
 
@@ -174,6 +189,11 @@ class Clients(Workflow):
                 rest of kwargs:
                     Passed to :meth:`tantrum.adapter.Adapter.cmd_get`.
 
+        Notes:
+            The first page returns the cache_id and filtered_row_count of the
+            cache of clients, so the row_start of every other page is known
+            before getting them. Pages are always yielded in order.
+
         Yields:
             :obj:`tantrum.api_objects.ApiObjects`: ClientStatus API object
 
@@ -211,10 +231,23 @@ class Clients(Workflow):
         m = m.format(len=received_rows, cache=result_cache)
         log.info(m)
 
-        for obj in result_obj:
+        pages = []
+        if page_size and workers:
+            pages = cls._get_pages_threaded(
+                adapter=adapter,
+                get_args=get_args,
+                page_size=page_size,
+                total_rows=total_rows,
+                received_rows=received_rows,
+                max_page_count=max_page_count,
+                workers=workers,
+                lvl=lvl,
+            )
+
+        for obj in itertools.chain(result_obj, pages):
             yield obj
 
-        if page_size:
+        if page_size and not workers:
             paging_get_args = {k: v for k, v in get_args.items()}
 
             while True:
@@ -238,7 +271,7 @@ class Clients(Workflow):
 
                 paging_result = adapter.cmd_get(**paging_get_args)
 
-                log.debug(result.pretty_bodies())
+                log.debug(utils.logs.LazyCall(paging_result.pretty_bodies))
 
                 paging_result_obj = paging_result()
                 page_rows = len(paging_result_obj)
@@ -249,8 +282,8 @@ class Clients(Workflow):
                     "received_rows={received_rows}",
                     "total_rows={total_rows}",
                 ]
-                m = ", ".join(m)
-                m = m.format(
+                m = utils.logs.LazyFormat(
+                    ", ".join(m),
                     page_rows=page_rows,
                     received_rows=received_rows,
                     total_rows=total_rows,
@@ -262,6 +295,116 @@ class Clients(Workflow):
 
                 time.sleep(sleep)
 
+    @classmethod
+    def _get_pages_threaded(
+        cls,
+        adapter,
+        get_args,
+        page_size,
+        total_rows,
+        received_rows,
+        max_page_count=0,
+        workers=4,
+        lvl="info",
+    ):
+        """Get the pages of Clients after the first page using threads.
+
+        Args:
+            adapter (:obj:`tantrum.adapters.Adapter`):
+                Adapter to use for this workflow.
+            get_args (:obj:`dict`):
+                Kwargs for :meth:`tantrum.adapter.Adapter.cmd_get` used for the
+                first page, including the cache_id of the first page.
+            page_size (:obj:`int`):
+                Number of clients in each page.
+            total_rows (:obj:`int`):
+                Number of clients in the cache from the first page.
+            received_rows (:obj:`int`):
+                Number of clients received in the first page.
+            max_page_count (:obj:`int`, optional):
+                Only fetch up to this many pages, including the first page.
+                If 0, get all pages.
+
+                Defaults to: 0.
+            workers (:obj:`int`, optional):
+                Get this many pages at once using
+                :func:`tantrum.utils.tools.iter_threaded`.
+
+                Defaults to: 4.
+            lvl (:obj:`str`, optional):
+                Logging level.
+
+                Defaults to: "info".
+
+        Yields:
+            :obj:`tantrum.api_objects.ApiObjects`: ClientStatus API object
+
+        """
+        log = utils.logs.get_obj_log(obj=cls, lvl=lvl)
+
+        row_starts = list(range(page_size, total_rows, page_size))
+        if max_page_count:
+            row_starts = row_starts[: max(max_page_count - 1, 0)]
+
+        m = "Getting {c} more pages using {w} workers"
+        m = m.format(c=len(row_starts), w=workers)
+        log.info(m)
+
+        calls = [
+            {
+                "adapter": adapter,
+                "get_args": dict(get_args, row_start=row_start),
+                "lvl": lvl,
+            }
+            for row_start in row_starts
+        ]
+        pages = utils.tools.iter_threaded(
+            func=cls.get_page, calls=calls, workers=workers
+        )
+
+        for paging_result_obj in pages:
+            page_rows = len(paging_result_obj)
+            received_rows += page_rows
+
+            m = [
+                "Received page_rows={page_rows}",
+                "received_rows={received_rows}",
+                "total_rows={total_rows}",
+            ]
+            m = utils.logs.LazyFormat(
+                ", ".join(m),
+                page_rows=page_rows,
+                received_rows=received_rows,
+                total_rows=total_rows,
+            )
+            log.info(m)
+
+            for obj in paging_result_obj:
+                yield obj
+
+    @classmethod
+    def get_page(cls, adapter, get_args, lvl="info"):
+        """Get a page of Clients.
+
+        Args:
+            adapter (:obj:`tantrum.adapters.Adapter`):
+                Adapter to use for this workflow.
+            get_args (:obj:`dict`):
+                Kwargs for :meth:`tantrum.adapter.Adapter.cmd_get`.
+            lvl (:obj:`str`, optional):
+                Logging level.
+
+                Defaults to: "info".
+
+        Returns:
+            :obj:`tantrum.api_objects.ApiObjects`: SystemStatusList API object
+
+        """
+        log = utils.logs.get_obj_log(obj=cls, lvl=lvl)
+        result = adapter.cmd_get(**get_args)
+        log.debug(utils.logs.LazyCall(result.pretty_bodies))
+        return result()
+
     @classmethod
     def get_all(cls, adapter, **kwargs):
         """Get all Clients.
@@ -660,7 +803,7 @@ class Question(Workflow):
         self._check_id()
         result = self.adapter.cmd_get(obj=self.obj)
         self._last_result = result
-        self.obj = result()
+        self.obj = result(validate=False)
 
     def ask(self, **kwargs):
         """Ask the question.
@@ -737,14 +880,14 @@ class Question(Workflow):
 
         self._last_result = result
 
-        infos = result()
+        infos = result(validate=False)
 
         self._last_infos = infos
 
         m = "Received answers info: {infos}"
-        m = m.format(infos=infos.serialize())
+        m = utils.logs.LazyFormat(m, infos=utils.logs.LazyCall(infos.serialize))
         self.log.debug(m)
-        self.log.debug(format(self))
+        self.log.debug(utils.logs.LazyCall(self.__str__))
 
         return infos
 
@@ -755,6 +898,7 @@ class Question(Workflow):
         poll_total=0,
         poll_sleep=5,
         max_poll_count=0,
+        poller=None,
         **kwargs
     ):
         """Poll for answers from clients for this question.
@@ -762,6 +906,7 @@ class Question(Workflow):
         Args:
             poll_sleep (:obj:`int`, optional):
                 Check for answers every N seconds.
+                Not used if poller is supplied.
 
                 Defaults to: 5.
             poll_pct (:obj:`int`, optional):
@@ -782,6 +927,13 @@ class Question(Workflow):
                 If not 0, only poll N times.
 
                 Defaults to: 0.
+            poller (:obj:`tantrum.workflows.polling.Poller`, optional):
+                Polling strategy that decides how long to wait between polls
+                based on mr_passed out of poll_pct of the total.
+                If None, uses a :obj:`tantrum.workflows.polling.Poller` with an
+                interval of poll_sleep.
+
+                Defaults to: None.
             **kwargs:
                 rest of kwargs:
                     Passed to :meth:`answers_get_info`.
@@ -805,7 +957,7 @@ class Question(Workflow):
             stop_dt = self.expiration["expiration"]
 
         m = "Start polling loop for answers until for {o} until {stop_dt}"
-        m = m.format(o=self, stop_dt=stop_dt)
+        m = utils.logs.LazyFormat(m, o=self, stop_dt=stop_dt)
         self.log.debug(m)
 
         infos = self.answers_get_info(**kwargs)
@@ -817,12 +969,17 @@ class Question(Workflow):
             this_total = poll_total
 
         now_pct = utils.tools.calc_percent(part=info.mr_passed, whole=this_total)
+        poll_target = utils.tools.calc_percent_of(percent=poll_pct, whole=this_total)
+
+        poller = poller or polling.Poller(interval=poll_sleep)
+        poller.start()
+        poller.update(done=info.mr_passed, total=poll_target)
 
         poll_count = 0
         while True:
             poll_count += 1
             m = "New polling loop #{c} for {o}"
-            m = m.format(c=poll_count, o=self)
+            m = utils.logs.LazyFormat(m, c=poll_count, o=self)
             self.log.debug(m)
 
             if now_pct >= poll_pct:
@@ -851,6 +1008,7 @@ class Question(Workflow):
 
             infos = self.answers_get_info(**kwargs)
             info = infos[0]
+            poller.update(done=info.mr_passed, total=poll_target)
 
             now_pct = utils.tools.calc_percent(part=info.mr_passed, whole=this_total)
 
@@ -870,7 +1028,8 @@ class Question(Workflow):
             )
             self.log.info(m)
 
-            time.sleep(poll_sleep)
+            stop_secs = (stop_dt - datetime.datetime.utcnow()).total_seconds()
+            poller.wait(limit=stop_secs)
 
         end = datetime.datetime.utcnow()
         elapsed = end - start
@@ -881,14 +1040,15 @@ class Question(Workflow):
             "estimated clients: {info.estimated_total}",
             "rows in answers: {info.row_count}",
             "poll count: {c}",
+            "polls saved: {p.polls_saved}",
         ]
         m = ", ".join(m)
-        m = m.format(dt=elapsed, info=info, c=poll_count)
+        m = m.format(dt=elapsed, info=info, c=poll_count, p=poller)
         self.log.info(m)
 
         return infos
 
-    def answers_get_data(self, hashes=False, **kwargs):
+    def answers_get_data(self, hashes=False, columns=None, predicate=None, **kwargs):
         """Get the answers for this question.
 
         Args:
@@ -896,6 +1056,14 @@ class Question(Workflow):
                 Have the API include the hashes of rows values.
 
                 Defaults to: False.
+            columns (:obj:`list` of :obj:`str`, optional):
+                Only deserialize the columns with these names.
+
+                Defaults to: None.
+            predicate (:obj:`callable`, optional):
+                Only deserialize the rows that this returns True for.
+
+                Defaults to: None.
             **kwargs:
                 rest of kwargs:
                     Passed to :meth:`tantrum.adapter.Adapter.cmd_get_result_data`.
@@ -904,6 +1072,9 @@ class Question(Workflow):
             This will not use any paging, which means ALL answers will be returned
             in one API response. For large data sets of answers, this is unwise.
 
+            columns and predicate are applied while the answers are parsed, see
+            :class:`tantrum.results.RowProjection`.
+
         Returns:
             :obj:`tantrum.api_models.ApiModel`: ResultDataList API Object
 
@@ -927,7 +1098,7 @@ class Question(Workflow):
         m = m.format(dt=elapsed)
         self.log.info(m)
 
-        datas = result()
+        datas = result(columns=columns, predicate=predicate)
         self._last_datas = datas
         return datas
 
@@ -939,6 +1110,8 @@ class Question(Workflow):
         cache_expiration=900,
         hashes=False,
         sleep=5,
+        columns=None,
+        predicate=None,
         **kwargs
     ):
         """Get the answers for this question one page at a time.
@@ -969,6 +1142,14 @@ class Question(Workflow):
                 Wait N seconds between fetching each page.
 
                 Defaults to: 5.
+            columns (:obj:`list` of :obj:`str`, optional):
+                Only deserialize the columns with these names.
+
+                Defaults to: None.
+            predicate (:obj:`callable`, optional):
+                Only deserialize the rows that this returns True for.
+
+                Defaults to: None.
             **kwargs:
                 rest of kwargs:
                     Passed to :meth:`tantrum.adapter.Adapter.cmd_get_result_data`.
@@ -977,6 +1158,9 @@ class Question(Workflow):
             If max_page_count and max_row_count are 0, fetch pages until a page
             returns no answers or the expected row count is hit.
 
+            The expected row count and max_row_count are compared to the number of
+            rows read from each page before predicate is applied.
+
         Returns:
             :obj:`tantrum.api_models.ApiModel`: ResultDataList API Object
 
@@ -999,10 +1183,11 @@ class Question(Workflow):
 
         self._last_result = result
 
-        datas = result()
+        datas = result(columns=columns, predicate=predicate)
         self._last_datas = datas
 
         data = datas[0]
+        read_count = get_read_count(result=result, rows=data.rows)
 
         cmd_args["cache_id"] = data.cache_id
         cmd_args["row_start"] += page_size
@@ -1018,17 +1203,17 @@ class Question(Workflow):
 
         all_rows = data.rows
         page_count = 1
-        page_rows = all_rows
+        page_read_count = read_count
 
         while True:
 
-            if len(all_rows or []) >= data.row_count:
+            if read_count >= data.row_count:
                 m = "Received expected row_count {c}, considering all answers received"
                 m = m.format(c=data.row_count)
                 self.log.info(m)
                 break
 
-            if not page_rows:
+            if not page_read_count:
                 m = "Received a page with no answers, considering all answers received"
                 self.log.info(m)
                 break
@@ -1039,7 +1224,7 @@ class Question(Workflow):
                 self.log.info(m)
                 break
 
-            if max_row_count and len(all_rows or []) >= max_row_count:
+            if max_row_count and read_count >= max_row_count:
                 m = "Hit max pages of {max_row_count}, considering all answers received"
                 m = m.format(max_row_count=max_row_count)
                 self.log.info(m)
@@ -1051,11 +1236,13 @@ class Question(Workflow):
 
             # this should catch errors where API returns result data as None sometimes
             # need to refetch data for N retries if that happens
-            page_datas = page_result()
+            page_datas = page_result(columns=columns, predicate=predicate)
             self._last_datas = page_datas
 
             page_data = page_datas[0]
             page_rows = page_data.rows
+            page_read_count = get_read_count(result=page_result, rows=page_rows)
+            read_count += page_read_count
 
             m = "Received page #{c} answers: {rows}"
             m = m.format(c=page_count, rows=len(page_rows or []))
@@ -1075,6 +1262,195 @@ class Question(Workflow):
 
         return datas
 
+    def answers_iter_pages(
+        self,
+        page_size=1000,
+        max_page_count=0,
+        max_row_count=0,
+        cache_expiration=900,
+        hashes=False,
+        prefetch=2,
+        columns=None,
+        predicate=None,
+        **kwargs
+    ):
+        """Get the answers for this question one page at a time as an iterator.
+
+        Args:
+            page_size (:obj:`int`, optional):
+                Size of each page to fetch at a time.
+
+                Defaults to: 1000.
+            max_page_count (:obj:`int`, optional):
+                Only fetch up to this many pages. If 0, get all pages.
+
+                Defaults to: 0.
+            max_row_count (:obj:`int`, optional):
+                Only fetch up to this many rows.
+
+                Defaults to: 0.
+            cache_expiration (:obj:`int`, optional):
+                Have the API keep the cache_id that is created on initial get
+                answers page alive for N seconds.
+
+                Defaults to: 900.
+            hashes (:obj:`bool`, optional):
+                Have the API include the hashes of rows values
+
+                Defaults to: False.
+            prefetch (:obj:`int`, optional):
+                Fetch up to this many pages in the background while the current
+                page is being consumed using :func:`tantrum.utils.tools.iter_threaded`.
+                If 0, fetch each page only when it is needed.
+
+                Defaults to: 2.
+            columns (:obj:`list` of :obj:`str`, optional):
+                Only deserialize the columns with these names.
+
+                Defaults to: None.
+            predicate (:obj:`callable`, optional):
+                Only deserialize the rows that this returns True for.
+
+                Defaults to: None.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`tantrum.adapter.Adapter.cmd_get_result_data`.
+
+        Notes:
+            Uses the same cache_id and row_start logic as
+            :meth:`answers_get_data_paged`, but only holds the pages that have
+            been prefetched instead of every page. Fetching stops at the expected
+            row_count or at the first page with no answers.
+
+            Pages that have no rows left after predicate is applied are not
+            yielded.
+
+        Yields:
+            :obj:`tantrum.api_models.ApiModel`: RowList API Object
+
+        """
+        self._check_id()
+
+        start = datetime.datetime.utcnow()
+
+        cmd_args = {}
+        cmd_args.update(kwargs)
+        cmd_args["obj"] = self.obj
+        cmd_args["row_start"] = 0
+        cmd_args["row_count"] = page_size
+        cmd_args["cache_expiration"] = cache_expiration
+        cmd_args["include_hashes_flag"] = hashes
+
+        data_args = {"columns": columns, "predicate": predicate}
+
+        result, datas = self._get_data_page(cmd_args=cmd_args, data_args=data_args)
+        self._last_result = result
+        self._last_datas = datas
+
+        data = datas[0]
+        read_count = get_read_count(result=result, rows=data.rows)
+
+        m = [
+            "Received initial answers: {d.rows}",
+            "expected row_count: {d.row_count}",
+            "estimated total clients: {d.estimated_total}",
+        ]
+        m = ", ".join(m)
+        m = m.format(d=data)
+        self.log.info(m)
+
+        if not read_count:
+            return
+
+        cmd_args["cache_id"] = data.cache_id
+        row_count = len(data.rows)
+
+        if data.rows:
+            yield data.rows
+
+        row_starts = list(range(page_size, data.row_count or 0, page_size))
+        if max_page_count:
+            row_starts = row_starts[: max(max_page_count - 1, 0)]
+        if max_row_count:
+            row_starts = [x for x in row_starts if x < max_row_count]
+
+        calls = [
+            {"cmd_args": dict(cmd_args, row_start=x), "data_args": data_args}
+            for x in row_starts
+        ]
+        if prefetch:
+            pages = utils.tools.iter_threaded(
+                func=self._get_data_page, calls=calls, workers=prefetch
+            )
+        else:
+            pages = (self._get_data_page(**call) for call in calls)
+
+        try:
+            for page_count, (page_result, page_datas) in enumerate(pages, 2):
+                self._last_result = page_result
+                self._last_datas = page_datas
+                page_rows = page_datas[0].rows
+
+                m = "Received page #{c} answers: {rows}"
+                m = m.format(c=page_count, rows=len(page_rows or []))
+                self.log.info(m)
+
+                if not get_read_count(result=page_result, rows=page_rows):
+                    m = "Received a page with no answers, considering all answers in"
+                    self.log.info(m)
+                    break
+
+                if not page_rows:
+                    continue
+
+                row_count += len(page_rows)
+                yield page_rows
+        finally:
+            pages.close()
+
+        end = datetime.datetime.utcnow()
+        elapsed = end - start
+
+        m = "Finished getting {rows} answers in {dt}"
+        m = m.format(rows=row_count, dt=elapsed)
+        self.log.info(m)
+
+    def answers_iter_rows(self, **kwargs):
+        """Get the answers for this question one row at a time as an iterator.
+
+        Args:
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`Question.answers_iter_pages`.
+
+        Yields:
+            :obj:`tantrum.api_models.ApiModel`: Row API Object
+
+        """
+        for page_rows in self.answers_iter_pages(**kwargs):
+            for row in page_rows:
+                yield row
+
+    def _get_data_page(self, cmd_args, data_args=None):
+        """Get a page of answers for this question.
+
+        Args:
+            cmd_args (:obj:`dict`):
+                Kwargs for :meth:`tantrum.adapter.Adapter.cmd_get_result_data`.
+            data_args (:obj:`dict`, optional):
+                Kwargs for :meth:`tantrum.results.Soap.data_api`.
+
+                Defaults to: None.
+
+        Returns:
+            :obj:`tuple` of (:obj:`tantrum.results.Result`,
+            :obj:`tantrum.api_models.ApiModel`): The result and the ResultDataList
+            API Object from the result.
+
+        """
+        result = self.adapter.cmd_get_result_data(**cmd_args)
+        return result, result(**(data_args or {}))
+
     def answers_sse_start_xml(self, hashes=False, **kwargs):
         """Start up a server side export for XML format and get an export_id.
 
@@ -1252,7 +1628,9 @@ class Question(Workflow):
 
         return status
 
-    def answers_sse_poll(self, export_id, poll_sleep=5, max_poll_count=0, **kwargs):
+    def answers_sse_poll(
+        self, export_id, poll_sleep=5, max_poll_count=0, poller=None, **kwargs
+    ):
         """Poll a server side export for completion.
 
         Args:
@@ -1261,12 +1639,20 @@ class Question(Workflow):
                 :meth:`answers_sse_start_csv` or :meth:`answers_sse_start_cef`.
             poll_sleep (:obj:`int`, optional):
                 Check for answers every N seconds.
+                Not used if poller is supplied.
 
                 Defaults to: 5.
             max_poll_count (:obj:`int`, optional):
                 If not 0, only poll N times.
 
                 Defaults to: 0.
+            poller (:obj:`tantrum.workflows.polling.Poller`, optional):
+                Polling strategy that decides how long to wait between polls
+                based on the progress percent of the export status.
+                If None, uses a :obj:`tantrum.workflows.polling.Poller` with an
+                interval of poll_sleep.
+
+                Defaults to: None.
             **kwargs:
                 rest of kwargs:
                     Passed to :meth:`answers_sse_get_status`.
@@ -1287,6 +1673,10 @@ class Question(Workflow):
 
         status = self.answers_sse_get_status(**sse_args)
 
+        poller = poller or polling.Poller(interval=poll_sleep)
+        poller.start()
+        poller.update(done=sse_progress(status), total=100)
+
         while True:
             poll_count += 1
 
@@ -1312,14 +1702,15 @@ class Question(Workflow):
                 m = m.format(status=status)
                 raise exceptions.ModuleError(m)
 
-            time.sleep(poll_sleep)
+            poller.wait()
             status = self.answers_sse_get_status(**sse_args)
+            poller.update(done=sse_progress(status), total=100)
 
         end = datetime.datetime.utcnow()
         elapsed = end - start
 
-        m = "Finished polling for Server Side Export in {dt}, {status}"
-        m = m.format(dt=elapsed, status=status)
+        m = "Finished polling for Server Side Export in {dt}, {status}, {p}"
+        m = m.format(dt=elapsed, status=status, p=poller)
         self.log.info(m)
 
         return status
@@ -1396,6 +1787,557 @@ class Question(Workflow):
 
         return data
 
+    def answers_sse_iter_chunks(
+        self, export_id, chunk_size=65536, decompress=True, progress=None, **kwargs
+    ):
+        """Stream the data of a server side export in chunks.
+
+        Args:
+            export_id (:obj:`str`):
+                An export id returned from :meth:`answers_sse_start_xml` or
+                :meth:`answers_sse_start_csv` or :meth:`answers_sse_start_cef`.
+            chunk_size (:obj:`int`, optional):
+                Number of bytes to read from the response at a time.
+
+                Defaults to: 65536.
+            decompress (:obj:`bool`, optional):
+                Decompress the data if it is gzip compressed.
+
+                Defaults to: True.
+            progress (:obj:`callable`, optional):
+                Called with the number of bytes received so far and the total
+                number of bytes from the Content-Length header (None if unknown)
+                after each chunk is received.
+
+                Defaults to: None.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`tantrum.adapters.ApiClient`.
+
+        Notes:
+            The response body is never read into memory as a whole, the
+            response is closed once all chunks are read or the generator is
+            closed.
+
+        Yields:
+            :obj:`bytes`
+
+        """
+        self._check_id()
+
+        client_args = {}
+        client_args.update(kwargs)
+        client_args["method"] = "get"
+        client_args["path"] = "export/{export_id}.gz".format(export_id=export_id)
+        client_args["data"] = ""
+        client_args["stream"] = True
+
+        r = self.adapter.api_client(**client_args)
+
+        total = r.headers.get("Content-Length")
+        total = int(total) if total and total.isdigit() else None
+
+        m = [
+            "Received SSE data response",
+            "code: {r.status_code}",
+            "export_id: {e!r}",
+            "size: {t}",
+        ]
+        m = ", ".join(m)
+        m = m.format(r=r, e=export_id, t=total)
+        self.log.info(m)
+
+        def iter_received():
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                if progress:
+                    # bytes read off the wire, before any content-encoding decoding
+                    progress(r.raw.tell(), total)
+                yield chunk
+
+        start = datetime.datetime.utcnow()
+        size = 0
+
+        try:
+            chunks = iter_received()
+            if decompress:
+                chunks = utils.tools.gunzip_chunks(chunks)
+            for chunk in chunks:
+                size += len(chunk)
+                yield chunk
+        finally:
+            r.close()
+
+        end = datetime.datetime.utcnow()
+        elapsed = end - start
+
+        m = "Finished streaming {size} bytes of SSE data for export_id {e!r} in {dt}"
+        m = m.format(size=size, e=export_id, dt=elapsed)
+        self.log.info(m)
+
+    def answers_sse_download(self, export_id, sink, **kwargs):
+        """Stream the data of a server side export to a file.
+
+        Args:
+            export_id (:obj:`str`):
+                An export id returned from :meth:`answers_sse_start_xml` or
+                :meth:`answers_sse_start_csv` or :meth:`answers_sse_start_cef`.
+            sink (:obj:`str` or :obj:`io.IOBase`):
+                Path of file to write to, or a file-like object opened in binary
+                mode to write to.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`answers_sse_iter_chunks`.
+
+        Returns:
+            :obj:`int`: Number of bytes written to sink.
+
+        """
+        size = 0
+        with open_sink(sink) as fh:
+            for chunk in self.answers_sse_iter_chunks(export_id=export_id, **kwargs):
+                fh.write(chunk)
+                size += len(chunk)
+
+        m = "Wrote {size} bytes of SSE data for export_id {e!r} to {s!r}"
+        m = m.format(size=size, e=export_id, s=getattr(sink, "name", sink))
+        self.log.info(m)
+        return size
+
+    def answers_sse_iter_rows(
+        self, export_id, sink=None, columns=None, predicate=None, **kwargs
+    ):
+        """Stream the data of a server side export and deserialize rows as read.
+
+        Args:
+            export_id (:obj:`str`):
+                An export id returned from :meth:`answers_sse_start_xml`.
+            sink (:obj:`str` or :obj:`io.IOBase`, optional):
+                Also write the data to this path or file-like object opened in
+                binary mode.
+
+                Defaults to: None.
+            columns (:obj:`list` of :obj:`str`, optional):
+                Only deserialize the columns with these names.
+
+                Defaults to: None.
+            predicate (:obj:`callable`, optional):
+                Only deserialize the rows that this returns True for.
+
+                Defaults to: None.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`answers_sse_iter_chunks`.
+
+        Raises:
+            :exc:`exceptions.ModuleError`:
+                If export_id is not an XML format export.
+
+        Notes:
+            Memory use stays flat regardless of the number of rows in the export,
+            see :func:`tantrum.results.iter_result_set_rows`.
+
+        Yields:
+            :obj:`tantrum.api_models.ApiItem`: Row objects.
+
+        """
+        if "xml" not in export_id:
+            m = "Can only deserialize rows from an XML export, export_id: {e!r}"
+            m = m.format(e=export_id)
+            raise exceptions.ModuleError(m)
+
+        kwargs["decompress"] = True
+        chunks = self.answers_sse_iter_chunks(export_id=export_id, **kwargs)
+
+        with open_sink(sink) as fh:
+            if fh is not None:
+                chunks = tee_chunks(chunks=chunks, fh=fh)
+
+            rows = results.iter_result_set_rows(
+                chunks=chunks,
+                api_objects=self.api_objects,
+                columns=columns,
+                predicate=predicate,
+            )
+            for row in rows:
+                yield row
+
+
+class QuestionBatch(Workflow):
+    def __init__(self, adapter, obj, lvl="info", result=None, questions=None):
+        """Constructor.
+
+        Args:
+            adapter (:obj:`tantrum.adapters.Adapter`):
+                Adapter to use for this workflow.
+            obj (:obj:`tantrum.api_models.ApiModel`):
+                QuestionList API Object to use for this workflow.
+            lvl (:obj:`str`, optional):
+                Logging level.
+
+                Defaults to: "info".
+            result (:obj:`tantrum.results.Result`, optional):
+                Result object that ``obj`` was generated from.
+
+                Defaults to: None.
+            questions (:obj:`list` of :obj:`Question`, optional):
+                Question workflows of each item in obj.
+                If None, a :obj:`Question` is created for each item in obj.
+
+                Defaults to: None.
+
+        """
+        super(QuestionBatch, self).__init__(
+            adapter=adapter, obj=obj, lvl=lvl, result=result
+        )
+        if questions is None:
+            questions = [Question(adapter=adapter, obj=x, lvl=lvl) for x in obj]
+        self.questions = questions
+        """:obj:`list` of :obj:`Question`: Question workflows in this batch."""
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            (:obj:`str`)
+
+        """
+        ctmpl = "{c.__module__}.{c.__name__}".format
+        ids = [question.obj.id for question in self.questions]
+        bits = "(count={c}, ids={ids})".format(c=len(self.questions), ids=ids)
+        cls = ctmpl(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __len__(self):
+        """Get the number of questions in this batch.
+
+        Returns:
+            :obj:`int`
+
+        """
+        return len(self.questions)
+
+    def __iter__(self):
+        """Iterate over the question workflows in this batch.
+
+        Yields:
+            :obj:`Question`
+
+        """
+        for question in self.questions:
+            yield question
+
+    @classmethod
+    def new(cls, adapter, questions, lvl="info"):
+        """Create a new QuestionBatch workflow.
+
+        Args:
+            adapter (:obj:`tantrum.adapters.Adapter`):
+                Adapter to use for this workflow.
+            questions (:obj:`list` of :obj:`Question` or :obj:`list` of Question
+                API Objects):
+                Questions to put in this batch.
+            lvl (:obj:`str`, optional):
+                Logging level.
+
+                Defaults to: "info".
+
+        Returns:
+            :obj:`QuestionBatch`
+
+        """
+        questions = [
+            x if isinstance(x, Question) else Question(adapter=adapter, obj=x, lvl=lvl)
+            for x in questions
+        ]
+        obj = adapter.api_objects.QuestionList(*[x.obj for x in questions])
+        return cls(adapter=adapter, obj=obj, lvl=lvl, questions=questions)
+
+    def _sync_obj(self):
+        """Update :attr:`Workflow.obj` from the objects of :attr:`questions`."""
+        self.obj = self.api_objects.QuestionList(*[x.obj for x in self.questions])
+
+    def _run(self, method, questions, workers, **kwargs):
+        """Call a method of many question workflows from a pool of threads.
+
+        Args:
+            method (:obj:`str`):
+                Name of method of :obj:`Question` to call.
+            questions (:obj:`list` of :obj:`Question`):
+                Question workflows to call method of.
+            workers (:obj:`int`):
+                Passed to :func:`tantrum.utils.tools.iter_threaded`.
+            **kwargs:
+                rest of kwargs:
+                    Passed to method.
+
+        Returns:
+            :obj:`list`: Return of method for each question, in the same order as
+            questions.
+
+        """
+        calls = [{"obj": x, "method": method, "kwargs": kwargs} for x in questions]
+        rets = utils.tools.iter_threaded(func=call_method, calls=calls, workers=workers)
+        return list(rets)
+
+    def ask(self, workers=10, **kwargs):
+        """Ask all of the questions concurrently.
+
+        Args:
+            workers (:obj:`int`, optional):
+                Ask this many questions at once.
+
+                Defaults to: 10.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`Question.ask`.
+
+        """
+        start = datetime.datetime.utcnow()
+
+        self._run(method="ask", questions=self.questions, workers=workers, **kwargs)
+        self._sync_obj()
+
+        end = datetime.datetime.utcnow()
+        elapsed = end - start
+
+        m = "Finished asking {c} questions in {dt}: {ids}"
+        m = m.format(c=len(self), dt=elapsed, ids=[x.obj.id for x in self.questions])
+        self.log.info(m)
+
+    def answers_get_info(self, workers=10, **kwargs):
+        """Return the ResultInfo for all of the questions concurrently.
+
+        Args:
+            workers (:obj:`int`, optional):
+                Get the ResultInfo of this many questions at once.
+
+                Defaults to: 10.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`Question.answers_get_info`.
+
+        Notes:
+            GetResultInfo only returns the info of the first object in a request,
+            so each question still needs its own request.
+
+        Returns:
+            :obj:`list` of :obj:`tantrum.api_models.ApiModel`: ResultInfoList API
+            Object of each question.
+
+        """
+        return self._run(
+            method="answers_get_info",
+            questions=self.questions,
+            workers=workers,
+            **kwargs
+        )
+
+    def answers_poll(
+        self,
+        poll_pct=99,
+        poll_secs=0,
+        poll_sleep=5,
+        max_poll_count=0,
+        poller=None,
+        workers=10,
+        **kwargs
+    ):
+        """Poll for answers from clients for all of the questions from one loop.
+
+        Args:
+            poll_pct (:obj:`int`, optional):
+                Wait until the percentage of clients total is N percent for each
+                question.
+
+                Defaults to: 99.
+            poll_secs (:obj:`int`, optional):
+                If not 0, wait until N seconds for pct of clients total instead of
+                until the last question expiration.
+
+                Defaults to: 0.
+            poll_sleep (:obj:`int`, optional):
+                Check for answers every N seconds.
+                Not used if poller is supplied.
+
+                Defaults to: 5.
+            max_poll_count (:obj:`int`, optional):
+                If not 0, only poll N times.
+
+                Defaults to: 0.
+            poller (:obj:`tantrum.workflows.polling.Poller`, optional):
+                Polling strategy that decides how long to wait between polls
+                based on mr_passed out of poll_pct of the total of all questions.
+                If None, uses a :obj:`tantrum.workflows.polling.Poller` with an
+                interval of poll_sleep.
+
+                Defaults to: None.
+            workers (:obj:`int`, optional):
+                Passed to :meth:`QuestionBatch.answers_get_info`.
+
+                Defaults to: 10.
+            **kwargs:
+                rest of kwargs:
+                    Passed to :meth:`Question.answers_get_info`.
+
+        Notes:
+            Each poll only gets the ResultInfo of the questions that have not
+            reached poll_pct or expired yet, so the time spent polling depends on
+            the slowest question instead of the sum of all of the questions.
+
+        Returns:
+            :obj:`list` of :obj:`tantrum.api_models.ApiModel`: ResultInfoList API
+            Object of each question.
+
+        """
+        for question in self.questions:
+            question._check_id()
+
+        start = datetime.datetime.utcnow()
+
+        if poll_secs:
+            stop_dt = start + datetime.timedelta(seconds=poll_secs)
+        else:
+            stop_dt = max(x.expiration["expiration"] for x in self.questions)
+
+        m = "Start polling loop for answers for {o} until {stop_dt}"
+        m = utils.logs.LazyFormat(m, o=self, stop_dt=stop_dt)
+        self.log.debug(m)
+
+        infos = [None] * len(self)
+        pending = list(range(len(self)))
+        poller = poller or polling.Poller(interval=poll_sleep)
+        poller.start()
+
+        poll_count = 0
+        while True:
+            poll_count += 1
+
+            questions = [self.questions[idx] for idx in pending]
+            new_infos = self._run(
+                method="answers_get_info",
+                questions=questions,
+                workers=workers,
+                **kwargs
+            )
+            for idx, info in zip(pending, new_infos):
+                infos[idx] = info
+
+            done = 0
+            target = 0
+            still_pending = []
+            for idx, question in zip(pending, questions):
+                info = infos[idx][0]
+                this_total = info.estimated_total
+                now_pct = utils.tools.calc_percent(
+                    part=info.mr_passed, whole=this_total
+                )
+                done += info.mr_passed or 0
+                target += utils.tools.calc_percent_of(
+                    percent=poll_pct, whole=this_total or 0
+                )
+                if now_pct < poll_pct and not question.expiration["expired"]:
+                    still_pending.append(idx)
+            pending = still_pending
+            poller.update(done=done, total=target)
+
+            m = [
+                "Answers in for {a} out of {c} questions",
+                "{done} out of {target} clients for the rest",
+                "poll count: {pc}",
+            ]
+            m = ", ".join(m)
+            m = m.format(
+                a=len(self) - len(pending),
+                c=len(self),
+                done=done,
+                target=int(target),
+                pc=poll_count,
+            )
+            self.log.info(m)
+
+            if not pending:
+                m = "Reached {pct} for all questions, considering all answers in"
+                m = m.format(pct=PCT_FMT(poll_pct))
+                self.log.info(m)
+                break
+
+            if datetime.datetime.utcnow() >= stop_dt:
+                m = "Reached stop_dt {stop_dt}, considering all answers in"
+                m = m.format(stop_dt=stop_dt)
+                self.log.info(m)
+                break
+
+            if max_poll_count and poll_count >= max_poll_count:
+                m = "Reached max poll count {c}, considering all answers in"
+                m = m.format(c=max_poll_count)
+                self.log.info(m)
+                break
+
+            stop_secs = (stop_dt - datetime.datetime.utcnow()).total_seconds()
+            poller.wait(limit=stop_secs)
+
+        end = datetime.datetime.utcnow()
+        elapsed = end - start
+
+        m = [
+            "Finished polling {c} questions in: {dt}",
+            "poll count: {pc}",
+            "polls saved: {p.polls_saved}",
+        ]
+        m = ", ".join(m)
+        m = m.format(c=len(self), dt=elapsed, pc=poll_count, p=poller)
+        self.log.info(m)
+
+        return infos
+
+    def answers_get_merged_data(self, chunk_size=50, workers=4, **kwargs):
+        """Get the answers for all of the questions using merged result data.
+
+        Args:
+            chunk_size (:obj:`int`, optional):
+                Get the merged result data of N questions in each request.
+                If 0, get all of the questions in one request.
+
+                Defaults to: 50.
+            workers (:obj:`int`, optional):
+                Get the merged result data of this many chunks at once.
+
+                Defaults to: 4.
+            **kwargs:
+                rest of kwargs:
+                    Passed to
+                    :meth:`tantrum.adapter.Adapter.cmd_get_merged_result_data`.
+
+        Returns:
+            :obj:`list` of :obj:`tantrum.api_models.ApiModel`: ResultDataList API
+            Object of each chunk of questions.
+
+        """
+        for question in self.questions:
+            question._check_id()
+
+        start = datetime.datetime.utcnow()
+
+        objs = [x.obj for x in self.questions]
+        chunks = utils.tools.chunk_list(items=objs, size=chunk_size)
+        calls = [
+            {"adapter": self.adapter, "objlist": chunk, "kwargs": kwargs}
+            for chunk in chunks
+        ]
+        datas = utils.tools.iter_threaded(
+            func=get_merged_result_data, calls=calls, workers=workers
+        )
+        datas = list(datas)
+
+        end = datetime.datetime.utcnow()
+        elapsed = end - start
+
+        m = "Finished getting merged answers for {c} questions in {n} chunks in {dt}"
+        m = m.format(c=len(objs), n=len(chunks), dt=elapsed)
+        self.log.info(m)
+
+        return datas
+
 
 class ParsedQuestion(Workflow):
     def __str__(self):
@@ -1438,7 +2380,7 @@ class ParsedQuestion(Workflow):
 
             if not sensor.parameter_definition:
                 m = "No parameters defined on sensor {s}, going to next"
-                m = m.format(s=sensor)
+                m = utils.logs.LazyFormat(m, s=sensor)
                 self.log.debug(m)
                 continue
 
@@ -1458,7 +2400,7 @@ class ParsedQuestion(Workflow):
                 sensor.parameters.append(param_cls(key=key, value=value))
 
                 m = "Mapped parameter {k!r}='{v}' for {s}"
-                m = m.format(k=key, v=value, s=sensor)
+                m = utils.logs.LazyFormat(m, k=key, v=value, s=sensor)
                 self.log.debug(m)
 
     def map_group_params(self, pq, group):
@@ -1484,7 +2426,7 @@ class ParsedQuestion(Workflow):
                 return
 
             m = "Now mapping parameters for group filter: {gf}"
-            m = m.format(gf=group_filter)
+            m = utils.logs.LazyFormat(m, gf=group_filter)
             self.log.debug(m)
 
             sensor_id = group_filter.sensor.id
@@ -1492,7 +2434,7 @@ class ParsedQuestion(Workflow):
 
             if not sensor.parameter_definition:
                 m = "No parameters defined on sensor {s}, going to next"
-                m = m.format(s=sensor)
+                m = utils.logs.LazyFormat(m, s=sensor)
                 self.log.debug(m)
                 continue
 
@@ -1511,7 +2453,7 @@ class ParsedQuestion(Workflow):
                 sensor.parameters.append(param_cls(key=key, value=value))
 
                 m = "Mapped parameter {k!r}='{v}' for {s}"
-                m = m.format(k=key, v=value, s=sensor)
+                m = utils.logs.LazyFormat(m, k=key, v=value, s=sensor)
                 self.log.debug(m)
 
             group_filter.sensor = sensor
@@ -1597,13 +2539,13 @@ class ParsedQuestion(Workflow):
         self.map_select_params(pq=pq)
 
         m = "Finished mapping parameters for selects, parameter values left: {pv!r}"
-        m = m.format(pv=pq.parameter_values)
+        m = utils.logs.LazyFormat(m, pv=pq.parameter_values)
         self.log.debug(m)
 
         self.map_group_params(pq=pq, group=pq.question.group)
 
         m = "Finished mapping parameters for groups, parameter values left: {pv!r}"
-        m = m.format(pv=pq.parameter_values)
+        m = utils.logs.LazyFormat(m, pv=pq.parameter_values)
         self.log.debug(m)
 
         cmd_args = {}
@@ -1726,3 +2668,112 @@ def get_type_map(type):
     m = "Type {o!r} is invalid, must be one of {vo}"
     m = m.format(o=type, vo=list(TYPE_MAP.keys()))
     raise exceptions.ModuleError(m)
+
+
+def sse_progress(status):
+    """Get the progress percent from a server side export status.
+
+    Args:
+        status (:obj:`dict`):
+            Status returned from :meth:`Question.answers_sse_get_status`.
+
+    Returns:
+        :obj:`int` or :obj:`float`: None if the status has no progress percent.
+
+    """
+    progress = utils.tools.str_to_intfloat(status.get("progress", "").rstrip("%"))
+    return None if isinstance(progress, six.string_types) else progress
+
+
+def call_method(obj, method, kwargs):
+    """Call a method of an object.
+
+    Args:
+        obj (:obj:`object`):
+            Object to call method of.
+        method (:obj:`str`):
+            Name of method to call.
+        kwargs (:obj:`dict`):
+            Kwargs to pass to method.
+
+    Returns:
+        :obj:`object`
+
+    """
+    return getattr(obj, method)(**kwargs)
+
+
+def get_read_count(result, rows):
+    """Get the number of rows read from a result before any predicate was applied.
+
+    Args:
+        result (:obj:`tantrum.results.Soap`):
+            Result that rows were deserialized from.
+        rows (:obj:`tantrum.api_models.ApiList`):
+            RowList API Object deserialized from result.
+
+    Returns:
+        :obj:`int`
+
+    """
+    projection = result.data_projection
+    if projection is None:
+        return len(rows or [])
+    return projection.rows_read
+
+
+def get_merged_result_data(adapter, objlist, kwargs):
+    """Get the merged result data for a list of objects.
+
+    Args:
+        adapter (:obj:`tantrum.adapters.Adapter`):
+            Adapter to use.
+        objlist (:obj:`list`):
+            List of API Objects to get merged result data for.
+        kwargs (:obj:`dict`):
+            Passed to :meth:`tantrum.adapter.Adapter.cmd_get_merged_result_data`.
+
+    Returns:
+        :obj:`tantrum.api_models.ApiModel`: ResultDataList API Object
+
+    """
+    result = adapter.cmd_get_merged_result_data(objlist=objlist, **kwargs)
+    return result()
+
+
+@contextlib.contextmanager
+def open_sink(sink):
+    """Open a path for binary writing, or use a file-like object as is.
+
+    Args:
+        sink (:obj:`str` or :obj:`io.IOBase`):
+            Path of file to open, or a file-like object that will not be closed
+            on exit. If None, None is yielded.
+
+    Yields:
+        :obj:`io.IOBase`
+
+    """
+    if sink is None or hasattr(sink, "write"):
+        yield sink
+    else:
+        with open(sink, "wb") as fh:
+            yield fh
+
+
+def tee_chunks(chunks, fh):
+    """Write each chunk to fh before yielding it.
+
+    Args:
+        chunks (:obj:`iterable` of :obj:`bytes`):
+            Chunks to write and yield.
+        fh (:obj:`io.IOBase`):
+            File-like object to write to.
+
+    Yields:
+        :obj:`bytes`
+
+    """
+    for chunk in chunks:
+        fh.write(chunk)
+        yield chunk
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""Polling strategies for workflows that wait on the Tanium API."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import time
+
+
+class Poller(object):
+    """Poll at a fixed interval."""
+
+    def __init__(self, interval=5, min_interval=1, max_interval=60):
+        """Constructor.
+
+        Args:
+            interval (:obj:`int` or :obj:`float`, optional):
+                Wait N seconds between each poll. Also used as the fixed interval
+                that :attr:`polls_saved` is compared to.
+
+                Defaults to: 5.
+            min_interval (:obj:`int` or :obj:`float`, optional):
+                Never wait less than N seconds between polls.
+                Not used by :obj:`Poller`.
+
+                Defaults to: 1.
+            max_interval (:obj:`int` or :obj:`float`, optional):
+                Never wait more than N seconds between polls.
+                Not used by :obj:`Poller`.
+
+                Defaults to: 60.
+
+        """
+        self.interval = interval
+        """:obj:`int` or :obj:`float`: Fixed number of seconds between polls."""
+        self.min_interval = min_interval
+        """:obj:`int` or :obj:`float`: Minimum number of seconds between polls."""
+        self.max_interval = max_interval
+        """:obj:`int` or :obj:`float`: Maximum number of seconds between polls."""
+        self.start()
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        bits = [
+            "interval={!r}".format(self.interval),
+            "poll_count={!r}".format(self.poll_count),
+            "polls_saved={!r}".format(self.polls_saved),
+            "last_interval={:.2f}".format(self.last_interval),
+        ]
+        bits = "({})".format(", ".join(bits))
+        cls = "{c.__module__}.{c.__name__}".format(c=self.__class__)
+        return "{cls}{bits}".format(cls=cls, bits=bits)
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    def start(self):
+        """Reset the history and counters of this poller."""
+        self.started = time.time()
+        """:obj:`float`: Time this poller was started."""
+        self.history = []
+        """:obj:`list` of :obj:`tuple`: (elapsed, done, total) from :meth:`update`."""
+        self.poll_count = 0
+        """:obj:`int`: Number of polls recorded by :meth:`update`."""
+        self.last_interval = 0
+        """:obj:`float`: Number of seconds of the last wait in :meth:`wait`."""
+
+    def update(self, done, total):
+        """Record the progress returned from a poll.
+
+        Args:
+            done (:obj:`int` or :obj:`float`):
+                Progress so far, i.e. mr_passed. None if unknown.
+            total (:obj:`int` or :obj:`float`):
+                Progress that is being waited for, i.e. the estimated_total.
+                None if unknown.
+
+        """
+        self.poll_count += 1
+        self.history.append((self.elapsed, done, total))
+
+    @property
+    def elapsed(self):
+        """Get the number of seconds since this poller was started.
+
+        Returns:
+            :obj:`float`
+
+        """
+        return time.time() - self.started
+
+    @property
+    def polls_saved(self):
+        """Get the number of polls saved compared to polling every interval seconds.
+
+        Notes:
+            Negative if this poller has polled more often than every interval
+            seconds.
+
+        Returns:
+            :obj:`int`
+
+        """
+        if not self.interval:
+            return 0
+        return int(self.elapsed // self.interval) + 1 - self.poll_count
+
+    @property
+    def progress(self):
+        """Get the history entries from :meth:`update` with a known done.
+
+        Returns:
+            :obj:`list` of :obj:`tuple`
+
+        """
+        return [x for x in self.history if x[1] is not None]
+
+    @property
+    def rate(self):
+        """Get the rate of change of done per second between the last two polls.
+
+        Returns:
+            :obj:`float`: None if less than two polls have a known done.
+
+        """
+        progress = self.progress
+        if len(progress) < 2:
+            return None
+        (t0, d0, _), (t1, d1, _) = progress[-2:]
+        if t1 <= t0:
+            return None
+        return (d1 - d0) / (t1 - t0)
+
+    def eta(self, window=5):
+        """Predict the seconds until done reaches total from the trend of done.
+
+        Args:
+            window (:obj:`int`, optional):
+                Fit a line through the last N polls with a known done.
+
+                Defaults to: 5.
+
+        Returns:
+            :obj:`float`: None if done is not trending towards total.
+
+        """
+        progress = self.progress[-window:]
+        if len(progress) < 2 or progress[-1][2] is None:
+            return None
+        count = len(progress)
+        mean_t = sum(x[0] for x in progress) / count
+        mean_d = sum(x[1] for x in progress) / count
+        var_t = sum((x[0] - mean_t) ** 2 for x in progress)
+        if not var_t:
+            return None
+        cov = sum((x[0] - mean_t) * (x[1] - mean_d) for x in progress)
+        slope = cov / var_t
+        if slope <= 0:
+            return None
+        remaining = progress[-1][2] - progress[-1][1]
+        return max(remaining, 0) / slope
+
+    def clamp(self, secs):
+        """Limit secs to :attr:`min_interval` and :attr:`max_interval`.
+
+        Args:
+            secs (:obj:`int` or :obj:`float`):
+                Seconds to limit.
+
+        Returns:
+            :obj:`int` or :obj:`float`
+
+        """
+        return min(max(secs, self.min_interval), self.max_interval)
+
+    def get_interval(self):
+        """Get the number of seconds to wait before the next poll.
+
+        Returns:
+            :obj:`int` or :obj:`float`
+
+        """
+        return self.interval
+
+    def wait(self, limit=None):
+        """Sleep for the number of seconds from :meth:`get_interval`.
+
+        Args:
+            limit (:obj:`int` or :obj:`float`, optional):
+                Never sleep more than N seconds, i.e. the time left until the
+                polling loop stops anyway.
+
+                Defaults to: None.
+
+        Returns:
+            :obj:`int` or :obj:`float`: Number of seconds slept.
+
+        """
+        secs = self.get_interval()
+        if limit is not None:
+            secs = min(secs, max(limit, 0))
+        self.last_interval = secs
+        time.sleep(secs)
+        return secs
+
+
+class BackoffPoller(Poller):
+    """Poll at an exponentially increasing interval."""
+
+    def __init__(self, interval=5, min_interval=1, max_interval=60, factor=2):
+        """Constructor.
+
+        Args:
+            interval (:obj:`int` or :obj:`float`, optional):
+                Fixed interval that :attr:`polls_saved` is compared to.
+
+                Defaults to: 5.
+            min_interval (:obj:`int` or :obj:`float`, optional):
+                Seconds to wait after the first poll.
+
+                Defaults to: 1.
+            max_interval (:obj:`int` or :obj:`float`, optional):
+                Never wait more than N seconds between polls.
+
+                Defaults to: 60.
+            factor (:obj:`int` or :obj:`float`, optional):
+                Multiply the seconds to wait by N after each poll.
+
+                Defaults to: 2.
+
+        """
+        self.factor = factor
+        """:obj:`int` or :obj:`float`: Multiplier of each wait."""
+        super(BackoffPoller, self).__init__(
+            interval=interval, min_interval=min_interval, max_interval=max_interval
+        )
+
+    def get_interval(self):
+        """Get the number of seconds to wait before the next poll.
+
+        Returns:
+            :obj:`int` or :obj:`float`
+
+        """
+        if not self.last_interval:
+            return self.clamp(self.min_interval)
+        return self.clamp(self.last_interval * self.factor)
+
+
+class RatePoller(BackoffPoller):
+    """Poll at an interval based on the rate of change of progress."""
+
+    def __init__(
+        self, interval=5, min_interval=1, max_interval=60, factor=2, step_pct=10
+    ):
+        """Constructor.
+
+        Args:
+            interval (:obj:`int` or :obj:`float`, optional):
+                Seconds to wait until there is a rate of change, and the fixed
+                interval that :attr:`polls_saved` is compared to.
+
+                Defaults to: 5.
+            min_interval (:obj:`int` or :obj:`float`, optional):
+                Never wait less than N seconds between polls.
+
+                Defaults to: 1.
+            max_interval (:obj:`int` or :obj:`float`, optional):
+                Never wait more than N seconds between polls.
+
+                Defaults to: 60.
+            factor (:obj:`int` or :obj:`float`, optional):
+                Multiply the seconds to wait by N while done is not changing.
+
+                Defaults to: 2.
+            step_pct (:obj:`int` or :obj:`float`, optional):
+                Wait long enough for done to change by N percent of total at the
+                current rate.
+
+                Defaults to: 10.
+
+        """
+        self.step_pct = step_pct
+        """:obj:`int` or :obj:`float`: Percent of total to change between polls."""
+        super(RatePoller, self).__init__(
+            interval=interval,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            factor=factor,
+        )
+
+    def get_interval(self):
+        """Get the number of seconds to wait before the next poll.
+
+        Returns:
+            :obj:`int` or :obj:`float`
+
+        """
+        rate = self.rate
+        total = self.progress[-1][2] if self.progress else None
+        if rate is None or not total:
+            return self.clamp(self.interval)
+        if rate <= 0:
+            return super(RatePoller, self).get_interval()
+        return self.clamp((total * self.step_pct / 100) / rate)
+
+
+class EtaPoller(BackoffPoller):
+    """Poll at an interval based on the predicted time until progress is done."""
+
+    def __init__(
+        self,
+        interval=5,
+        min_interval=1,
+        max_interval=60,
+        factor=2,
+        eta_pct=50,
+        window=5,
+    ):
+        """Constructor.
+
+        Args:
+            interval (:obj:`int` or :obj:`float`, optional):
+                Seconds to wait until there is an ETA, and the fixed interval
+                that :attr:`polls_saved` is compared to.
+
+                Defaults to: 5.
+            min_interval (:obj:`int` or :obj:`float`, optional):
+                Never wait less than N seconds between polls.
+
+                Defaults to: 1.
+            max_interval (:obj:`int` or :obj:`float`, optional):
+                Never wait more than N seconds between polls.
+
+                Defaults to: 60.
+            factor (:obj:`int` or :obj:`float`, optional):
+                Multiply the seconds to wait by N while done is not changing.
+
+                Defaults to: 2.
+            eta_pct (:obj:`int` or :obj:`float`, optional):
+                Wait N percent of the ETA from :meth:`Poller.eta`.
+
+                Defaults to: 50.
+            window (:obj:`int`, optional):
+                Passed to :meth:`Poller.eta`.
+
+                Defaults to: 5.
+
+        """
+        self.eta_pct = eta_pct
+        """:obj:`int` or :obj:`float`: Percent of the ETA to wait."""
+        self.window = window
+        """:obj:`int`: Number of polls to predict the ETA from."""
+        super(EtaPoller, self).__init__(
+            interval=interval,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            factor=factor,
+        )
+
+    def get_interval(self):
+        """Get the number of seconds to wait before the next poll.
+
+        Returns:
+            :obj:`int` or :obj:`float`
+
+        """
+        if len(self.progress) < 2:
+            return self.clamp(self.interval)
+        eta = self.eta(window=self.window)
+        if eta is None:
+            return super(EtaPoller, self).get_interval()
+        return self.clamp(eta * self.eta_pct / 100)
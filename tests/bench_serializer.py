@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Compare the time and size of requests from serialize_xml and TemplateSerializer.
+
+Run with ``python tests/bench_serializer.py``.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import timeit
+
+import tantrum
+
+from tantrum import adapters
+
+API_OBJECTS = tantrum.api_objects.load()
+
+
+def sensor(i):
+    """Create a sensor with queries and subcolumns."""
+    ao = API_OBJECTS
+    obj = ao.Sensor(id=i, name="Sensor {}".format(i), hash=i * 7, category="c")
+    obj.queries = ao.SensorQueryList(
+        *[
+            ao.SensorQuery(platform=x, script="echo {}".format(i), script_type="Sh")
+            for x in ["Windows", "Linux"]
+        ]
+    )
+    obj.subcolumns = ao.SensorSubcolumnList(
+        *[ao.SensorSubcolumn(name="c", index=x, hidden_flag=False) for x in range(3)]
+    )
+    return obj
+
+
+CASES = [
+    (
+        "GetResultData for a question",
+        3000,
+        API_OBJECTS.Question(id=5, name="x"),
+        {
+            "ser_only_attrs": ["id", "name"],
+            "row_start": 0,
+            "row_count": 1000,
+            "include_hashes_flag": False,
+        },
+    ),
+    (
+        "SensorList of 100 sensors",
+        30,
+        API_OBJECTS.SensorList(*[sensor(i) for i in range(100)]),
+        {},
+    ),
+]
+
+
+def bench(adapter, number, obj, kwargs):
+    """Get the microseconds per request and the size of the request."""
+
+    def build():
+        return adapter.build_request(obj=obj, cmd="GetObject", **kwargs)
+
+    secs = min(timeit.repeat(build, number=number, repeat=3))
+    return secs / number * 1e6, len(build())
+
+
+def main():
+    plain = adapters.Soap(api_client=None, api_objects=API_OBJECTS)
+    fast = adapters.Soap(
+        api_client=None,
+        api_objects=API_OBJECTS,
+        serializer=adapters.TemplateSerializer(),
+    )
+    for name, number, obj, kwargs in CASES:
+        m = "{name}: serialize_xml {p[0]:.0f}us {p[1]}B, template {f[0]:.0f}us {f[1]}B"
+        m = m.format(
+            name=name,
+            p=bench(adapter=plain, number=number, obj=obj, kwargs=kwargs),
+            f=bench(adapter=fast, number=number, obj=obj, kwargs=kwargs),
+        )
+        print(m)
+
+
+if __name__ == "__main__":
+    main()
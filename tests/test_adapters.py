@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Tests for tantrum.adapters."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+import tantrum
+
+from tantrum import adapters
+from tantrum.results import exceptions as results_exceptions
+
+API_OBJECTS = tantrum.api_objects.load()
+
+
+class FakeResult(object):
+    """Result that returns value or throws error when called."""
+
+    response_body_str = ""
+    request_body_str = ""
+
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.error = error
+
+    def __call__(self):
+        if self.error is not None:
+            raise self.error(result=self, error="fake error")
+        return self.value
+
+
+class FakeAdapter(adapters.Soap):
+    """Adapter that answers send with a function instead of the API."""
+
+    def __init__(self, answer):
+        super(FakeAdapter, self).__init__(api_client=None, api_objects=API_OBJECTS)
+        self.answer = answer
+        self.sent = []
+
+    def send(self, obj, cmd, **kwargs):
+        self.sent.append(list(obj))
+        return self.answer(obj)
+
+
+def sensors(adapter, count, **kwargs):
+    return [adapter.api_objects.Sensor(id=i, **kwargs) for i in range(count)]
+
+
+def echo(missing=(), error=None):
+    """Answer with the objects sent, or error if any of them are in missing."""
+
+    def answer(obj):
+        if any(x.id in missing for x in obj):
+            return FakeResult(error=error or results_exceptions.ObjectNotFoundError)
+        return FakeResult(value=obj)
+
+    return answer
+
+
+def test_send_objects_match_by_id():
+    adapter = FakeAdapter(
+        answer=lambda obj: FakeResult(value=obj.__class__(*obj[::-1]))
+    )
+    objs = sensors(adapter=adapter, count=10)
+    items = adapter.cmd_get_many(objs=objs, chunk_size=4)
+    assert len(adapter.sent) == 3
+    assert [x.index for x in items] == list(range(10))
+    assert all(x.ok for x in items)
+    assert [x.value.id for x in items] == list(range(10))
+
+
+def test_send_objects_match_by_name():
+    adapter = FakeAdapter(answer=echo())
+    names = ["a", "b", "c"]
+    objs = [adapter.api_objects.Sensor(name=x) for x in names]
+    items = adapter.cmd_get_many(objs=objs)
+    assert [x.value.name for x in items] == names
+
+
+def test_send_objects_no_match():
+    adapter = FakeAdapter(answer=lambda obj: FakeResult(value=obj.__class__()))
+    items = adapter.cmd_get_many(objs=sensors(adapter=adapter, count=2))
+    assert [x.ok for x in items] == [False, False]
+    assert [x.error for x in items] == [None, None]
+
+
+def test_cmd_get_many_needs_id_or_name():
+    adapter = FakeAdapter(answer=echo())
+    with pytest.raises(adapters.exceptions.EmptyAttributeError):
+        adapter.cmd_get_many(objs=[adapter.api_objects.Sensor()])
+    assert adapter.sent == []
+
+
+@pytest.mark.parametrize(
+    "error",
+    [results_exceptions.ObjectNotFoundError, results_exceptions.ObjectExistsError],
+)
+def test_send_objects_split_retry(error):
+    adapter = FakeAdapter(answer=echo(missing=[3, 9], error=error))
+    items = adapter.cmd_get_many(objs=sensors(adapter=adapter, count=10), chunk_size=8)
+    # 8 + 2, 4 + 4 + 1 + 1, 2 + 2, 1 + 1
+    assert len(adapter.sent) == 10
+    assert [x.index for x in items if not x.ok] == [3, 9]
+    assert isinstance(items[3].error, error)
+    assert isinstance(items[9].error, error)
+    assert all(x.error is None and x.value.id == x.index for x in items if x.ok)
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_send_objects_other_error_raises(workers):
+    error = results_exceptions.InsufficientPrivileges
+    adapter = FakeAdapter(answer=echo(missing=range(100), error=error))
+    with pytest.raises(error):
+        adapter.cmd_get_many(
+            objs=sensors(adapter=adapter, count=100), chunk_size=50, workers=workers
+        )
+    assert len(adapter.sent) == 2
+
+
+def sensor(i):
+    """Create a sensor with nested objects, lists and characters to escape."""
+    ao = API_OBJECTS
+    obj = ao.Sensor(
+        id=i,
+        name="S<{}>&'\"".format(i),
+        hash=i * 7,
+        hidden_flag=bool(i % 2),
+        category="c",
+        description="d\n\te",
+    )
+    obj.queries = ao.SensorQueryList(
+        *[
+            ao.SensorQuery(platform=x, script="echo {} <x>".format(i), script_type="Sh")
+            for x in ["Windows", "Linux"]
+        ]
+    )
+    obj.parameters = ao.ParameterList()
+    obj.content_set = ao.IdReference(id=3)
+    obj.mod_user = ao.User(name="u", id=2)
+    obj.subcolumns = ao.SensorSubcolumnList(
+        *[ao.SensorSubcolumn(name="c", index=x, hidden_flag=False) for x in range(3)]
+    )
+    return obj
+
+
+SERIALIZE_OBJS = [
+    API_OBJECTS.Question(id=5),
+    API_OBJECTS.Question(id=5, name="x", expire_seconds=600, query_text="Get x"),
+    sensor(1),
+    API_OBJECTS.SensorList(*[sensor(i) for i in range(3)]),
+    API_OBJECTS.SensorList(),
+    API_OBJECTS.User(name="bob & alice"),
+    API_OBJECTS.ParseJob(question_text="Get <Computer Name> & stuff"),
+    {"client_count": 30},
+    {"question": [{"id": 1, "index": 0}, {"id": 2}], "saved_question": []},
+    None,
+]
+
+SERIALIZE_ARGS = [
+    {},
+    {"ser_empty": True},
+    {"ser_list_attrs": True},
+    {"ser_exclude_attrs": ["id"]},
+    {"ser_only_attrs": ["id", "name"]},
+    {"ser_wrap_name": False},
+    {"ser_wrap_item_attr": False},
+    {"ser_wrap_name": False, "ser_wrap_item_attr": False},
+    {"ser_empty": True, "ser_list_attrs": True, "ser_wrap_item_attr": False},
+]
+
+SERIALIZE_OPTIONS = [
+    {},
+    {"row_start": 0, "row_count": 100, "include_hashes_flag": True},
+    {"cache_expiration": 900, "suppress_object_list": 1},
+]
+
+
+@pytest.fixture(scope="module")
+def serializers():
+    plain = adapters.Soap(api_client=None, api_objects=API_OBJECTS)
+    fast = adapters.Soap(
+        api_client=None,
+        api_objects=API_OBJECTS,
+        serializer=adapters.TemplateSerializer(),
+    )
+    return plain, fast
+
+
+@pytest.mark.parametrize("options", SERIALIZE_OPTIONS)
+@pytest.mark.parametrize("ser", SERIALIZE_ARGS)
+@pytest.mark.parametrize("obj", SERIALIZE_OBJS)
+def test_template_serializer_same_xml(serializers, obj, ser, options):
+    plain, fast = serializers
+    kwargs = dict(ser, **options)
+    want = plain.build_request_dict(obj=obj, cmd="GetObject", **kwargs)
+    want = adapters.serialize_xml(want, pretty=False)
+    assert fast.build_request(obj=obj, cmd="GetObject", **kwargs) == want
+    # cached templates and options give the same xml the second time
+    assert fast.build_request(obj=obj, cmd="GetObject", **kwargs) == want
+
+
+def test_template_serializer_options_obj(serializers):
+    plain, fast = serializers
+    obj = API_OBJECTS.Question(id=5)
+    want = plain.build_request_dict(
+        obj=obj, cmd="X", options_obj=API_OBJECTS.Options(row_count=5)
+    )
+    want = adapters.serialize_xml(want, pretty=False)
+    options_obj = API_OBJECTS.Options(row_count=5)
+    assert fast.build_request(obj=obj, cmd="X", options_obj=options_obj) == want
+
+
+def test_template_serializer_fallback(serializers):
+    plain, fast = serializers
+    obj = {"thing": {"@a": "1", "#text": "t"}}
+    fallbacks = fast.serializer.fallbacks
+    want = plain.build_request_dict(obj=obj, cmd="X")
+    want = adapters.serialize_xml(want, pretty=False)
+    assert fast.build_request(obj=obj, cmd="X") == want
+    assert fast.serializer.fallbacks == fallbacks + 1
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""Tests for the asyncio http client, api client and adapter."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import contextlib
+import re
+
+import pytest
+import tantrum
+
+from tantrum.adapters.aio import AsyncSoap as AsyncAdapter
+from tantrum.api_clients.aio import AsyncSoap as AsyncApiClient
+from tantrum.http_client.aio import AsyncHttpClient
+from tantrum.http_client.aio import gather_limited
+from tantrum.results import exceptions as results_exceptions
+
+web = pytest.importorskip("aiohttp.web")
+
+API_OBJECTS = tantrum.api_objects.load()
+
+RESPONSE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+    '<soap:Body><t:return xmlns:t="urn:TaniumSOAP">'
+    "<command>{command}</command><session>1-2-abc</session>"
+    "<result_object><users>{users}</users></result_object>"
+    "</t:return></soap:Body></soap:Envelope>"
+)
+
+USER = "<user><id>{i}</id><name>u{i}</name></user>"
+
+
+class SoapServer(object):
+    """Answer /soap requests with the users that were asked for by id."""
+
+    def __init__(self, delay=0.02, missing=(), failing=()):
+        self.delay = delay
+        self.missing = missing
+        self.failing = failing
+        self.requests = []
+        self.inflight = 0
+        self.max_inflight = 0
+
+    async def soap(self, request):
+        body = await request.text()
+        self.requests.append((dict(request.headers), body))
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        await asyncio.sleep(self.delay)
+        self.inflight -= 1
+
+        ids = [int(x) for x in re.findall(r"<id>(\d+)</id>", body)]
+        status = 500 if any(x in self.failing for x in ids) else 200
+        if any(x in self.missing for x in ids):
+            command = "404 Not Found: User not found"
+        else:
+            command = re.search(r"<command>(\w+)</command>", body).group(1)
+        users = "".join(USER.format(i=i) for i in ids)
+        text = RESPONSE.format(command=command, users=users)
+        return web.Response(status=status, text=text, content_type="text/xml")
+
+
+class FakeAuth(object):
+    """Auth method that records tokens received in responses."""
+
+    token_headers = {"session": "1-2-abc"}
+
+    def __init__(self):
+        self.tokens = []
+
+    def in_band_refresh(self, token, **kwargs):
+        self.tokens.append(token)
+
+
+@contextlib.asynccontextmanager
+async def serve(server):
+    """Run server on a free port and yield the URL of it."""
+    app = web.Application()
+    app.router.add_post("/soap", server.soap)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        yield "http://127.0.0.1:{}".format(port)
+    finally:
+        await runner.cleanup()
+
+
+@contextlib.asynccontextmanager
+async def adapter(server, **kwargs):
+    """Yield an async adapter that sends requests to server."""
+    async with serve(server=server) as url:
+        http_client = AsyncHttpClient(url=url, **kwargs)
+        api_client = AsyncApiClient(http_client=http_client, auth_method=FakeAuth())
+        adapter = AsyncAdapter(api_client=api_client, api_objects=API_OBJECTS)
+        try:
+            yield adapter
+        finally:
+            await adapter.close()
+
+
+def users(count):
+    return [API_OBJECTS.User(id=i) for i in range(count)]
+
+
+def test_http_client_send():
+    server = SoapServer(delay=0)
+
+    async def main():
+        async with serve(server=server) as url:
+            async with AsyncHttpClient(url=url, save_last=True) as client:
+                r = await client(
+                    method="post",
+                    path="/soap",
+                    data="<id>3</id><command>X</command>",
+                    headers={"secret": "abc"},
+                    b64_headers=["secret"],
+                    save_history=True,
+                    cause="test",
+                )
+                assert client.session is not None
+            assert client.session is None
+            return client, r
+
+    client, r = asyncio.run(main())
+    assert (r.status_code, r.reason, r.cause) == (200, "OK", "test")
+    assert r.url.endswith("/soap")
+    assert "<id>3</id>" in r.text
+    assert client.last_request is r.request
+    assert client.last_response is r
+    assert list(client.history) == [r]
+
+    headers = server.requests[0][0]
+    assert headers["secret"] == "YWJj"
+    assert headers["User-Agent"].startswith("tantrum.AsyncHttpClient/")
+
+
+def test_gather_limited():
+    state = {"inflight": 0, "max": 0}
+
+    async def work(i):
+        state["inflight"] += 1
+        state["max"] = max(state["max"], state["inflight"])
+        await asyncio.sleep(0.01 * (i % 3))
+        state["inflight"] -= 1
+        return i
+
+    async def main():
+        return await gather_limited(coros=[work(i) for i in range(20)], limit=4)
+
+    assert asyncio.run(main()) == list(range(20))
+    assert state["max"] == 4
+
+
+def test_adapter_send():
+    server = SoapServer(delay=0)
+
+    async def main():
+        async with adapter(server=server) as a:
+            result = await a.cmd_get(obj=API_OBJECTS.User(id=7))
+            return a, result
+
+    a, result = asyncio.run(main())
+    assert [(x.id, x.name) for x in result()] == [(7, "u7")]
+    assert a.api_client.auth_method.tokens == ["1-2-abc"]
+    headers, body = server.requests[0]
+    assert headers["session"] == "1-2-abc"
+    assert "<command>GetObject</command>" in body
+
+
+@pytest.mark.parametrize("limit, expected", [(None, 3), (2, 2)])
+def test_adapter_send_many_limit(limit, expected):
+    server = SoapServer()
+
+    async def main():
+        async with adapter(server=server, pool_maxsize=3) as a:
+            sends = [dict(obj=x, cmd="GetObject") for x in users(count=12)]
+            return await a.send_many(sends=sends, limit=limit)
+
+    rets = asyncio.run(main())
+    assert [x()[0].id for x in rets] == list(range(12))
+    assert server.max_inflight == expected
+
+
+def test_adapter_error_mapping():
+    server = SoapServer(delay=0, missing=[1], failing=[2])
+
+    async def main():
+        async with adapter(server=server) as a:
+            sends = [dict(obj=x, cmd="GetObject") for x in users(count=3)]
+            return await a.send_many(sends=sends)
+
+    ok, missing, failing = asyncio.run(main())
+    assert ok()[0].id == 0
+    with pytest.raises(results_exceptions.ObjectNotFoundError):
+        missing()
+    with pytest.raises(results_exceptions.ResponseError):
+        failing()
+
+
+def test_adapter_send_objects_split_retry():
+    server = SoapServer(missing=[3, 9])
+
+    async def main():
+        async with adapter(server=server) as a:
+            objs = users(count=10)
+            return await a.cmd_get_many(objs=objs, chunk_size=8, workers=2)
+
+    items = asyncio.run(main())
+    assert len(server.requests) == 10
+    assert server.max_inflight <= 2
+    assert [x.index for x in items if not x.ok] == [3, 9]
+    assert isinstance(items[3].error, results_exceptions.ObjectNotFoundError)
+    assert all(x.value.id == x.index for x in items if x.ok)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Tests for tantrum.api_models."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+import tantrum
+
+from tantrum import api_models
+
+
+class Thing(api_models.ApiItem):
+    API_SIMPLE = {"id": api_models.integer_types, "name": api_models.string_types}
+    API_COMPLEX = {}
+
+
+class SubThing(Thing):
+    pass
+
+
+class ThingList(api_models.ApiList):
+    API_SIMPLE = {}
+    API_COMPLEX = {}
+    API_ITEM_ATTR = "thing"
+    API_ITEM_CLS = Thing
+
+
+def test_api_meta_cached():
+    assert Thing.api_meta() is Thing.api_meta()
+    assert Thing.api_meta().attrs == ("id", "name")
+
+
+def test_api_meta_replaced_attrs():
+    meta = Thing.api_meta()
+    sub_meta = SubThing.api_meta()
+    try:
+        Thing.API_SIMPLE = dict(Thing.API_SIMPLE, count=api_models.integer_types)
+        assert Thing.api_meta() is not meta
+        assert Thing(count="2").count == 2
+        assert SubThing.api_meta() is not sub_meta
+        assert "count" in SubThing.api_meta().attrs
+    finally:
+        Thing.API_SIMPLE = meta.api_simple
+    assert "count" not in SubThing.api_meta().attrs
+
+
+def test_api_meta_undefined_attr():
+    class Other(api_models.ApiItem):
+        API_SIMPLE = {}
+        API_COMPLEX = {}
+
+    with pytest.warns(api_models.exceptions.AttrUndefinedWarning):
+        Other(size=1)
+    assert Other.api_meta().attrs == ("size",)
+    assert Other(size="2").size == 2
+
+
+def test_api_fixes_reset_meta():
+    ao = tantrum.api_objects.load()
+    assert "deleted_flag" in ao.SavedQuestion.api_meta().simple
+    assert ao.SavedQuestion(deleted_flag="1").deleted_flag == 1
+
+
+def test_coerce_values():
+    thing = Thing(id="1", name=2)
+    assert (thing.id, thing.name) == (1, "2")
+    assert Thing(id=True).id == 1
+    with pytest.raises(api_models.exceptions.AttrTypeError):
+        Thing(id=[])
+
+
+def test_coerce_items():
+    things = ThingList(thing=[{"id": "1"}, Thing(id=2)])
+    assert [x.id for x in things] == [1, 2]
+    assert len(ThingList()) == 0
+    with pytest.raises(api_models.exceptions.ListItemTypeError):
+        ThingList(thing=[1])
+    with pytest.raises(api_models.exceptions.ListTypeError):
+        things.LIST = 1
+
+
+def test_coerce_complex_single_item():
+    # a list with one item deserializes as the item itself
+    things = ThingList.api_coerce_complex(value={"id": "1"}, be_type=ThingList)
+    assert isinstance(things, ThingList)
+    assert [x.id for x in things] == [1]
+
+
+def test_coerce_complex_list_keys():
+    value = {"thing": [{"id": "1"}, {"id": "2"}]}
+    things = ThingList.api_coerce_complex(value=value, be_type=ThingList)
+    assert [x.id for x in things] == [1, 2]
+
+    ao = tantrum.api_objects.load()
+    value = {"cache_info": {"cache_id": 1}, "client_status": {"computer_id": "2"}}
+    clients = ao.SystemStatusList.api_coerce_complex(
+        value=value, be_type=ao.SystemStatusList
+    )
+    assert clients.cache_info.cache_id == 1
+    assert [x.computer_id for x in clients] == ["2"]
+
+
+def test_coerce_complex_one_column_row():
+    ao = tantrum.api_objects.load()
+    row = ao.Row(id=1, cid=2, c={"v": "host"})
+    assert isinstance(row.c, ao.RowColumnList)
+    assert len(row.c) == 1
+    assert row.c[0].get_values() == ["host"]
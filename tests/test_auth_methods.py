@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Tests for tantrum.auth_methods."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+
+from datetime import datetime
+from datetime import timedelta
+
+import requests
+
+from tantrum import auth_methods
+
+
+class FakeHttpClient(object):
+    """HTTP client that answers /auth requests instead of the API."""
+
+    def __init__(self):
+        self.sent = []
+        self.valid = True
+        self.tokens = 0
+
+    def __call__(self, path, method, headers, timeout, cause, **kwargs):
+        if "logout" in headers:
+            action = "logout"
+        elif "session" in headers:
+            action = "validate"
+        else:
+            action = "login"
+        self.sent.append(action)
+
+        response = requests.Response()
+        response.url = "https://server{}".format(path)
+        response.request = requests.Request(method=method, url=response.url).prepare()
+        response.status_code = 200
+        if action == "login":
+            self.tokens += 1
+            response._content = "1-{}".format(self.tokens).encode("utf-8")
+        elif action == "validate" and not self.valid:
+            response.status_code = 401
+            response._content = b""
+        else:
+            response._content = headers["session"].encode("utf-8")
+        return response
+
+
+def make_auth(**kwargs):
+    return auth_methods.Credentials(
+        http_client=FakeHttpClient(), username="user", password="pass", **kwargs
+    )
+
+
+def idle(auth, seconds):
+    """Make the token of auth look like it was last used seconds ago."""
+    auth._last_used = datetime.utcnow() - timedelta(seconds=seconds)
+
+
+def test_token_login_once():
+    auth = make_auth()
+    assert auth.token == "1-1"
+    assert auth.token == "1-1"
+    assert auth.http_client.sent == ["login"]
+    assert auth.trusted
+
+
+def test_token_trusted_skips_validate():
+    auth = make_auth(revalidate_after=5)
+    auth.token
+    idle(auth=auth, seconds=60)
+    assert auth.token == "1-1"
+    assert auth.http_client.sent == ["login"]
+
+    auth.in_band_refresh(token="1-1")
+    idle(auth=auth, seconds=60)
+    auth.token
+    assert auth.http_client.sent == ["login"]
+    assert auth.counts["in_band"] == 1
+
+
+def test_token_untrusted_validates():
+    auth = make_auth(revalidate_after=5, trust_received=False)
+    auth.token
+    idle(auth=auth, seconds=4)
+    auth.token
+    assert auth.http_client.sent == ["login"]
+    idle(auth=auth, seconds=60)
+    auth.token
+    assert auth.http_client.sent == ["login", "validate"]
+
+
+def test_token_set_is_not_trusted():
+    auth = make_auth()
+    auth.token = "1-9"
+    assert not auth.trusted
+    idle(auth=auth, seconds=60)
+    auth.http_client.valid = False
+    assert auth.token == "1-1"
+    assert auth.http_client.sent == ["validate", "login"]
+
+
+def test_token_expired_login():
+    auth = make_auth(expires_after=30)
+    auth.token
+    idle(auth=auth, seconds=31)
+    assert auth.expired
+    assert auth.token == "1-2"
+    assert auth.http_client.sent == ["login", "login"]
+
+
+def test_refresh():
+    auth = make_auth()
+    auth.token
+    assert auth.refresh() == "1-1"
+    assert auth.http_client.sent == ["login", "validate"]
+    assert auth.counts["refresh"] == 1
+
+
+def test_refresh_invalid_login():
+    auth = make_auth()
+    auth.token
+    auth.http_client.valid = False
+    assert auth.refresh() == "1-2"
+    assert auth.http_client.sent == ["login", "validate", "login"]
+    assert auth.counts == {"login": 2, "validate": 0, "in_band": 0, "refresh": 1}
+
+
+def test_refresh_expired_login():
+    auth = make_auth(expires_after=30)
+    auth.token
+    idle(auth=auth, seconds=31)
+    assert auth.refresh() == "1-2"
+    assert auth.http_client.sent == ["login", "login"]
+
+
+def test_refresher():
+    auth = make_auth(expires_after=30, refresh_before=29)
+    auth.token
+    idle(auth=auth, seconds=5)
+    auth.start_refresher()
+    thread = auth._refresher[0]
+    auth.start_refresher()
+    assert auth._refresher[0] is thread
+
+    for _ in range(100):
+        if auth.counts["refresh"]:
+            break
+        threading.Event().wait(0.01)
+    assert auth.counts["refresh"] == 1
+
+    auth.stop_refresher()
+    assert not thread.is_alive()
+    assert auth._refresher is None
+    auth.stop_refresher()
+
+
+def test_logout_stops_refresher():
+    auth = make_auth()
+    auth.token
+    auth.start_refresher()
+    thread = auth._refresher[0]
+    auth.logout()
+    assert not thread.is_alive()
+    assert not auth.logged_in
+    assert auth.http_client.sent == ["login", "logout"]
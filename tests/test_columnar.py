@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Tests for tantrum.results.columnar."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+import tantrum
+
+from tantrum import results
+from tantrum.results import columnar
+
+ROWS = [
+    ("host-1", "Windows", "10"),
+    ("host-2", "Linux", "20"),
+    ("host-3", "Windows", "[no results]"),
+    ("host-4", "Windows", "40"),
+    ("host-5", "Linux", "5"),
+]
+
+XML = (
+    "<result_set><id>1</id><cs>"
+    "<c><wh>1</wh><dn>Computer Name</dn><rt>1</rt></c>"
+    "<c><wh>2</wh><dn>OS</dn><rt>1</rt></c>"
+    "<c><wh>3</wh><dn>Count</dn><rt>3</rt></c>"
+    "</cs><rs>{rows}</rs></result_set>"
+).format(
+    rows="".join(
+        "<r><id>{i}</id><cid>{i}</cid>{c}</r>".format(
+            i=i, c="".join("<c><v>{}</v></c>".format(v) for v in row)
+        )
+        for i, row in enumerate(ROWS)
+    )
+)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def columns(request, monkeypatch):
+    """Columnar result set built with numpy, and without it by forcing numpy None."""
+    if request.param == "numpy" and columnar.numpy is None:
+        pytest.skip("numpy is not installed")
+    if request.param == "python":
+        monkeypatch.setattr(columnar, "numpy", None)
+    items = results.iter_result_set_columns(
+        chunks=[XML.encode("utf-8")],
+        api_objects=tantrum.api_objects.load(),
+        wrap="result_sets",
+    )
+    return list(items)[0]
+
+
+def test_make_array_fallback(monkeypatch):
+    monkeypatch.setattr(columnar, "numpy", None)
+    ints = columnar.make_array(values=[1, 2**30], typecode="i")
+    floats = columnar.make_array(values=[1.5], typecode="d")
+    assert list(ints) == [1, 2**30]
+    assert list(floats) == [1.5]
+
+
+def test_count(columns):
+    assert columns.count() == 5
+    assert columns.count("OS", "Windows") == 3
+    assert columns.count("Count", 10, op="gt") == 2
+    assert columns.count("Count", "[no results]") == 1
+
+
+def test_group_by_count(columns):
+    assert dict(columns.group_by("OS")) == {"Windows": 3, "Linux": 2}
+    assert list(columns.group_by("OS")) == ["Windows", "Linux"]
+
+
+@pytest.mark.parametrize(
+    "agg, expected",
+    [
+        ("sum", {"Windows": 50, "Linux": 25}),
+        ("mean", {"Windows": 25, "Linux": 12.5}),
+        ("min", {"Windows": 10, "Linux": 5}),
+        ("max", {"Windows": 40, "Linux": 20}),
+    ],
+)
+def test_group_by_agg(columns, agg, expected):
+    assert dict(columns.group_by("OS", "Count", agg=agg)) == expected
+
+
+def test_group_by_invalid(columns):
+    with pytest.raises(columnar.exceptions.ModuleError):
+        columns.group_by("OS", agg="median")
+    with pytest.raises(columnar.exceptions.ModuleError):
+        columns.group_by("OS", "Computer Name", agg="sum")
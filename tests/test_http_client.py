@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""Tests for tantrum.http_client."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import datetime
+import gzip
+import os
+import threading
+import time
+
+import pytest
+import requests
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from tantrum import http_client
+
+BODY = "<x><session>1-2-secret</session><a>{i}</a></x>"
+
+
+def make_response(i=0, cause="soap", path="/soap", elapsed=0):
+    """Create a response to a POST to path with a body that has a session."""
+    body = BODY.format(i=i).encode("utf-8")
+    response = requests.Response()
+    response.request = requests.Request(
+        method="POST",
+        url="https://server{}".format(path),
+        data=body,
+        headers={"session": "1-2-secret"},
+    ).prepare()
+    response.url = response.request.url
+    response.status_code = 200
+    response.reason = "OK"
+    response.elapsed = datetime.timedelta(seconds=elapsed)
+    response._content = body
+    response.cause = cause
+    return response
+
+
+def redacted(i):
+    """Get the body of a response made by make_response once redacted."""
+    return BODY.format(i=i).replace("1-2-secret", "REDACTED")
+
+
+def test_history_evict_by_count():
+    history = http_client.History(max_entries=3, max_bytes=0)
+    responses = [make_response(i=i) for i in range(5)]
+    for response in responses:
+        history.append(response)
+    assert list(history) == responses[2:]
+    assert history.evicted == 2
+    assert history.spilled == 0
+    assert history.size == sum(http_client.response_size(x) for x in responses[2:])
+
+
+def test_history_evict_by_bytes():
+    size = http_client.response_size(make_response())
+    history = http_client.History(max_entries=0, max_bytes=size * 2)
+    responses = [make_response(i=i) for i in range(4)]
+    for response in responses:
+        history.append(response)
+    assert list(history) == responses[2:]
+    assert history.size == size * 2
+
+
+def test_history_flush_needs_spill_path():
+    history = http_client.History()
+    with pytest.raises(http_client.exceptions.ModuleError):
+        history.flush()
+
+
+def test_history_spill_and_find(tmpdir):
+    path = str(tmpdir.join("spill"))
+    history = http_client.History(max_entries=2, spill_path=path)
+    causes = ["login", "soap", "soap", "sensors", "soap"]
+    for i, cause in enumerate(causes):
+        history.append(make_response(i=i, cause=cause))
+    assert history.spilled == 3
+    assert sorted(os.listdir(path)) == ["login.jsonl.gz", "soap.jsonl.gz"]
+
+    found = list(history.find())
+    assert len(found) == len(causes)
+    assert [x["_cause"] for x in found[-2:]] == ["sensors", "soap"]
+
+    soap = list(history.find(cause="soap"))
+    texts = [x["request"]["postData"]["text"] for x in soap]
+    assert texts == [redacted(i=i) for i in [1, 2, 4]]
+
+    assert list(history.find(cause="nope")) == []
+    last = found[-1]["_timestamp"]
+    assert list(history.find(start=last + 60)) == []
+    assert len(list(history.find(end=last + 60))) == len(causes)
+
+    history.flush()
+    assert len(history) == 0
+    assert history.spilled == len(causes)
+    assert len(list(history.iter_spilled())) == len(causes)
+
+
+def test_history_spill_keeps_eviction_order(tmpdir):
+    path = str(tmpdir.join("spill"))
+    history = http_client.History(max_entries=1, spill_path=path)
+    # sent earlier but received later, so time order is not eviction order
+    history.append(make_response(i=0, elapsed=0))
+    history.append(make_response(i=1, elapsed=30))
+    history.append(make_response(i=2, elapsed=0))
+    history.flush()
+    found = list(history.iter_spilled(cause="soap"))
+    texts = [x["response"]["content"]["text"] for x in found]
+    assert texts == [redacted(i=i) for i in range(3)]
+
+
+def test_history_spill_threads(tmpdir):
+    path = str(tmpdir.join("spill"))
+    history = http_client.History(max_entries=5, spill_path=path)
+
+    def add(thread):
+        for i in range(50):
+            history.append(make_response(i=i, cause="t{}".format(thread)))
+
+    threads = [threading.Thread(target=add, args=(x,)) for x in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert history.spilled == history.evicted == 195
+    for thread in range(4):
+        found = list(history.iter_spilled(cause="t{}".format(thread)))
+        texts = [x["response"]["content"]["text"] for x in found]
+        assert texts == [redacted(i=i) for i in range(len(texts))]
+
+
+def test_history_redaction(tmpdir):
+    path = str(tmpdir.join("spill"))
+    history = http_client.History(spill_path=path)
+    history.append(make_response(i=1, cause="soap"))
+    history.append(make_response(i=2, cause="login", path="/auth"))
+    history.flush()
+
+    raw = b"".join(gzip.open(os.path.join(path, x)).read() for x in os.listdir(path))
+    assert b"secret" not in raw
+
+    soap, login = [list(history.find(cause=x))[0] for x in ["soap", "login"]]
+    assert soap["request"]["postData"]["text"] == redacted(i=1)
+    assert soap["request"]["bodySize"] == len(BODY.format(i=1))
+    assert {"name": "session", "value": "REDACTED"} in soap["request"]["headers"]
+    assert login["request"]["postData"]["text"] == "REDACTED"
+    assert login["response"]["content"]["text"] == "REDACTED"
+
+
+class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Answer every request with "ok" on a keep-alive connection."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    do_POST = do_GET
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture(scope="module")
+def url():
+    server = Server(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield "http://127.0.0.1:{}".format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_stats():
+    stats = http_client.PoolStats()
+
+    def incr():
+        for _ in range(1000):
+            stats.incr("hits")
+            stats.incr("requests", 2)
+
+    threads = [threading.Thread(target=incr) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    counts = stats.to_dict()
+    assert list(counts) == http_client.PoolStats.KEYS
+    assert (counts["hits"], counts["requests"], counts["misses"]) == (4000, 8000, 0)
+    counts["hits"] = 0
+    assert stats.to_dict()["hits"] == 4000
+    stats.reset()
+    assert set(stats.to_dict().values()) == {0}
+
+
+def test_pool_reuse(url):
+    client = http_client.HttpClient(url=url)
+    for _ in range(5):
+        client(method="get")
+    stats = client.pool_stats
+    assert (stats["requests"], stats["hits"], stats["misses"]) == (5, 4, 1)
+    assert stats["handshakes"] == 0
+
+
+def test_pool_idle_timeout(url):
+    client = http_client.HttpClient(url=url, pool_idle_timeout=0.01)
+    client(method="get")
+    time.sleep(0.05)
+    client(method="get")
+    stats = client.pool_stats
+    assert (stats["misses"], stats["expired"]) == (2, 1)
+
+
+def test_prewarm(url):
+    client = http_client.HttpClient(url=url, pool_prewarm=3, pool_maxsize=4)
+    for _ in range(5):
+        client(method="post", data="x")
+    stats = client.pool_stats
+    # connections opened by prewarm count as misses, every request is a hit
+    assert (stats["misses"], stats["hits"]) == (3, 5)
+    # limited to pool_maxsize, 3 are already open
+    assert client.prewarm(count=10) == 1
+    client.close()
+    assert client.prewarm(count=10) == 4
+
+
+def test_prewarm_once_across_threads(url):
+    client = http_client.HttpClient(url=url, pool_prewarm=2)
+    calls = []
+    prewarm = client.prewarm
+
+    def slow_prewarm(**kwargs):
+        calls.append(threading.current_thread())
+        time.sleep(0.1)
+        return prewarm(**kwargs)
+
+    client.prewarm = slow_prewarm
+    threads = [
+        threading.Thread(target=client, kwargs={"method": "get"}) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert client.pool_stats["requests"] == 8 + 2
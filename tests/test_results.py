@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Tests for tantrum.results."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+import tantrum
+
+from xml.sax.saxutils import escape
+
+from tantrum import results
+
+RESULT_XML = (
+    "<result_sets><result_set><id>1</id><row_count>{count}</row_count><cs>"
+    "<c><wh>1</wh><dn>Computer Name</dn><rt>1</rt></c>"
+    "<c><wh>2</wh><dn>Count</dn><rt>3</rt></c>"
+    "</cs><rs>{rows}</rs></result_set></result_sets>"
+)
+
+ROW_XML = "<r><id>{i}</id><cid>{i}</cid><c><v>host-{i}</v></c><c><v>{i}</v></c></r>"
+
+RESPONSE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+    '<soap:Body><t:return xmlns:t="urn:TaniumSOAP">'
+    "<command>GetResultData</command><session>1-2-abc</session>"
+    "<ResultXML>{xml}</ResultXML></t:return></soap:Body></soap:Envelope>"
+)
+
+
+def make_result(rows, retain):
+    """Create a GetResultData result with rows number of rows."""
+    xml = RESULT_XML.format(
+        count=rows, rows="".join(ROW_XML.format(i=i) for i in range(rows))
+    )
+    return results.Soap(
+        api_objects=tantrum.api_objects.load(),
+        response_body=RESPONSE.format(xml=escape(xml)).encode("utf-8"),
+        request_body="",
+        method="post",
+        url="url",
+        status_code=200,
+        command="GetResultData",
+        retain=retain,
+    )
+
+
+@pytest.mark.parametrize("retain", results.Soap.RETAIN)
+def test_lazy_result_set_no_rows_does_not_release(retain):
+    result = make_result(rows=0, retain=retain)
+    lazy = result.data_api(lazy=True)
+    assert lazy.result_set.columns.names == ["Computer Name", "Count"]
+    assert result.released is None
+    assert list(lazy) == []
+    assert list(lazy.iter_chunks())
+
+
+def test_lazy_result_set_no_rows_columns():
+    result = make_result(rows=0, retain="api")
+    lazy = result.data_api(lazy=True, columns=["Count"])
+    assert lazy.columns.names == ["Count"]
+    assert list(lazy) == []
+
+
+def test_lazy_result_set_predicate_drops_all_rows():
+    result = make_result(rows=3, retain="api")
+    lazy = result.data_api(lazy=True, predicate=lambda values: False)
+    assert lazy.result_set.id == 1
+    assert list(lazy) == []
+    assert result.released is None
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"lazy": True}, {"columns": ["Count"]}, {"predicate": bool}]
+)
+def test_call_after_api_release_rejects_reparse(kwargs):
+    result = make_result(rows=3, retain="api")
+    data = result()
+    assert result.released == "api"
+    assert result() is data
+    assert result(validate=False) is data
+    with pytest.raises(results.exceptions.ResultReleasedError):
+        result(**kwargs)
+
+
+@pytest.mark.parametrize("kwargs", [{"lazy": True}, {}, {"columns": ["Count"]}])
+def test_data_skips_response_body_obj(kwargs):
+    result = make_result(rows=3, retain="all")
+    data = result(**kwargs)
+    rows = list(data) if kwargs.get("lazy") else data[0].rows
+    assert len(rows) == 3
+    assert "response_body_obj" not in result._cache
+
+
+@pytest.mark.parametrize("column", ["Computer Name", "Count"])
+def test_data_one_column(column):
+    result = make_result(rows=3, retain="all")
+    data = result(columns=[column])[0]
+    assert data.columns.names == [column]
+    assert [len(row.c) for row in data.rows] == [1, 1, 1]
+    full = make_result(rows=3, retain="all")()[0]
+    values = [row[column].get_values() for row in data.rows]
+    assert values == [row[column].get_values() for row in full.rows]
+
+
+def test_data_xml_matches_response_body_obj():
+    result = make_result(rows=3, retain="all")
+    data_xml = result.data_xml
+    command = result.command_response
+    result._cache.clear()
+    assert result.response_body_obj
+    assert result.data_xml == data_xml
+    assert result.command_response == command == "GetResultData"
+
+
+def test_response_text_errors():
+    result = make_result(rows=0, retain="all")
+    with pytest.raises(results.exceptions.DictionaryPathError):
+        result.response_text(path="soap:Envelope/soap:Body/t:return/x", src="test")
+    result._response_body = b"<soap:Envelope"
+    with pytest.raises(results.exceptions.TextDeserializeError):
+        result.data_xml
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Tests for tantrum.utils.logs."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import logging
+import threading
+
+import pytest
+import six
+
+from tantrum.utils import logs
+
+pytestmark = pytest.mark.skipif(
+    logs.QueueHandler is object, reason="no queued log handlers on this python"
+)
+
+
+class GatedHandler(logging.StreamHandler):
+    """Handler that waits for gate to be set before writing each record."""
+
+    def __init__(self):
+        super(GatedHandler, self).__init__(stream=six.StringIO())
+        self.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+
+    def emit(self, record):
+        self.entered.set()
+        self.gate.wait()
+        super(GatedHandler, self).emit(record)
+
+    @property
+    def lines(self):
+        return self.stream.getvalue().splitlines()
+
+
+@pytest.fixture
+def log():
+    log = logging.getLogger("tantrum.test_queued")
+    log.propagate = False
+    yield log
+    for handler in list(log.handlers):
+        logs.remove_handler(handler=handler, obj=log)
+
+
+def queued(log, queue_size, block=False):
+    """Add a queued GatedHandler to log and wait until it is writing "a"."""
+    target = GatedHandler()
+    handler = logs.queue_handler(handler=target, queue_size=queue_size, block=block)
+    log.addHandler(handler)
+    log.warning("a")
+    target.entered.wait()
+    return handler, target
+
+
+def test_queued_add_stdout(log, capsys):
+    handler = logs.add_stdout(lvl="info", fmt="%(message)s", obj=log, queued=True)
+    assert isinstance(handler, logs.QueuedHandler)
+    assert handler.name == "{}_stdout".format(log.name)
+    assert handler.level == logging.INFO
+    log.debug("hidden")
+    log.info("shown")
+    logs.remove_stdout(obj=log)
+    assert not handler.started
+    assert capsys.readouterr().out == "shown\n"
+
+
+def test_queued_drop_warning_order(log):
+    handler, target = queued(log=log, queue_size=2)
+    for msg in "bcde":
+        log.warning(msg)
+    assert handler.dropped == 2
+    target.gate.set()
+    handler.queue.join()
+    log.warning("f")
+    handler.close()
+    warning = "WARNING Dropped 2 log records because the queue of None was full"
+    assert target.lines == [
+        "WARNING a",
+        "WARNING b",
+        "WARNING c",
+        warning,
+        "WARNING f",
+    ]
+
+
+def test_queued_drop_warning_on_stop(log):
+    handler, target = queued(log=log, queue_size=1)
+    for msg in "bcd":
+        log.warning(msg)
+    target.gate.set()
+    handler.close()
+    assert target.lines[:2] == ["WARNING a", "WARNING b"]
+    assert target.lines[2].startswith("WARNING Dropped 2 log records")
+    assert len(target.lines) == 3
+
+
+def test_queued_drop_count_threads(log):
+    handler, target = queued(log=log, queue_size=1)
+
+    def spam():
+        for _ in range(500):
+            log.warning("x")
+
+    threads = [threading.Thread(target=spam) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert handler.dropped == 4 * 500 - 1
+    target.gate.set()
+    handler.close()
+    assert target.lines[-1].startswith("WARNING Dropped 1999 log records")
+
+
+def test_queued_block(log):
+    handler, target = queued(log=log, queue_size=1, block=True)
+    thread = threading.Thread(target=lambda: [log.warning(x) for x in "bcd"])
+    thread.start()
+    thread.join(0.05)
+    assert thread.is_alive()
+    target.gate.set()
+    thread.join()
+    handler.close()
+    assert handler.dropped == 0
+    assert target.lines == ["WARNING a", "WARNING b", "WARNING c", "WARNING d"]
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""Tests for tantrum.workflows."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import logging
+import threading
+
+from xml.sax.saxutils import escape
+
+import pytest
+import six
+import tantrum
+
+from tantrum import results
+from tantrum import utils
+from tantrum import workflows
+
+RESULT_XML = (
+    "<result_sets><result_set><id>1</id><row_count>{count}</row_count><cs>"
+    "<c><wh>1</wh><dn>Computer Name</dn><rt>1</rt></c>"
+    "<c><wh>2</wh><dn>Count</dn><rt>3</rt></c>"
+    "</cs><rs>{rows}</rs></result_set></result_sets>"
+)
+
+ROW_XML = "<r><id>{i}</id><cid>{i}</cid><c><v>host-{i}</v></c><c><v>{i}</v></c></r>"
+
+RESPONSE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+    '<soap:Body><t:return xmlns:t="urn:TaniumSOAP">'
+    "<command>GetResultData</command><session>1-2-abc</session>"
+    "<ResultXML>{xml}</ResultXML></t:return></soap:Body></soap:Envelope>"
+)
+
+
+class FakeAdapter(object):
+    """Adapter that answers cmd_get with pages of a cache of clients."""
+
+    def __init__(self, total, delay=0.0):
+        self.api_objects = tantrum.api_objects.load()
+        self.total = total
+        self.delay = delay
+        self.row_starts = []
+        self.inflight = 0
+        self.max_inflight = 0
+        self.lock = threading.Lock()
+
+    def cmd_get(self, obj, row_start, row_count, **kwargs):
+        with self.lock:
+            self.row_starts.append(row_start)
+            self.inflight += 1
+            self.max_inflight = max(self.max_inflight, self.inflight)
+        # time.sleep is patched by the tests
+        threading.Event().wait(self.delay)
+        with self.lock:
+            self.inflight -= 1
+
+        ids = range(row_start, min(row_start + row_count, self.total))
+        page = self.api_objects.SystemStatusList(
+            client_status=[{"computer_id": format(x)} for x in ids],
+            cache_info={"cache_id": 1, "filtered_row_count": self.total},
+        )
+        return FakeResult(value=page)
+
+
+class FakeResult(object):
+    """Result that returns value when called."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self):
+        return self.value
+
+    def pretty_bodies(self):
+        return ""
+
+
+def get_ids(**kwargs):
+    clients = workflows.Clients.get_all_iter(**kwargs)
+    return [int(x.computer_id) for x in clients]
+
+
+def test_get_all_iter_threaded_in_order(monkeypatch):
+    monkeypatch.setattr(workflows.time, "sleep", pytest.fail)
+    adapter = FakeAdapter(total=1050, delay=0.01)
+    ids = get_ids(adapter=adapter, page_size=100)
+    assert ids == list(range(1050))
+    assert sorted(adapter.row_starts) == list(range(0, 1050, 100))
+    assert 1 < adapter.max_inflight <= 4
+
+
+@pytest.mark.parametrize("workers", [0, 3])
+def test_get_all_iter_max_page_count(workers, monkeypatch):
+    monkeypatch.setattr(workflows.time, "sleep", lambda secs: None)
+    adapter = FakeAdapter(total=1050)
+    ids = get_ids(adapter=adapter, page_size=100, max_page_count=3, workers=workers)
+    assert ids == list(range(300))
+    assert len(adapter.row_starts) == 3
+
+
+def test_get_all_iter_sleep_without_workers(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(workflows.time, "sleep", sleeps.append)
+    adapter = FakeAdapter(total=250)
+    ids = get_ids(adapter=adapter, page_size=100, workers=0, sleep=3)
+    assert ids == list(range(250))
+    assert adapter.max_inflight == 1
+    assert sleeps == [3, 3]
+
+
+@pytest.mark.parametrize("workers", [0, 3])
+@pytest.mark.parametrize("lvl, expected", [("info", 0), ("debug", 2)])
+def test_get_all_iter_debug_page_bodies(workers, lvl, expected, monkeypatch):
+    monkeypatch.setattr(workflows.time, "sleep", lambda secs: None)
+    calls = []
+    monkeypatch.setattr(FakeResult, "pretty_bodies", lambda self: calls.append(self))
+    # LazyCall is only called when a handler formats the record
+    handler = logging.StreamHandler(six.StringIO())
+    utils.logs.LOG.addHandler(handler)
+    try:
+        ids = get_ids(
+            adapter=FakeAdapter(total=250), page_size=100, workers=workers, lvl=lvl
+        )
+    finally:
+        utils.logs.LOG.removeHandler(handler)
+    assert ids == list(range(250))
+    # every handler formats the record, so count the pages logged
+    assert len(set(id(x) for x in calls)) == expected
+
+
+class FakeDataAdapter(object):
+    """Adapter that answers cmd_get_result_data with pages of result data."""
+
+    def __init__(self, total):
+        self.api_objects = tantrum.api_objects.load()
+        self.total = total
+        self.row_starts = []
+        self.lock = threading.Lock()
+
+    def cmd_get_result_data(self, obj, row_start, row_count, **kwargs):
+        with self.lock:
+            self.row_starts.append(row_start)
+        ids = range(row_start, min(row_start + row_count, self.total))
+        xml = RESULT_XML.format(
+            count=self.total, rows="".join(ROW_XML.format(i=i) for i in ids)
+        )
+        return results.Soap(
+            api_objects=self.api_objects,
+            response_body=RESPONSE.format(xml=escape(xml)).encode("utf-8"),
+            request_body="",
+            method="post",
+            url="url",
+            status_code=200,
+            command="GetResultData",
+        )
+
+
+def only_7(values):
+    return values["Count"] == ["7"]
+
+
+def test_get_read_count_all_filtered():
+    adapter = FakeDataAdapter(total=3)
+    result = adapter.cmd_get_result_data(obj=None, row_start=0, row_count=3)
+    rows = result(predicate=only_7)[0].rows
+    assert len(rows or []) == 0
+    assert workflows.get_read_count(result=result, rows=rows) == 3
+
+    result = adapter.cmd_get_result_data(obj=None, row_start=0, row_count=3)
+    rows = result()[0].rows
+    assert workflows.get_read_count(result=result, rows=rows) == 3
+
+
+def question(adapter):
+    obj = adapter.api_objects.Question(id=1)
+    return workflows.Question(adapter=adapter, obj=obj)
+
+
+def test_answers_get_data_paged_filtered_pages(monkeypatch):
+    monkeypatch.setattr(workflows.time, "sleep", lambda secs: None)
+    adapter = FakeDataAdapter(total=10)
+    datas = question(adapter=adapter).answers_get_data_paged(
+        page_size=3, predicate=only_7
+    )
+    # pages 0-2 and 3-5 have no rows left, but paging goes on to row_count
+    assert adapter.row_starts == [0, 3, 6, 9]
+    assert [row.id for row in datas[0].rows] == [7]
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_answers_iter_pages_filtered_pages(prefetch):
+    adapter = FakeDataAdapter(total=10)
+    pages = question(adapter=adapter).answers_iter_pages(
+        page_size=3, predicate=only_7, prefetch=prefetch
+    )
+    assert [[row.id for row in page] for page in pages] == [[7]]
+    assert sorted(adapter.row_starts) == [0, 3, 6, 9]